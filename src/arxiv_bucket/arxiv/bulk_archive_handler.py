@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 import re
 from typing import Optional, Tuple, cast
 
@@ -27,6 +28,10 @@ from arxiv_bucket.services.hash_service import HashType
 
 from .submission_handler import SubmissionHandler
 
+# the filename pattern is compiled once, as it is matched for every file during registration
+_BULK_ARCHIVE_FILENAME_PATTERN = re.compile(r'^arXiv_src_(\d{2})(\d{2})_(\d{3})\.tar$')
+_VALID_MONTHS = frozenset(f'{month:02d}' for month in range(1, 13))
+
 
 class BulkArchiveHandler:
     """
@@ -34,9 +39,11 @@ class BulkArchiveHandler:
     """
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def parse_bulk_archive_filename(filename: str) -> Optional[Tuple[str, str, str]]:
         """
         Extract the year, month, and sequence number from a bulk archive filename.
+        The results are cached, as the same filenames are checked repeatedly during registration.
 
         Bulk archive filenames follow the format: arXiv_src_{yymm}_{seq_num}.tar
         - yy: last two digits of the year (e.g., '99' for 1999)
@@ -51,7 +58,7 @@ class BulkArchiveHandler:
         """
 
         basename = FileName.get_file_basename(filename)
-        match = re.match(r'^arXiv_src_(\d{2})(\d{2})_(\d{3})\.tar$', basename)
+        match = _BULK_ARCHIVE_FILENAME_PATTERN.match(basename)
         if match:
             result = cast(Tuple[str, str, str], match.groups())
         else:
@@ -74,8 +81,7 @@ class BulkArchiveHandler:
         parts = BulkArchiveHandler.parse_bulk_archive_filename(filename)
         if parts:
             _, mm, _ = parts
-            if mm.isdigit() and 1 <= int(mm) <= 12:
-                result = True
+            result = mm in _VALID_MONTHS
         return result
     
     @staticmethod
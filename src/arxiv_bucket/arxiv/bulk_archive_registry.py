@@ -12,9 +12,12 @@
 # - https://arxiv.org/help/license
 # - https://info.arxiv.org/help/bulk_data_s3.html
 
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional
+
 from arxiv_bucket.file.file_name import FileName
 from arxiv_bucket.file.file_system import FileSystem
-from arxiv_bucket.services.registry import Registry
+from arxiv_bucket.services.registry import DisabledMethod, Registry
 
 from .bulk_archive_handler import BulkArchiveHandler
 
@@ -23,33 +26,55 @@ class BulkArchiveRegistry(Registry):
     Registry for bulk archives.
     """
 
-    def add_entry(self, hash_key: str, entry: dict) -> None:
+    # entries are added only through 'register_bulk_archive'
+    add_entry = DisabledMethod('register_bulk_archive')
+    bulk_add_entries = DisabledMethod('register_bulk_archive')
+    update_entry = DisabledMethod('register_bulk_archive')
+
+    # error messages shared by register_bulk_archive and register_bulk_archives
+    _MSG_NOT_FOUND = "File '{}' not found."
+    _MSG_INVALID_FILENAME = "File '{}' is not a valid bulk archive filename."
+    _MSG_ALREADY_REGISTERED = "File '{}' is already registered."
+    _MSG_ERRORS = "Bulk archive '{}' has errors: {}"
+    _MSG_KEY_ALREADY_REGISTERED = "Bulk archive with key '{}' is already registered."
+
+    def __init__(self, file_path: Optional[str] = None) -> None:
         """
-        Prevent direct access to the base class 'add_entry' method.
+        Initializes the bulk archive registry.
 
-        This method is overridden to raise an AttributeError, ensuring that
-        entries are added to the registry only through the 'register_bulk_archive' method.
+        :param file_path: str, optional path of a registry file to load, default None.
+        """
 
-        :param hash_key: str, the unique key for the registry entry (not used here).
-        :param entry: dict, the registry entry data (not used here).
+        # index of bulk archive filename -> first registry key with that filename, built on demand
+        self._filename_index: dict[str, str] = dict()
+        self._filename_index_source: Optional[dict] = None
+        self._filename_index_version = -1
 
-        :raises AttributeError: Always raised to enforce the use of 'register_bulk_archive'.
+        super().__init__(file_path)
+
+    def _get_filename_index(self) -> dict[str, str]:
         """
-        raise AttributeError("Direct access to base class 'add_entry' is not allowed. Use 'register_bulk_archive' instead.")
+        Get the index of bulk archive filename to registry key.
+        If several entries have the same filename, the first registered key is indexed.
+        The index is rebuilt if the registry has been replaced or changed by a registry method since it was built.
 
-    def update_entry(self, hash_key: str, entry: dict) -> None:
+        :return: dict[str, str], bulk archive filename to registry key
         """
-        Prevent direct access to the base class 'update_entry' method.
 
-        This method is overridden to raise an AttributeError, ensuring that
-        entries are updated in the registry only through the 'register_bulk_archive' method.
+        if self._filename_index_source is not self._registry or self._filename_index_version != self._version:
+            # iterate newest first, so the first registered key of each filename is the one kept
+            no_metadata = dict()  # shared default, instead of building an empty dictionary for every entry
+            filename_index = {
+                entry.get('metadata', no_metadata).get('filename'): key
+                for key, entry in reversed(self._registry.items())
+            }
+            filename_index.pop(None, None)
 
-        :param hash_key: str, the unique key for the registry entry (not used here).
-        :param entry: dict, the registry entry data (not used here).
+            self._filename_index = filename_index
+            self._filename_index_source = self._registry
+            self._filename_index_version = self._version
 
-        :raises AttributeError: Always raised to enforce the use of 'register_bulk_archive'.
-        """
-        raise AttributeError("Direct access to base class 'update_entry' is not allowed. Use 'register_bulk_archive' instead.")
+        return self._filename_index
 
     def find_bulk_archive_filename(self, file_path: str) -> str | None:
         """
@@ -60,13 +85,7 @@ class BulkArchiveRegistry(Registry):
         """
 
         basename = FileName.get_file_basename(file_path)
-        registry_keys = [
-            key for key, entry in self._registry.items() 
-            if entry.get('metadata', {}).get('filename') == basename
-        ]
-
-        registry_key = registry_keys[0] if registry_keys else None
-        return registry_key
+        return self._get_filename_index().get(basename)
 
     def register_bulk_archive(self, file_path: str) -> None:
         """
@@ -80,24 +99,109 @@ class BulkArchiveRegistry(Registry):
         :raises KeyError: if the bulk archive is already registered
         """
 
-        if not FileSystem.is_file(file_path):
-            raise FileNotFoundError(f"File '{file_path}' not found.")
-        
-        if not BulkArchiveHandler.is_bulk_archive_filename(file_path):
-            raise ValueError(f"File '{file_path}' is not a valid bulk archive filename.")
-        
-        if self.find_bulk_archive_filename(file_path) is not None:
-            raise ValueError(f"File '{file_path}' is already registered.")
-
-        registry_key, registry_entry, bulk_archive_errors = BulkArchiveHandler.generate_registry_entry(file_path)
-                        
-        if len(bulk_archive_errors) > 0:
-            raise ValueError(f"Bulk archive '{file_path}' has errors: {bulk_archive_errors}")
-        
-        if self.is_key_present(registry_key):
-            if self.get_entry(registry_key) != registry_entry:
-                raise KeyError(f"Bulk archive with key '{registry_key}' is already registered.")
-            else:
-                return  # No action needed if the entry is identical
+        # the file is checked several times while the entry is generated, stat it only once
+        with FileSystem.stat_cache():
+            if not FileSystem.is_file(file_path):
+                raise FileNotFoundError(self._MSG_NOT_FOUND.format(file_path))
+
+            if not BulkArchiveHandler.is_bulk_archive_filename(file_path):
+                raise ValueError(self._MSG_INVALID_FILENAME.format(file_path))
+
+            if self.find_bulk_archive_filename(file_path) is not None:
+                raise ValueError(self._MSG_ALREADY_REGISTERED.format(file_path))
+
+            registry_key, registry_entry, bulk_archive_errors = BulkArchiveHandler.generate_registry_entry(file_path)
+
+            if len(bulk_archive_errors) > 0:
+                raise ValueError(self._MSG_ERRORS.format(file_path, bulk_archive_errors))
+
+            existing_entry = self._registry.get(registry_key)
+            if existing_entry is not None:
+                if existing_entry != registry_entry:
+                    raise KeyError(self._MSG_KEY_ALREADY_REGISTERED.format(registry_key))
+                else:
+                    return  # No action needed if the entry is identical
 
-        super().add_entry(registry_key, registry_entry)
+            # the entry was generated here, so it is stored without a copy
+            filename_index = self._get_filename_index()
+            self._insert_entry(registry_key, registry_entry)
+            filename_index.setdefault(registry_entry['metadata']['filename'], registry_key)
+            self._filename_index_version = self._version
+
+    def register_bulk_archives(self, file_path_list: Iterable[str], max_workers: Optional[int] = None) -> None:
+        """
+        Register several bulk archive files.
+        The bulk archives are registered together, if any of them cannot be registered then none are registered.
+        See register_bulk_archive() for the checks made on each file.
+
+        The registry entries are generated in a thread pool, as generating an entry reads and hashes the whole file,
+        which releases the GIL. Each entry is generated in its own FileSystem.stat_cache() context, as the cache
+        is local to the thread.
+
+        :param file_path_list: Iterable[str], the names of the bulk archive filenames
+        :param max_workers: int, optional maximum number of threads generating entries, default None.
+            If None, the ThreadPoolExecutor default is used. If 1, the entries are generated in the calling thread.
+
+        :raises FileNotFoundError: if a file does not exist
+        :raises ValueError: if a file is not a valid bulk archive filename
+        :raises ValueError: if a file is already registered or is listed more than once
+        :raises ValueError: if a bulk archive has errors
+        :raises KeyError: if a bulk archive is already registered with a different entry
+        """
+
+        # bind the methods called for every file once
+        is_file = FileSystem.is_file
+        is_bulk_archive_filename = BulkArchiveHandler.is_bulk_archive_filename
+        get_file_basename = FileName.get_file_basename
+        generate_registry_entry = BulkArchiveHandler.generate_registry_entry
+
+        file_path_list = list(file_path_list)
+
+        with FileSystem.stat_cache():
+            filename_index = self._get_filename_index()
+
+            # check all the files before generating any entry, generating an entry reads and hashes the file
+            batch_basenames = set()
+            for file_path in file_path_list:
+                if not is_file(file_path):
+                    raise FileNotFoundError(self._MSG_NOT_FOUND.format(file_path))
+
+                if not is_bulk_archive_filename(file_path):
+                    raise ValueError(self._MSG_INVALID_FILENAME.format(file_path))
+
+                basename = get_file_basename(file_path)
+                if basename in filename_index or basename in batch_basenames:
+                    raise ValueError(self._MSG_ALREADY_REGISTERED.format(file_path))
+                batch_basenames.add(basename)
+
+            def generate_registry_entry_cached(file_path: str) -> tuple:
+                # the stat cache is local to the thread, so each task opens its own context,
+                # the file is checked several times while its entry is generated
+                with FileSystem.stat_cache():
+                    return generate_registry_entry(file_path)
+
+            if max_workers == 1:
+                generated_entries = [generate_registry_entry_cached(file_path) for file_path in file_path_list]
+            else:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    generated_entries = list(executor.map(generate_registry_entry_cached, file_path_list))
+
+            # the registry is only updated from the calling thread, no lock is needed
+            new_entries = dict()
+            for file_path, (registry_key, registry_entry, bulk_archive_errors) in zip(file_path_list, generated_entries):
+                if len(bulk_archive_errors) > 0:
+                    raise ValueError(self._MSG_ERRORS.format(file_path, bulk_archive_errors))
+
+                existing_entry = self._registry.get(registry_key, new_entries.get(registry_key))
+                if existing_entry is not None:
+                    if existing_entry != registry_entry:
+                        raise KeyError(self._MSG_KEY_ALREADY_REGISTERED.format(registry_key))
+                    continue  # No action needed if the entry is identical
+
+                new_entries[registry_key] = registry_entry
+
+        self._registry.update(new_entries)
+        self._version += 1
+        for registry_key, registry_entry in new_entries.items():
+            filename_index.setdefault(registry_entry['metadata']['filename'], registry_key)
+        self._filename_index_version = self._version
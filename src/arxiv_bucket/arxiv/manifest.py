@@ -14,14 +14,19 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional
+import os
+from typing import Iterable, Optional, Union
+from matplotlib.figure import Figure
 import matplotlib.pyplot as plt
 import numpy as np
 from zoneinfo import ZoneInfo
 
 from arxiv_bucket.file.file_name import FileName
 from arxiv_bucket.file.file_system import FileSystem
+from arxiv_bucket.services.hash_service import HashService, HashType
 from arxiv_bucket.services.time_service import TimeService
 from arxiv_bucket.file.handler.xml_handler import XmlHandler
 
@@ -45,6 +50,15 @@ class Manifest:
         - 'contents': A dictionary with the keys as the bulk archive filename and value describing the bulk archive.
     """
 
+    _file_entry_keys = frozenset(('content_md5sum', 'filename', 'first_item', 'last_item', 'md5sum', 'num_items',
+                                  'seq_num', 'size', 'timestamp', 'yymm'))
+
+    _eastern_timezone = ZoneInfo('America/New_York')
+    _utc_timezone = ZoneInfo('UTC')
+    _weekday_names = frozenset(('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'))
+    _month_numbers = {'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+                      'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12}
+
     def __init__(self, arxiv_xml_file: Optional[str] = None) -> None:
         """
         Initializes a new instance of the Manifest class.
@@ -58,6 +72,27 @@ class Manifest:
         """
 
         self._manifest = dict()
+
+        # incremented whenever the manifest methods change the contents, so derived lookups know when to rebuild
+        self._contents_version = 0
+
+        # keys of the entries, built on demand
+        self._keys: frozenset[str] = frozenset()
+        self._keys_source: Optional[dict] = None
+        self._keys_version = -1
+
+        # basenames of the entry filenames, built on demand
+        self._filenames: list[str] = list()
+        self._filenames_source: Optional[dict] = None
+        self._filenames_version = -1
+
+        # entry positions by (year, month), the entry keys by position and the entry months, built on demand
+        self._date_index: dict[tuple, list[int]] = dict()
+        self._date_index_keys: list[str] = list()
+        self._date_index_months: Optional[np.ndarray] = None
+        self._date_index_source: Optional[dict] = None
+        self._date_index_version = -1
+
         self._set_defaults()
 
         if arxiv_xml_file:
@@ -86,29 +121,48 @@ class Manifest:
             'metadata': {},
             'contents': dict()
         }
+        self._contents_version += 1
 
-    def list_keys(self) -> set[str]:
+    def list_keys(self) -> frozenset[str]:
         """
         Return a list of all keys in the manifest.
         The manifest uses the bulk archive base filenames as keys.
 
-        :return: set[str], set of keys in the manifest.
+        The keys are cached and rebuilt when the contents have been replaced or changed by the manifest methods,
+        the frozenset is shared between calls.
+
+        :return: frozenset[str], set of keys in the manifest.
         """
 
-        return set(self._manifest['contents'].keys())
+        contents = self._manifest['contents']
+        if self._keys_source is not contents or self._keys_version != self._contents_version:
+            self._keys = frozenset(contents)
+            self._keys_source = contents
+            self._keys_version = self._contents_version
+
+        return self._keys
 
     def list_filenames(self) -> list[str]:
         """
         List all filenames in the manifest.
 
+        The basenames are cached and rebuilt when the contents have been replaced or changed by the manifest methods.
+
         :return: list of the filenames. Only basenames are returned.
         """
 
-        return [FileName.get_file_basename(entry['filename']) for entry in self._manifest['contents'].values()]
+        contents = self._manifest['contents']
+        if self._filenames_source is not contents or self._filenames_version != self._contents_version:
+            self._filenames = [FileName.get_file_basename(entry['filename']) for entry in contents.values()]
+            self._filenames_source = contents
+            self._filenames_version = self._contents_version
+
+        return list(self._filenames)
     
-    def __len__(self):
+    def __len__(self) -> int:
         """
         Return the number of entries in the manifest.
+        This is the size of the contents dictionary, no keys are materialized.
         """
         return len(self._manifest['contents'])
     
@@ -151,11 +205,11 @@ class Manifest:
         iso_timestamp1 = self._manifest['metadata']['manifest_timestamp_iso']
         iso_timestamp2 = other_manifest._manifest['metadata']['manifest_timestamp_iso']
 
-        current_keys = self.list_keys()
-        other_keys = other_manifest.list_keys()
-        common_keys = current_keys & other_keys
-        files_in_current_but_not_in_other = current_keys - common_keys
-        files_in_other_but_not_in_current = other_keys - common_keys
+        # set algebra directly on the key views, without copying the keys into sets first
+        current_keys = self._manifest['contents'].keys()
+        other_keys = other_manifest._manifest['contents'].keys()
+        files_in_current_but_not_in_other = current_keys - other_keys
+        files_in_other_but_not_in_current = other_keys - current_keys
 
         if iso_timestamp1 == iso_timestamp2:
             is_timestamp_newer = False
@@ -196,9 +250,7 @@ class Manifest:
         if not self.is_newer_than(reference_manifest):
             raise ValueError('Reference manifest must be older than the current manifest')
 
-        current_keys = self.list_keys()
-        reference_keys = reference_manifest.list_keys()
-        new_keys = current_keys - reference_keys
+        new_keys = self._manifest['contents'].keys() - reference_manifest._manifest['contents'].keys()
         return new_keys
 
     def find_updated_entries(self, reference_manifest: Manifest) -> set[str]:
@@ -216,12 +268,11 @@ class Manifest:
         if not self.is_newer_than(reference_manifest):
             raise ValueError('Reference manifest must be older than the current manifest')
 
-        current_keys = self.list_keys()
-        reference_keys = reference_manifest.list_keys()
-        common_keys = current_keys & reference_keys
-        updated_keys = {key for key in common_keys if
-                        self._manifest['contents'][key]['hash']['MD5'] !=
-                        reference_manifest._manifest['contents'][key]['hash']['MD5']}
+        current_contents = self._manifest['contents']
+        reference_contents = reference_manifest._manifest['contents']
+        updated_keys = {key for key, entry in current_contents.items() if
+                        (reference_entry := reference_contents.get(key)) is not None
+                        and entry['hash']['MD5'] != reference_entry['hash']['MD5']}
         return updated_keys
 
     def import_arxiv_xml(self, file_path: str) -> None:
@@ -245,22 +296,55 @@ class Manifest:
         if not XmlHandler.is_xml_format(file_path):
             raise TypeError('file is not in XML format.')
 
-        xml_dict = XmlHandler.read_xml_to_dict(file_path)
+        # stream the file entries instead of building a dictionary of the whole file,
+        # the manifest is left empty if the import fails part way through
+        try:
+            self._import_xml_children(XmlHandler.iter_xml_children(file_path, 'arXivSRC'))
+        except TypeError as e:
+            # the root element is not arXivSRC or its children are not the expected entries
+            self.clear()
+            raise TypeError('Entries missing in arXiv XML file') from e
+        except (ValueError, KeyError):
+            self.clear()
+            raise
 
-        if not Manifest._is_arxiv_keys_present(xml_dict):
-            raise TypeError('Entries missing in arXiv XML file')
+    def _import_xml_children(self, children: Iterable[tuple[str, Union[Optional[str], dict]]]) -> None:
+        """
+        Add the children of the arXivSRC element of an arXiv XML file to the manifest, one at a time.
+
+        :param children: Iterable[tuple[str, Union[Optional[str], dict]]], (tag, value) of each child.
+            There must be exactly one 'timestamp' child with a string value and at least one 'file' child
+            with a dictionary value that has the expected keys and string values.
 
-        self._manifest['metadata']['manifest_timestamp_iso'] = (
-            Manifest._convert_arxiv_timestamp_to_iso(xml_dict['arXivSRC']['timestamp']))
+        :raises TypeError: If entries are missing or unexpected.
+        :raises ValueError: If a file entry is inconsistent.
+        :raises KeyError: If the bulk archive base filenames are not unique and cannot be used as keys.
+        """
 
-        for file_entry in xml_dict['arXivSRC']['file']:
-            entry = Manifest._process_file_entry(file_entry)
-            filename = entry['filename']
-            base_filename = FileName.get_file_basename(filename)
-            if base_filename not in self._manifest['contents']:
-                self._manifest['contents'][base_filename] = entry
+        contents = self._manifest['contents']
+        timestamp = None
+        n_file_entries = 0
+
+        # the contents change as the children are added
+        self._contents_version += 1
+
+        for tag, value in children:
+            if tag == 'file' and Manifest._is_file_entry_keys_present(value):
+                entry = Manifest._process_file_entry(value)
+                base_filename = FileName.get_file_basename(entry['filename'])
+                # a single hash lookup inserts the entry, or returns the earlier entry for a duplicate base filename
+                if contents.setdefault(base_filename, entry) is not entry:
+                    raise KeyError('Bulk archive base filenames not unique and cannot be used for keys')
+                n_file_entries += 1
+            elif tag == 'timestamp' and isinstance(value, str) and timestamp is None:
+                timestamp = value
             else:
-                raise KeyError('Bulk archive base filenames not unique and cannot be used for keys')
+                raise TypeError('Entries missing in arXiv XML file')
+
+        if timestamp is None or n_file_entries == 0:
+            raise TypeError('Entries missing in arXiv XML file')
+
+        self._manifest['metadata']['manifest_timestamp_iso'] = Manifest._convert_arxiv_timestamp_to_iso(timestamp)
 
     @staticmethod
     def _process_file_entry(file_entry: dict) -> dict:
@@ -276,13 +360,14 @@ class Manifest:
         if not Manifest._is_file_entry_consistent(file_entry):
             raise ValueError('Entry inconsistent')
 
+        yymm = file_entry['yymm']
+        two_digit_year = int(yymm[:2])
         local_dict = {
             'filename': file_entry['filename'],
             'size_bytes': int(file_entry['size']),
             'timestamp_iso': Manifest._convert_arxiv_file_entry_timestamp_to_iso(file_entry['timestamp']),
-            'year': int(
-                f"19{file_entry['yymm'][:2]}" if int(file_entry['yymm'][:2]) > 90 else f"20{file_entry['yymm'][:2]}"),
-            'month': int(file_entry['yymm'][2:]),
+            'year': (1900 if two_digit_year > 90 else 2000) + two_digit_year,
+            'month': int(yymm[2:]),
             'sequence_number': int(file_entry['seq_num']),
             'n_submissions': int(file_entry['num_items']),
             'hash': {
@@ -322,22 +407,31 @@ class Manifest:
 
         expected_top_level_keys = {'arXivSRC'}
         expected_src_keys = {'file', 'timestamp'}
-        expected_file_keys = {'content_md5sum', 'filename', 'first_item', 'last_item', 'md5sum', 'num_items', 'seq_num',
-                              'size', 'timestamp', 'yymm'}
-        
+
         is_valid = False
 
         if set(xml_dict.keys()) == expected_top_level_keys:
             if set(xml_dict['arXivSRC'].keys()) == expected_src_keys:
                 if (isinstance(xml_dict['arXivSRC']['timestamp'], str)
                         and isinstance(xml_dict['arXivSRC']['file'], list)):
-                    is_valid = all([set(entry.keys()) == expected_file_keys for entry in xml_dict['arXivSRC']['file']])
-                    if is_valid:
-                        is_valid = all([isinstance(value, str) for entry in xml_dict['arXivSRC']['file']
-                                        for _, value in entry.items()])
+                    is_valid = all(Manifest._is_file_entry_keys_present(entry)
+                                   for entry in xml_dict['arXivSRC']['file'])
 
         return is_valid
 
+    @staticmethod
+    def _is_file_entry_keys_present(file_entry) -> bool:
+        """
+        Determine if an entry in the 'file' list of the arXiv manifest XML dictionary has all required keys.
+        See _is_arxiv_keys_present for the required keys, each key must have a string value.
+
+        :param file_entry: entry in the 'file' list of the arXiv manifest XML dictionary.
+        :return: bool, True if valid, False otherwise.
+        """
+
+        return (isinstance(file_entry, dict) and file_entry.keys() == Manifest._file_entry_keys
+                and all(isinstance(value, str) for value in file_entry.values()))
+
     @staticmethod
     def _convert_arxiv_timestamp_to_iso(timestamp: str) -> str:
         """
@@ -350,11 +444,18 @@ class Manifest:
             The output format is for example '2025-04-07T08:58:03+00:00'
         """
 
-        eastern = ZoneInfo('America/New_York')
-        original_time_format = '%a %b %d %H:%M:%S %Y'
-        datetime_original = datetime.strptime(timestamp, original_time_format)
-        datetime_est = datetime_original.replace(tzinfo=eastern)
-        datetime_gmt = datetime_est.astimezone(ZoneInfo('UTC'))
+        # fixed format '%a %b %d %H:%M:%S %Y', parsed by hand since strptime is slow
+        parts = timestamp.split()
+        if (len(parts) != 5 or parts[0] not in Manifest._weekday_names or parts[1] not in Manifest._month_numbers
+                or not Manifest._is_ascii_digits(parts[2]) or not Manifest._is_hh_mm_ss(parts[3])
+                or not Manifest._is_ascii_digits(parts[4])):
+            raise ValueError(f"time data '{timestamp}' does not match format '%a %b %d %H:%M:%S %Y'")
+
+        time_of_day = parts[3]
+        datetime_est = datetime(int(parts[4]), Manifest._month_numbers[parts[1]], int(parts[2]),
+                                int(time_of_day[0:2]), int(time_of_day[3:5]), int(time_of_day[6:8]),
+                                tzinfo=Manifest._eastern_timezone)
+        datetime_gmt = datetime_est.astimezone(Manifest._utc_timezone)
 
         return datetime_gmt.isoformat()
 
@@ -370,14 +471,47 @@ class Manifest:
             The output format is for example '2025-04-07T08:58:03+00:00'
         """
 
-        eastern = ZoneInfo('America/New_York')
-        original_time_format = '%Y-%m-%d %H:%M:%S'
-        datetime_original = datetime.strptime(timestamp, original_time_format)
-        datetime_est = datetime_original.replace(tzinfo=eastern)
-        datetime_gmt = datetime_est.astimezone(ZoneInfo('UTC'))
+        # fixed format '%Y-%m-%d %H:%M:%S', parsed by hand since strptime is slow
+        if (len(timestamp) != 19 or timestamp[4] != '-' or timestamp[7] != '-' or timestamp[10] != ' '
+                or not Manifest._is_ascii_digits(timestamp[0:4]) or not Manifest._is_ascii_digits(timestamp[5:7])
+                or not Manifest._is_ascii_digits(timestamp[8:10]) or not Manifest._is_hh_mm_ss(timestamp[11:])):
+            raise ValueError(f"time data '{timestamp}' does not match format '%Y-%m-%d %H:%M:%S'")
+
+        datetime_est = datetime(int(timestamp[0:4]), int(timestamp[5:7]), int(timestamp[8:10]),
+                                int(timestamp[11:13]), int(timestamp[14:16]), int(timestamp[17:19]),
+                                tzinfo=Manifest._eastern_timezone)
+        datetime_gmt = datetime_est.astimezone(Manifest._utc_timezone)
 
         return datetime_gmt.isoformat()
 
+    @staticmethod
+    def _is_hh_mm_ss(time_of_day: str) -> bool:
+        """
+        Determine if a time of day has the layout 'HH:MM:SS'.
+
+        :param time_of_day: str, time of day.
+        :return: bool, True if the fields are ASCII digits and the separators are in place, False otherwise.
+            The ranges are checked when the fields are converted to a datetime.
+        """
+
+        return (len(time_of_day) == 8 and time_of_day[2] == ':' and time_of_day[5] == ':'
+                and Manifest._is_ascii_digits(time_of_day[0:2]) and Manifest._is_ascii_digits(time_of_day[3:5])
+                and Manifest._is_ascii_digits(time_of_day[6:8]))
+
+    @staticmethod
+    def _is_ascii_digits(field: str) -> bool:
+        """
+        Determine if a numeric timestamp field consists only of ASCII digits.
+
+        int() also accepts signs, surrounding whitespace and non-ASCII digits, so fields are checked
+        before they are converted.
+
+        :param field: str, numeric field of a timestamp.
+        :return: bool, True if the field is non-empty and only ASCII digits, False otherwise.
+        """
+
+        return field.isascii() and field.isdigit()
+
     @staticmethod
     def _is_file_entry_consistent(file_entry: dict) -> bool:
         """
@@ -391,22 +525,11 @@ class Manifest:
         :return: bool, True if consistent, False otherwise.
         """
 
-        is_consistent = True
-
-        seq_num = int(file_entry['seq_num'])
         yymm = file_entry['yymm']
-        entry_filename = file_entry['filename']
-        generated_filename = f"src/arXiv_src_{yymm}_{seq_num:03d}.tar"  # consistency check
-
-        if entry_filename != generated_filename:
-            is_consistent = False
-
-        month = int(file_entry['yymm'][2:])
+        generated_filename = f"src/arXiv_src_{yymm}_{int(file_entry['seq_num']):03d}.tar"  # consistency check
+        month = int(yymm[2:])
 
-        if month <= 0 or month > 12:
-            is_consistent = False
-
-        return is_consistent
+        return file_entry['filename'] == generated_filename and 0 < month <= 12
 
     def get_statistics(self) -> dict:
         """
@@ -417,17 +540,18 @@ class Manifest:
             The dictionary value is also a dictionary with the keys 'size_bytes' and 'n_submissions'.
         """
 
-        statistics = dict()
-        for key, entry in self._manifest['contents'].items():
-            key = (entry['year'], entry['month'])
-            if key not in statistics:
-                statistics[key] = {'size_bytes': 0, 'n_submissions': 0}
-            statistics[key]['size_bytes'] += entry['size_bytes']
-            statistics[key]['n_submissions'] += entry['n_submissions']
+        # accumulate [size_bytes, n_submissions] per (year, month) with a single lookup per entry,
+        # the cost is dominated by reading the entry dictionaries, so array based aggregation does not pay off
+        totals = defaultdict(lambda: [0, 0])
+        for entry in self._manifest['contents'].values():
+            total = totals[(entry['year'], entry['month'])]
+            total[0] += entry['size_bytes']
+            total[1] += entry['n_submissions']
 
-        return statistics
+        return {key: {'size_bytes': size_bytes, 'n_submissions': n_submissions}
+                for key, (size_bytes, n_submissions) in totals.items()}
 
-    def plot_summary_statistics(self) -> None:
+    def plot_summary_statistics(self, figs: Optional[list[Figure]] = None) -> None:
         """
         Plot summary statistics of the manifest.
 
@@ -435,8 +559,16 @@ class Manifest:
             - the number of submissions per month
             - size of all submissions per month in GB
             - average submission size in MB
+
+        :param figs: Optional[list[Figure]], three figures to draw the plots into, in the order above.
+            The figures are cleared before drawing. If None, new figures are created.
+
+        :raises ValueError: If figs is given and does not hold exactly three figures.
         """
 
+        if figs is not None and len(figs) != 3:
+            raise ValueError(f'Expected 3 figures, got {len(figs)}')
+
         statistics = self.get_statistics()
         if not statistics:
             # no statistics to plot
@@ -446,37 +578,31 @@ class Manifest:
         n_submissions = np.array([entry['n_submissions'] for entry in statistics.values()], dtype=float)
         size_bytes = np.array([entry['size_bytes'] for entry in statistics.values()], dtype=float)
 
-        plt.figure(figsize=(10, 5))
-        plt.plot(dates, n_submissions, '.', label='n_submissions')
-        plt.gcf().autofmt_xdate()
-        plt.xlabel('Date (Year-Month)')
-        plt.ylabel('Number of Submissions')
-        plt.title('Number of Submissions per Month')
-        plt.grid(True)
-        plt.show()
-
-        plt.figure(figsize=(10, 5))
-        plt.plot(dates, 1.0e-9 * size_bytes, '.', color='orange', label='size_bytes')
-        plt.gcf().autofmt_xdate()
-        plt.xlabel('Date (Year-Month)')
-        plt.ylabel('Size (GB)')
-        plt.title('Size in GB per Month')
-        plt.grid(True)
-        plt.show()
-
         # Avoid division by zero for average submission size
         avg_submission_size_mb = np.zeros_like(size_bytes)
         nonzero_mask = n_submissions != 0
         avg_submission_size_mb[nonzero_mask] = 1.0e-6 * (size_bytes[nonzero_mask] / n_submissions[nonzero_mask])
 
-        plt.figure(figsize=(10, 5))
-        plt.plot(dates, avg_submission_size_mb, '.', color='green', label='avg_submission_size_mb')
-        plt.gcf().autofmt_xdate()
-        plt.xlabel('Date (Year-Month)')
-        plt.ylabel('Average Submission Size (MB)')
-        plt.title('Averaged Monthly Submission Size in MB')
-        plt.grid(True)
-        plt.show()
+        plots = (
+            (n_submissions, None, 'n_submissions', 'Number of Submissions', 'Number of Submissions per Month'),
+            (1.0e-9 * size_bytes, 'orange', 'size_bytes', 'Size (GB)', 'Size in GB per Month'),
+            (avg_submission_size_mb, 'green', 'avg_submission_size_mb', 'Average Submission Size (MB)',
+             'Averaged Monthly Submission Size in MB'),
+        )
+
+        if figs is None:
+            figs = [plt.figure(figsize=(10, 5)) for _ in plots]
+
+        for fig, (values, color, label, ylabel, title) in zip(figs, plots):
+            fig.clear()
+            ax = fig.add_subplot()
+            ax.plot(dates, values, '.', color=color, label=label)
+            fig.autofmt_xdate()
+            ax.set_xlabel('Date (Year-Month)')
+            ax.set_ylabel(ylabel)
+            ax.set_title(title)
+            ax.grid(True)
+            plt.show()
 
     def list_entries_by_date(self, year: int, month: int, is_from_date_onwards: bool=False) -> list[dict]:
         """
@@ -491,20 +617,50 @@ class Manifest:
         :return: list of entry dicts for the given year and month
         """
 
+        date_index = self._get_date_index()
+
         if is_from_date_onwards:
-            results = [
-                key
-                for key, value in self._manifest['contents'].items()
-                if (value.get('year'), value.get('month')) >= (year, month)
-            ]
+            if self._date_index_months is None:
+                # months since year 0 for each entry, in the order of the entries in the manifest
+                months = np.empty(len(self._date_index_keys), dtype=np.int32)
+                for (entry_year, entry_month), entry_positions in date_index.items():
+                    months[entry_positions] = entry_year * 12 + entry_month - 1
+                self._date_index_months = months
+            positions = np.flatnonzero(self._date_index_months >= year * 12 + month - 1).tolist()
         else:
-            results = [key for key, value in self._manifest['contents'].items() if (value.get('year'), value.get('month')) == (year, month)]
-        return results
+            positions = date_index.get((year, month), [])
+
+        keys = self._date_index_keys
+        return [keys[position] for position in positions]
+
+    def _get_date_index(self) -> dict[tuple, list[int]]:
+        """
+        Get the index of the manifest entries by (year, month).
+        The index is rebuilt when the contents have been replaced or changed by the manifest methods.
+
+        :return: dict, (year, month) tuple to the ascending positions of the entries in the manifest contents.
+        """
+
+        contents = self._manifest['contents']
+        if self._date_index_source is not contents or self._date_index_version != self._contents_version:
+            date_index = defaultdict(list)
+            for position, value in enumerate(contents.values()):
+                date_index[(value.get('year'), value.get('month'))].append(position)
+            self._date_index = dict(date_index)
+            self._date_index_keys = list(contents)
+            self._date_index_months = None
+            self._date_index_source = contents
+            self._date_index_version = self._contents_version
+
+        return self._date_index
 
     def find_bulk_archive_files_not_in_manifest(self, directory_path: str) -> list[str]:
         """
         Find all bulk archive files in the specified directory that are not listed in the manifest.
 
+        The directory listing is cached within a FileSystem.stat_cache() context, so back-to-back directory
+        queries inside one context, e.g. with find_keys_without_local_files, scan the directory only once.
+
         :param directory_path: str, path to the directory containing bulk archive files.
         :return: list[str], list of filenames that are not in the manifest.
 
@@ -514,11 +670,15 @@ class Manifest:
         if not FileSystem.is_directory(directory_path):
             raise FileNotFoundError(f"Directory not found: {directory_path}")
 
-        all_files = FileSystem.list_files(directory_path, include_subdirectories=False)
-        bulk_archive_files = [f for f in all_files if BulkArchiveHandler.is_bulk_archive_filename(f)]
+        with FileSystem.stat_cache():
+            all_files = FileSystem.list_files(directory_path, include_subdirectories=False)
+        manifest_filenames = set(self.list_filenames())
 
-        manifest_filenames = self.list_filenames()
-        missing_bulk_archive_files = [f for f in bulk_archive_files if f not in manifest_filenames]
+        # most local archives are listed in the manifest, the set lookup rules those out before the filename match
+        is_bulk_archive_filename = BulkArchiveHandler.is_bulk_archive_filename
+        missing_bulk_archive_files = [
+            f for f in all_files if f not in manifest_filenames and is_bulk_archive_filename(f)
+        ]
 
         return missing_bulk_archive_files
 
@@ -526,6 +686,9 @@ class Manifest:
         """
         Find all keys from the specified list in the manifest that do not have corresponding local files.
 
+        The directory listing is cached within a FileSystem.stat_cache() context, so back-to-back directory
+        queries inside one context, e.g. with find_bulk_archive_files_not_in_manifest, scan the directory only once.
+
         :param directory_path: str, path to the directory containing local files.
         :return: list[str], list of keys without local files.
 
@@ -535,18 +698,66 @@ class Manifest:
         if not FileSystem.is_directory(directory_path):
             raise FileNotFoundError(f"Directory not found: {directory_path}")
 
-        local_files = FileSystem.list_files(directory_path, include_subdirectories=False)
-        local_file_set = set(local_files)
+        with FileSystem.stat_cache():
+            local_file_set = set(FileSystem.list_files(directory_path, include_subdirectories=False))
 
+        contents = self._manifest['contents']
+        get_file_basename = FileName.get_file_basename
         missing_keys = [
             key for key in key_list
             if (
-                (entry := self._manifest['contents'].get(key)) is not None
-                and FileName.get_file_basename(entry.get('filename')) not in local_file_set
+                (entry := contents.get(key)) is not None
+                and get_file_basename(entry.get('filename')) not in local_file_set
             )
         ]
         return missing_keys
 
+    def verify_files(self, directory_path: str, key_list: Iterable[str],
+                     max_workers: Optional[int] = None) -> dict[str, bool]:
+        """
+        Verify the MD5 hashes of the local bulk archive files for the specified keys against the manifest.
+
+        The files are hashed in a thread pool, as hashing reads the whole file and releases the GIL.
+
+        :param directory_path: str, path to the directory containing local files.
+        :param key_list: Iterable[str], the keys of the manifest entries to verify.
+        :param max_workers: int, optional maximum number of threads hashing files, default None.
+            If None, the ThreadPoolExecutor default is used. If 1, the files are hashed in the calling thread.
+        :return: dict[str, bool], key to True if the local file matches the manifest MD5 hash,
+            False if it differs or the local file does not exist.
+
+        :raises FileNotFoundError: if the directory does not exist.
+        :raises KeyError: if a key is not found in the manifest.
+        """
+
+        if not FileSystem.is_directory(directory_path):
+            raise FileNotFoundError(f"Directory not found: {directory_path}")
+
+        contents = self._manifest['contents']
+        get_file_basename = FileName.get_file_basename
+
+        # resolve all the keys before hashing any file
+        file_paths = dict()
+        for key in key_list:
+            if key not in contents:
+                raise KeyError(f"Key '{key}' not found in the manifest.")
+            file_paths[key] = os.path.join(directory_path, get_file_basename(contents[key]['filename']))
+
+        def is_file_verified(key: str) -> bool:
+            file_path = file_paths[key]
+            if not FileSystem.is_file(file_path):
+                return False
+            md5_hash = HashService.calculate_file_hash(file_path, HashType.HASH_TYPE_MD5)
+            return md5_hash == contents[key]['hash']['MD5']
+
+        if max_workers == 1:
+            results = [is_file_verified(key) for key in file_paths]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(is_file_verified, file_paths))
+
+        return dict(zip(file_paths, results))
+
     def get_bulk_archive_filename(self, key: str) -> str | None:
         """
         Get the bulk archive base filename associated with a specific key in the manifest.
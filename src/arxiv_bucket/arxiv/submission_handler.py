@@ -26,6 +26,32 @@ from arxiv_bucket.services.hash_service import HashType
 
 from .submission_type import SubmissionType
 
+# basename patterns of the submission filenames without the extension, compiled once at import
+_OLD_STYLE_SUBMISSION_PATTERN = re.compile(r'^([a-z\-]+)(\d{2})(\d{2})(\d{3})$')
+_CURRENT_STYLE_SUBMISSION_PATTERN = re.compile(r'^(\d{2})(\d{2})\.(\d{4,5})$')
+_SUBMISSION_EXTENSIONS = frozenset({'.gz', '.pdf'})
+
+# file type groups used to classify and check submissions, built once at import
+_POSTSCRIPT_FILE_TYPES = frozenset({FileType.FILE_TYPE_POSTSCRIPT_PS})
+_PDF_FILE_TYPES = frozenset({FileType.FILE_TYPE_PDF})
+_TEX_MAIN_FILE_TYPES = frozenset({FileType.FILE_TYPE_TEX_TEX, FileType.FILE_TYPE_TEX_LATEX_209_MAIN,
+                                  FileType.FILE_TYPE_TEX_LATEX_2E_MAIN})
+_TEX_SUPPORTING_FILE_TYPES = frozenset({
+    FileType.FILE_TYPE_TEX_LOG, FileType.FILE_TYPE_TEX_FIG, FileType.FILE_TYPE_IMAGE_GIF,
+    FileType.FILE_TYPE_IMAGE_PNG, FileType.FILE_TYPE_IMAGE_JPG, FileType.FILE_TYPE_TEX_BIB,
+    FileType.FILE_TYPE_TEX_CLO, FileType.FILE_TYPE_TEX_BST, FileType.FILE_TYPE_TEX_TOC,
+    FileType.FILE_TYPE_TEX_CLS, FileType.FILE_TYPE_TEX_BBL, FileType.FILE_TYPE_POSTSCRIPT_EPSF,
+    FileType.FILE_TYPE_TEX_PSTEX_T, FileType.FILE_TYPE_TEX_PSTEX, FileType.FILE_TYPE_TEX_STY,
+    FileType.FILE_TYPE_TEX_LATEX_209_MAIN, FileType.FILE_TYPE_TEX_LATEX_2E_MAIN,
+    FileType.FILE_TYPE_TEX_TEX, FileType.FILE_TYPE_PDF, FileType.FILE_TYPE_POSTSCRIPT_PS,
+    FileType.FILE_TYPE_POSTSCRIPT_EPSI, FileType.FILE_TYPE_POSTSCRIPT_EPS})
+_ALLOWED_ARCHIVE_FILE_TYPES = frozenset({FileType.FILE_TYPE_ARCHIVE_GZ, FileType.FILE_TYPE_ARCHIVE_TGZ})
+_ALLOWED_FILE_TYPES = _ALLOWED_ARCHIVE_FILE_TYPES | _PDF_FILE_TYPES
+
+# the metadata stores the file type values
+_PDF_FILE_TYPE_VALUE = FileType.FILE_TYPE_PDF.value
+_ALLOWED_ARCHIVE_FILE_TYPE_VALUES = frozenset(file_type.value for file_type in _ALLOWED_ARCHIVE_FILE_TYPES)
+
 
 class SubmissionHandler:
     """
@@ -50,17 +76,6 @@ class SubmissionHandler:
         :return: SubmissionType, matching submission type category
         """
 
-        tex_types = {FileType.FILE_TYPE_TEX_TEX, FileType.FILE_TYPE_TEX_LATEX_209_MAIN,
-                     FileType.FILE_TYPE_TEX_LATEX_2E_MAIN}
-        tex_supporting_types = {FileType.FILE_TYPE_TEX_LOG, FileType.FILE_TYPE_TEX_FIG, FileType.FILE_TYPE_IMAGE_GIF,
-                                FileType.FILE_TYPE_IMAGE_PNG, FileType.FILE_TYPE_IMAGE_JPG, FileType.FILE_TYPE_TEX_BIB,
-                                FileType.FILE_TYPE_TEX_CLO, FileType.FILE_TYPE_TEX_BST, FileType.FILE_TYPE_TEX_TOC,
-                                FileType.FILE_TYPE_TEX_CLS, FileType.FILE_TYPE_TEX_BBL, FileType.FILE_TYPE_POSTSCRIPT_EPSF,
-                                FileType.FILE_TYPE_TEX_PSTEX_T, FileType.FILE_TYPE_TEX_PSTEX, FileType.FILE_TYPE_TEX_STY,
-                                FileType.FILE_TYPE_TEX_LATEX_209_MAIN, FileType.FILE_TYPE_TEX_LATEX_2E_MAIN,
-                                FileType.FILE_TYPE_TEX_TEX, FileType.FILE_TYPE_PDF, FileType.FILE_TYPE_POSTSCRIPT_PS,
-                                FileType.FILE_TYPE_POSTSCRIPT_EPSI, FileType.FILE_TYPE_POSTSCRIPT_EPS}
-
         file_types = []
         for filename in submission_file_list:
             current_file_type_list = FileHandler.get_file_type_from_extension(filename)
@@ -70,15 +85,15 @@ class SubmissionHandler:
                 file_types.extend(current_file_type_list)
         file_types = set(file_types)
 
-        if {FileType.FILE_TYPE_POSTSCRIPT_PS} == file_types:
+        if _POSTSCRIPT_FILE_TYPES == file_types:
             # postscript submission type
             submission_type = SubmissionType.SUBMISSION_TYPE_POSTSCRIPT
-        elif {FileType.FILE_TYPE_PDF} == file_types:
+        elif _PDF_FILE_TYPES == file_types:
             # pdf submission type
             submission_type = SubmissionType.SUBMISSION_TYPE_PDF
-        elif len(tex_types & file_types) > 0:
+        elif len(_TEX_MAIN_FILE_TYPES & file_types) > 0:
             # potential TeX or LaTeX submission type
-            residual = file_types - tex_supporting_types
+            residual = file_types - _TEX_SUPPORTING_FILE_TYPES
             if len(residual) == 0:
                 # all file types are TeX / LaTeX associated
                 submission_type = SubmissionType.SUBMISSION_TYPE_TEX
@@ -120,10 +135,10 @@ class SubmissionHandler:
         if len(submission_errors) > 0:
             submission_type = SubmissionType.SUBMISSION_TYPE_UNKNOWN
         else:
-            if metadata['file_type'] in [FileType.FILE_TYPE_PDF.value]:
+            if metadata['file_type'] == _PDF_FILE_TYPE_VALUE:
                 submission_type = SubmissionType.SUBMISSION_TYPE_PDF
             else:
-                if metadata['file_type'] in [FileType.FILE_TYPE_ARCHIVE_GZ.value, FileType.FILE_TYPE_ARCHIVE_TGZ.value]:
+                if metadata['file_type'] in _ALLOWED_ARCHIVE_FILE_TYPE_VALUES:
                     archive_contents = ArchiveHandler.list_contents(file_path)
                     submission_type = SubmissionHandler.get_submission_type_using_extension(archive_contents)
                 else:
@@ -169,8 +184,8 @@ class SubmissionHandler:
         basename = FileName.get_file_basename(filename)
         basename_no_ext, ext = os.path.splitext(basename)
         result = None
-        if ext in {'.gz', '.pdf'}:
-            match = re.match(r'^([a-z\-]+)(\d{2})(\d{2})(\d{3})$', basename_no_ext)
+        if ext in _SUBMISSION_EXTENSIONS:
+            match = _OLD_STYLE_SUBMISSION_PATTERN.match(basename_no_ext)
             if match:
                 category, yy, mm, number = match.groups()
                 result = (category, yy, mm, number)
@@ -199,8 +214,8 @@ class SubmissionHandler:
         basename = FileName.get_file_basename(filename)
         basename_no_ext, ext = os.path.splitext(basename)
         result = None
-        if ext in {'.gz', '.pdf'}:
-            match = re.match(r'^(\d{2})(\d{2})\.(\d{4,5})$', basename_no_ext)
+        if ext in _SUBMISSION_EXTENSIONS:
+            match = _CURRENT_STYLE_SUBMISSION_PATTERN.match(basename_no_ext)
             if match:
                 yy, mm, number = match.groups()
                 result = (yy, mm, number)
@@ -284,9 +299,6 @@ class SubmissionHandler:
         :return: list[str], a list of error messages. If the list is empty, the file is considered valid.
         """
 
-        allowed_file_types = [FileType.FILE_TYPE_ARCHIVE_GZ, FileType.FILE_TYPE_ARCHIVE_TGZ, FileType.FILE_TYPE_PDF]
-        allowed_archive_file_types = [FileType.FILE_TYPE_ARCHIVE_GZ, FileType.FILE_TYPE_ARCHIVE_TGZ]
-
         error_list = []
 
         # Check filename pattern
@@ -303,15 +315,15 @@ class SubmissionHandler:
             file_types_by_extension = FileHandler.get_file_type_from_extension(file_path)
             file_type_by_format = FileHandler.get_file_type_from_format(file_path)
 
-            if not any(file_type in allowed_file_types for file_type in file_types_by_extension):
+            if not any(file_type in _ALLOWED_FILE_TYPES for file_type in file_types_by_extension):
                 error_list.append('File extension type is not allowed')
-            elif file_type_by_format not in allowed_file_types:
+            elif file_type_by_format not in _ALLOWED_FILE_TYPES:
                 error_list.append(f'File type {file_type_by_format.value} not allowed')
             elif file_type_by_format not in file_types_by_extension:
                 error_list.append('File format does not match file extension')
 
             # check that the archive could be in principle extracted
-            if not error_list and (file_type_by_format in allowed_archive_file_types):
+            if not error_list and (file_type_by_format in _ALLOWED_ARCHIVE_FILE_TYPES):
                 default_extract_path = '/'
                 archive_errors = ArchiveHandler.check_extract_possible(file_path, default_extract_path)
                 error_list.extend(archive_errors)
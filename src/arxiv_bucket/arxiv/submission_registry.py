@@ -14,7 +14,7 @@
 
 from arxiv_bucket.file.file_name import FileName
 from arxiv_bucket.file.file_system import FileSystem
-from arxiv_bucket.services.registry import Registry
+from arxiv_bucket.services.registry import DisabledMethod, Registry
 
 from .submission_handler import SubmissionHandler
 
@@ -23,33 +23,10 @@ class SubmissionRegistry(Registry):
     Registry for submissions.
     """
 
-    def add_entry(self, hash_key: str, entry: dict) -> None:
-        """
-        Prevent direct access to the base class 'add_entry' method.
-
-        This method is overridden to raise an AttributeError, ensuring that
-        entries are added to the registry only through the 'register_submission' method.
-
-        :param hash_key: str, the unique key for the registry entry (not used here).
-        :param entry: dict, the registry entry data (not used here).
-
-        :raises AttributeError: Always raised to enforce the use of 'register_submission'.
-        """
-        raise AttributeError("Direct access to base class 'add_entry' is not allowed. Use 'register_submission' instead.")
-
-    def update_entry(self, hash_key: str, entry: dict) -> None:
-        """
-        Prevent direct access to the base class 'update_entry' method.
-
-        This method is overridden to raise an AttributeError, ensuring that
-        entries are updated in the registry only through the 'register_submission' method.
-
-        :param hash_key: str, the unique key for the registry entry (not used here).
-        :param entry: dict, the registry entry data (not used here).
-
-        :raises AttributeError: Always raised to enforce the use of 'register_submission'.
-        """
-        raise AttributeError("Direct access to base class 'update_entry' is not allowed. Use 'register_submission' instead.")
+    # entries are added only through 'register_submission'
+    add_entry = DisabledMethod('register_submission')
+    bulk_add_entries = DisabledMethod('register_submission')
+    update_entry = DisabledMethod('register_submission')
 
     def register_submission(self, file_path: str, bulk_archive_key: str) -> None:
         """
@@ -86,7 +63,8 @@ class SubmissionRegistry(Registry):
                 diagnostics['key_conflicts'].append(registry_entry)
             return
 
-        super().add_entry(registry_key, registry_entry)
+        # the entry was generated here, so it is stored without a copy
+        self._insert_entry(registry_key, registry_entry)
 
     def find_submission_filename(self, file_path: str) -> list[str]:
         """
@@ -97,9 +75,10 @@ class SubmissionRegistry(Registry):
         """
 
         basename = FileName.get_file_basename(file_path)
+        no_metadata = dict()  # shared default, instead of building an empty dictionary for every entry
         registry_keys = [
-            key for key, entry in self._registry.items() 
-            if entry.get('metadata', {}).get('filename') == basename
+            key for key, entry in self._registry.items()
+            if entry.get('metadata', no_metadata).get('filename') == basename
         ]
 
         return registry_keys
@@ -145,9 +124,10 @@ class SubmissionRegistry(Registry):
         :return: list[str], the registry keys associated with the bulk archive key
         """
 
+        no_origin = dict()  # shared default, instead of building an empty dictionary for every entry
         return [
             key for key, entry in self._registry.items()
-            if entry.get('origin', {}).get('bulk_archive_key') == bulk_archive_key
+            if entry.get('origin', no_origin).get('bulk_archive_key') == bulk_archive_key
         ]
 
     def list_bulk_archive_keys(self) -> list[str]:
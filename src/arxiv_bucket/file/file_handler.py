@@ -4,6 +4,8 @@
 # Copyright (c) 2025 Jason Stuber
 # Licensed under the MIT License. See the LICENSE file for more details.
 
+import sys
+
 from arxiv_bucket.services.hash_service import HashType, HashService
 from arxiv_bucket.file.file_name import FileName
 from arxiv_bucket.file.file_system import FileSystem
@@ -24,6 +26,10 @@ class FileHandler:
 
     _file_handlers = [ArchiveHandler(), ImageHandler(), PdfHandler(), PostscriptHandler(), TexHandler(), XmlHandler()]
 
+    # extension to handler lookup, built from the handler list identified by _file_extension_to_handler_map_source
+    _file_extension_to_handler_map: dict = dict()
+    _file_extension_to_handler_map_source: list | None = None
+
     @staticmethod
     def get_metadata(file_path: str, hash_types: list[HashType]) -> dict:
         """
@@ -48,7 +54,8 @@ class FileHandler:
 
         metadata = dict()
 
-        metadata['filename'] = FileName.get_file_basename(file_path)
+        # interned, so metadata entries for the same file share one stored string, comparisons are still by value
+        metadata['filename'] = sys.intern(FileName.get_file_basename(file_path))
         metadata['size_bytes'] = FileSystem.get_file_size(file_path)
         metadata['hash'] = {}
         for hash_type in hash_types:
@@ -151,9 +158,29 @@ class FileHandler:
         :raises ValueError: If the handler does not have a callable 'get_file_extension_map' method.
         """
 
-        file_extension_to_handler_map = dict()
+        file_extension_to_handler_map = FileHandler._get_file_extension_to_handler_map()
+
+        found_file_handlers = file_extension_to_handler_map.get(extension.lower(), [])
+        return found_file_handlers
+
+    @staticmethod
+    def _get_file_extension_to_handler_map() -> dict:
+        """
+        Get the map of lower case file extensions to the list of associated file handlers.
+
+        The map is built once for the current list of file handlers and reused for subsequent lookups.
+        It is rebuilt only if the list of file handlers is replaced.
+
+        :return: dict, dictionary of lower case file extension and a list of associated file handlers.
+
+        :raises ValueError: If the handler does not have a callable 'get_file_extension_map' method.
+        """
 
         file_handler_list = FileHandler._get_file_handlers()
+        if FileHandler._file_extension_to_handler_map_source is file_handler_list:
+            return FileHandler._file_extension_to_handler_map
+
+        file_extension_to_handler_map = dict()
 
         for handler in file_handler_list:
             for ext in handler.get_file_extension_map():
@@ -164,5 +191,7 @@ class FileHandler:
                 if handler not in file_extension_to_handler_map[ext]:
                     file_extension_to_handler_map[ext].append(handler)
 
-        found_file_handlers = file_extension_to_handler_map.get(extension.lower(), [])
-        return found_file_handlers
+        FileHandler._file_extension_to_handler_map = file_extension_to_handler_map
+        FileHandler._file_extension_to_handler_map_source = file_handler_list
+
+        return file_extension_to_handler_map
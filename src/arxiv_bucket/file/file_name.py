@@ -4,6 +4,7 @@
 # Copyright (c) 2025 Jason Stuber
 # Licensed under the MIT License. See the LICENSE file for more details.
 
+from functools import lru_cache
 import os
 import re
 
@@ -27,10 +28,12 @@ class FileName:
         return os.path.splitext(file_path)[1]
 
     @staticmethod
+    @lru_cache(maxsize=65536)
     def get_file_basename(file_path: str) -> str:
         """
         Get the file basename from the file path.
         For /d/directory1/directory2/filename.txt, this is filename.txt.
+        The results are cached, as the same paths are looked up repeatedly when registering archives.
 
         :param file_path: str, path to the file
         :return: str, file basename
@@ -4,9 +4,17 @@
 # Copyright (c) 2025 Jason Stuber
 # Licensed under the MIT License. See the LICENSE file for more details.
 
+from contextlib import contextmanager
 from datetime import datetime, timezone
 import os
 import shutil
+import stat
+import threading
+from typing import Iterator
+
+
+# per-thread stat and directory listing caches, only populated while a FileSystem.stat_cache() context is active
+_stat_cache_local = threading.local()
 
 
 class FileSystem:
@@ -14,17 +22,65 @@ class FileSystem:
     File system operations
     """
 
+    @staticmethod
+    @contextmanager
+    def stat_cache() -> Iterator[None]:
+        """
+        Context manager that caches the stat results used by is_file and the directory listings of list_files
+        for the duration of a single logical operation.
+
+        Within the context, repeated is_file checks on the same path are answered from the cache instead of issuing
+        another stat system call, and repeated list_files calls on the same directory do not scan it again.
+        Nested contexts share the cache of the outermost context, which clears the cache on exit.
+        The cache is local to the current thread.
+        """
+
+        is_outermost = getattr(_stat_cache_local, 'entries', None) is None
+        if is_outermost:
+            _stat_cache_local.entries = dict()
+            _stat_cache_local.listings = dict()
+
+        try:
+            yield
+        finally:
+            if is_outermost:
+                _stat_cache_local.entries = None
+                _stat_cache_local.listings = None
+
+    @staticmethod
+    def clear_stat_cache() -> None:
+        """
+        Forget the stat results and directory listings cached by the active stat_cache() context, if any.
+        Call after writing into the file system within a context, so later checks see the new files.
+        """
+
+        if getattr(_stat_cache_local, 'entries', None) is not None:
+            _stat_cache_local.entries.clear()
+            _stat_cache_local.listings.clear()
+
     @staticmethod
     def is_file(file_path: str) -> bool:
         """
         Determine if the given path corresponds to an existing file.
+        If a stat_cache() context is active, the stat result is cached for the path.
 
         :param file_path: str, path to the file
         :return: bool, True if the path corresponds to a file, False otherwise.
                  If the object is found but does not correspond to a file, False is also returned.
         """
 
-        is_file_found = os.path.isfile(file_path)
+        cache = getattr(_stat_cache_local, 'entries', None)
+        if cache is None:
+            return os.path.isfile(file_path)
+
+        if file_path not in cache:
+            try:
+                cache[file_path] = os.stat(file_path)
+            except (OSError, ValueError):
+                cache[file_path] = None
+
+        stat_result = cache[file_path]
+        is_file_found = stat_result is not None and stat.S_ISREG(stat_result.st_mode)
         return is_file_found
 
     @staticmethod
@@ -161,6 +217,7 @@ class FileSystem:
     def list_files(directory_path: str, include_subdirectories: bool=False) -> list[str]:
         """
         List all filenames in a specified directory.
+        If a stat_cache() context is active, the listing is cached for the directory.
 
         :param directory_path: str, path to the directory
         :param include_subdirectories: bool, if True then lists all filenames from subdirectories, defaults to False
@@ -169,6 +226,11 @@ class FileSystem:
         :raises FileNotFoundError: If the directory is not found.
         """
 
+        listings = getattr(_stat_cache_local, 'listings', None)
+        listing_key = (directory_path, include_subdirectories)
+        if listings is not None and listing_key in listings:
+            return list(listings[listing_key])
+
         is_valid_directory = FileSystem.is_directory(directory_path)
         if not is_valid_directory:
             raise FileNotFoundError(f"The directory {directory_path} does not exist.")
@@ -181,6 +243,12 @@ class FileSystem:
                     relative_path = os.path.relpath(full_path, directory_path)
                     filename_list.append(relative_path)
         else:
-            filename_list = [f for f in os.listdir(directory_path) if FileSystem.is_file(os.path.join(directory_path, f))]
+            # directory entries carry the file type, which avoids a stat call per entry
+            with os.scandir(directory_path) as directory_entries:
+                filename_list = [entry.name for entry in directory_entries if entry.is_file()]
+
+        if listings is not None:
+            # keep a private copy, callers may modify the returned list
+            listings[listing_key] = list(filename_list)
 
         return filename_list
@@ -8,10 +8,13 @@ from arxiv_bucket.file.file_name import FileName
 from arxiv_bucket.file.file_system import FileSystem
 from arxiv_bucket.file.file_type import FileType
 
+from concurrent.futures import ProcessPoolExecutor
 import gzip
+import multiprocessing
+from multiprocessing.context import BaseContext
 import os
-import struct
 import tarfile
+from typing import Optional
 
 
 class ArchiveHandler:
@@ -25,6 +28,21 @@ class ArchiveHandler:
         '.tgz': [FileType.FILE_TYPE_ARCHIVE_TGZ]
     }
 
+    # (is tar or tgz format, is gzip or tgz format) as returned by _probe_format
+    _probe_to_file_type_map = {
+        (True, False): FileType.FILE_TYPE_ARCHIVE_TAR,
+        (True, True): FileType.FILE_TYPE_ARCHIVE_TGZ,
+        (False, True): FileType.FILE_TYPE_ARCHIVE_GZ
+    }
+
+    # archive file type -> name of the method extracting it, used by extract_contents,
+    # the method is looked up by name as the methods are defined below
+    _extract_method_name_map = {
+        FileType.FILE_TYPE_ARCHIVE_GZ: '_extract_gzip_contents_private',
+        FileType.FILE_TYPE_ARCHIVE_TAR: '_extract_tar_or_tgz_contents_private',
+        FileType.FILE_TYPE_ARCHIVE_TGZ: '_extract_tar_or_tgz_contents_private'
+    }
+
     @staticmethod
     def get_file_extension_map() -> dict:
         """
@@ -54,15 +72,65 @@ class ArchiveHandler:
         :param file_path: str, path to the file
         :return: FileType, file type determined by the file format.
             If the file type is unknown, return FILE_TYPE_UNKNOWN.
+
+        :raises FileNotFoundError: If the file is not found.
+        """
+
+        is_file_found = FileSystem.is_file(file_path)
+        if not is_file_found:
+            raise FileNotFoundError('file not found')
+
+        format_probe = ArchiveHandler._probe_format(file_path)
+        file_type_category = ArchiveHandler._probe_to_file_type_map.get(format_probe, FileType.FILE_TYPE_UNKNOWN)
+
+        return file_type_category
+
+    @staticmethod
+    def classify_batch(file_path_list: list[str], max_workers: Optional[int] = None,
+                       chunk_size: int = 64, mp_context: Optional[BaseContext] = None) -> list[FileType]:
         """
+        Determine the file types of a batch of files from their file formats.
 
-        if ArchiveHandler.is_tar_format(file_path):
-            file_type_category = FileType.FILE_TYPE_ARCHIVE_TAR
-        elif ArchiveHandler.is_tgz_format(file_path):
-            file_type_category = FileType.FILE_TYPE_ARCHIVE_TGZ
-        elif ArchiveHandler.is_gzip_format(file_path):
-            file_type_category = FileType.FILE_TYPE_ARCHIVE_GZ
-        else:
+        The files are classified in parallel using a process pool, as the format checks are CPU bound
+        for compressed archives.
+
+        :param file_path_list: list[str], paths to the files
+        :param max_workers: int, optional maximum number of worker processes, default None uses the number of CPUs
+        :param chunk_size: int, number of files sent to a worker process at a time, default 64
+        :param mp_context: BaseContext, optional multiprocessing context used to start the worker processes,
+            default None uses the 'spawn' start method, which is safe in multi-threaded programs unlike 'fork'.
+        :return: list[FileType], file types determined by the file format, in the same order as the file paths.
+            If the file type is unknown, or the file is missing or cannot be read, FILE_TYPE_UNKNOWN is used
+            for the file, so one bad path does not lose the results of the whole batch.
+
+        :raises ValueError: If the chunk size is not positive.
+        """
+
+        if chunk_size <= 0:
+            raise ValueError('chunk size must be positive')
+
+        if mp_context is None:
+            mp_context = multiprocessing.get_context('spawn')
+
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context) as executor:
+            file_type_list = list(executor.map(ArchiveHandler._get_file_type_from_format_or_unknown,
+                                               file_path_list, chunksize=chunk_size))
+
+        return file_type_list
+
+    @staticmethod
+    def _get_file_type_from_format_or_unknown(file_path: str) -> FileType:
+        """
+        Determine the file type from the file format, for a file that may be missing or unreadable.
+
+        :param file_path: str, path to the file
+        :return: FileType, file type determined by the file format.
+            If the file type is unknown, or the file is not found or cannot be read, return FILE_TYPE_UNKNOWN.
+        """
+
+        try:
+            file_type_category = ArchiveHandler.get_file_type_from_format(file_path)
+        except OSError:
             file_type_category = FileType.FILE_TYPE_UNKNOWN
 
         return file_type_category
@@ -79,18 +147,34 @@ class ArchiveHandler:
          :raises FileNotFoundError: If the file is not found.
          """
 
-        is_file_found = FileSystem.is_file(file_path)
-        if not is_file_found:
-            raise FileNotFoundError('file not found')
+        with FileSystem.stat_cache():
+            is_file_found = FileSystem.is_file(file_path)
+            if not is_file_found:
+                raise FileNotFoundError('file not found')
 
-        is_tar = ArchiveHandler.is_tar_format(file_path)
-        is_tgz = ArchiveHandler.is_tgz_format(file_path)
-        is_gzip = ArchiveHandler.is_gzip_format(file_path)
+            is_tar = ArchiveHandler.is_tar_format(file_path)
+            is_tgz = ArchiveHandler.is_tgz_format(file_path)
+            is_gzip = ArchiveHandler.is_gzip_format(file_path)
 
-        is_supported = is_tar or is_gzip or is_tgz
+            is_supported = is_tar or is_gzip or is_tgz
 
         return is_supported
 
+    @staticmethod
+    def _probe_format(file_path: str) -> tuple[bool, bool]:
+        """
+        Probe the file content for the tar and gzip archive formats.
+        A tgz archive is detected as both.
+
+        :param file_path: str, valid path to the file
+        :return: tuple[bool, bool], (is tar or tgz format, is gzip or tgz format)
+        """
+
+        is_tar_or_tgz_format = ArchiveHandler._is_tar_or_tgz_format(file_path)
+        is_gzip_or_tgz_format = ArchiveHandler._is_gzip_or_tgz_format(file_path)
+
+        return is_tar_or_tgz_format, is_gzip_or_tgz_format
+
     @staticmethod
     def _is_tar_or_tgz_format(file_path: str) -> bool:
         """
@@ -204,18 +288,19 @@ class ArchiveHandler:
         :raises TypeError: If the source file is not a supported archive format in the list.
         """
 
-        is_archive_file = ArchiveHandler.is_archive_format(file_path)
-        if not is_archive_file:
-            raise TypeError('file not a supported archive format')
+        with FileSystem.stat_cache():
+            is_archive_file = ArchiveHandler.is_archive_format(file_path)
+            if not is_archive_file:
+                raise TypeError('file not a supported archive format')
 
-        if ArchiveHandler.is_gzip_format(file_path):
-            file_list = ArchiveHandler._list_gzip_contents(file_path)
-        elif ArchiveHandler.is_tar_format(file_path):
-            file_list = ArchiveHandler._list_tar_contents(file_path)
-        elif ArchiveHandler.is_tgz_format(file_path):
-            file_list = ArchiveHandler._list_tgz_contents(file_path)
-        else:
-            raise TypeError('file not listed as a supported archive format')
+            if ArchiveHandler.is_gzip_format(file_path):
+                file_list = ArchiveHandler._list_gzip_contents(file_path)
+            elif ArchiveHandler.is_tar_format(file_path):
+                file_list = ArchiveHandler._list_tar_contents(file_path)
+            elif ArchiveHandler.is_tgz_format(file_path):
+                file_list = ArchiveHandler._list_tgz_contents(file_path)
+            else:
+                raise TypeError('file not listed as a supported archive format')
 
         return file_list
 
@@ -307,22 +392,55 @@ class ArchiveHandler:
         file_list = []
 
         with open(file_path, 'rb') as file_handle:
-            id1, id2, compression, flags, mtime, extra_flags, os_id = struct.unpack('<BBBBLBB',
-                                                                                    file_handle.read(10))
-            is_valid_compression_format = (id1 == 0x1F and id2 == 0x8B and compression == 0x08)
+            # header: ID1, ID2, CM, FLG, MTIME (4 bytes), XFL, OS
+            header = file_handle.read(10)
+            is_valid_compression_format = (len(header) == 10 and header[0] == 0x1F and header[1] == 0x8B
+                                           and header[2] == 0x08)
             if is_valid_compression_format:
+                flags = header[3]
                 is_extra_field_present = (flags & (1 << 2) != 0)
                 if is_extra_field_present:
-                    file_handle.read(struct.unpack('<H', file_handle.read(2))[0])
+                    extra_field_length = int.from_bytes(file_handle.read(2), 'little')
+                    file_handle.seek(extra_field_length, os.SEEK_CUR)
 
                 is_filename_field_present = (flags & (1 << 3) != 0)
                 if is_filename_field_present:
-                    name = b''.join(iter(lambda: file_handle.read(1), b'\0'))
+                    name = ArchiveHandler._read_null_terminated_field(file_handle)
                     name = name.decode()
                     file_list.append(name)
 
         return file_list
 
+    @staticmethod
+    def _read_null_terminated_field(file_handle, block_size: int = 1024) -> bytes:
+        """
+        Read a zero-terminated field, such as the gzip header filename, from the current position of a file.
+
+        The field is read in blocks and the terminator is located with bytes.find instead of reading byte by byte.
+        The file position after the call is not defined, the caller should not read further fields.
+
+        :param file_handle: binary file handle positioned at the start of the field
+        :param block_size: int, number of bytes read at a time, default 1024
+        :return: bytes, field content without the zero terminator.
+            If the end of file is reached before a terminator, the remaining content is returned.
+        """
+
+        field = bytearray()
+
+        is_reading = True
+        while is_reading:
+            block = file_handle.read(block_size)
+            terminator_index = block.find(b'\0')
+            if terminator_index >= 0:
+                field += block[:terminator_index]
+                is_reading = False
+            elif not block:
+                is_reading = False
+            else:
+                field += block
+
+        return bytes(field)
+
     @staticmethod
     def check_extract_possible(source_file_path: str, destination_directory: str) -> list[str]:
         """
@@ -337,33 +455,41 @@ class ArchiveHandler:
         """
 
         error_log = []
-        is_file_found = FileSystem.is_file(source_file_path)
-        if not is_file_found:
-            error_log.append('file not found')
-
-        is_directory = FileSystem.is_directory(destination_directory)
-        if not is_directory:
-            error_log.append('destination directory not found')
-
-        if is_file_found and is_directory:
-            file_contents = ArchiveHandler.list_contents(source_file_path)
-
-            is_unique_names = FileName.is_filename_list_unique(file_contents, is_case_insensitive=True,
-                                                               is_filename_only=False)
-            if not is_unique_names:
-                error_log.append('archive contents filename is not unique on case-insensitive file systems')
-
-            is_valid_filenames = all([FileName.is_filename_allowed(entry) for entry in file_contents])
-            if not is_valid_filenames:
-                error_log.append('archive contents filenames are forbidden')
-
-            if is_unique_names and is_valid_filenames:
-                for contents_filename in file_contents:
-                    destination_filename = os.path.join(destination_directory, contents_filename)
-                    is_destination_file_found = FileSystem.is_file(destination_filename)
-                    if is_destination_file_found:
-                        error_log.append('destination file already exists')
-                        break
+        with FileSystem.stat_cache():
+            is_file_found = FileSystem.is_file(source_file_path)
+            if not is_file_found:
+                error_log.append('file not found')
+
+            is_directory = FileSystem.is_directory(destination_directory)
+            if not is_directory:
+                error_log.append('destination directory not found')
+
+            if is_file_found and is_directory:
+                file_contents = ArchiveHandler.list_contents(source_file_path)
+
+                is_unique_names = FileName.is_filename_list_unique(file_contents, is_case_insensitive=True,
+                                                                   is_filename_only=False)
+                if not is_unique_names:
+                    error_log.append('archive contents filename is not unique on case-insensitive file systems')
+
+                is_valid_filenames = all([FileName.is_filename_allowed(entry) for entry in file_contents])
+                if not is_valid_filenames:
+                    error_log.append('archive contents filenames are forbidden')
+
+                if is_unique_names and is_valid_filenames:
+                    # list the destination directory once instead of checking each top level file separately,
+                    # casefolded so a file differing only by case is found as on case-insensitive file systems
+                    destination_filenames = {filename.casefold()
+                                             for filename in FileSystem.list_files(destination_directory)}
+                    for contents_filename in file_contents:
+                        if '/' in contents_filename:
+                            destination_filename = os.path.join(destination_directory, contents_filename)
+                            is_destination_file_found = FileSystem.is_file(destination_filename)
+                        else:
+                            is_destination_file_found = contents_filename.casefold() in destination_filenames
+                        if is_destination_file_found:
+                            error_log.append('destination file already exists')
+                            break
 
         return error_log
 
@@ -409,11 +535,15 @@ class ArchiveHandler:
                 file_handle.close()
 
         file_contents = ArchiveHandler.list_contents(source_file_path)
-        for contents_filename in file_contents:
-            destination_filename = os.path.join(destination_directory, contents_filename)
-            with open(destination_filename, 'wb') as file_handle:
-                file_handle.write(buffer)
-                file_handle.close()
+        try:
+            for contents_filename in file_contents:
+                destination_filename = os.path.join(destination_directory, contents_filename)
+                with open(destination_filename, 'wb') as file_handle:
+                    file_handle.write(buffer)
+                    file_handle.close()
+        finally:
+            # an enclosing stat_cache() context must not answer from results cached before the files were written
+            FileSystem.clear_stat_cache()
 
     @staticmethod
     def _extract_tar_or_tgz_contents_private(source_file_path: str, destination_directory:str) -> None:
@@ -426,10 +556,14 @@ class ArchiveHandler:
             The archive contents will be extracted into this directory.
         """
 
-        with tarfile.open(source_file_path, 'r') as tar:
-            file_members = [member for member in tar.getmembers() if member.isfile()]
-            for member in file_members:
-                tar.extract(member, destination_directory)
+        try:
+            with tarfile.open(source_file_path, 'r') as tar:
+                file_members = [member for member in tar.getmembers() if member.isfile()]
+                for member in file_members:
+                    tar.extract(member, destination_directory)
+        finally:
+            # an enclosing stat_cache() context must not answer from results cached before the files were written
+            FileSystem.clear_stat_cache()
 
     @staticmethod
     def extract_gzip_contents(source_file_path: str,
@@ -446,13 +580,15 @@ class ArchiveHandler:
             This can occur for several reasons such as source file, destination directory or archive contents.
         """
 
-        is_gzip = ArchiveHandler.is_gzip_format(source_file_path)
-        if not is_gzip:
-            raise TypeError('file not in gzip archive format')
+        # cache the stat results of the read-only checks only, the extraction writes files
+        with FileSystem.stat_cache():
+            is_gzip = ArchiveHandler.is_gzip_format(source_file_path)
+            if not is_gzip:
+                raise TypeError('file not in gzip archive format')
 
-        is_possible = ArchiveHandler.is_extract_possible(source_file_path, destination_directory)
-        if not is_possible:
-            raise ValueError('extraction not possible')
+            is_possible = ArchiveHandler.is_extract_possible(source_file_path, destination_directory)
+            if not is_possible:
+                raise ValueError('extraction not possible')
 
         ArchiveHandler._extract_gzip_contents_private(source_file_path, destination_directory)
 
@@ -471,13 +607,15 @@ class ArchiveHandler:
             This can occur for several reasons such as source file, destination directory or archive contents.
         """
 
-        is_tar = ArchiveHandler.is_tar_format(source_file_path)
-        if not is_tar:
-            raise TypeError('file not in tar archive format')
+        # cache the stat results of the read-only checks only, the extraction writes files
+        with FileSystem.stat_cache():
+            is_tar = ArchiveHandler.is_tar_format(source_file_path)
+            if not is_tar:
+                raise TypeError('file not in tar archive format')
 
-        is_possible = ArchiveHandler.is_extract_possible(source_file_path, destination_directory)
-        if not is_possible:
-            raise ValueError('extraction not possible')
+            is_possible = ArchiveHandler.is_extract_possible(source_file_path, destination_directory)
+            if not is_possible:
+                raise ValueError('extraction not possible')
 
         ArchiveHandler._extract_tar_or_tgz_contents_private(source_file_path, destination_directory)
 
@@ -496,13 +634,15 @@ class ArchiveHandler:
             This can occur for several reasons such as source file, destination directory or archive contents.
         """
 
-        is_tgz = ArchiveHandler.is_tgz_format(source_file_path)
-        if not is_tgz:
-            raise TypeError('file not in tgz archive format')
+        # cache the stat results of the read-only checks only, the extraction writes files
+        with FileSystem.stat_cache():
+            is_tgz = ArchiveHandler.is_tgz_format(source_file_path)
+            if not is_tgz:
+                raise TypeError('file not in tgz archive format')
 
-        is_possible = ArchiveHandler.is_extract_possible(source_file_path, destination_directory)
-        if not is_possible:
-            raise ValueError('extraction not possible')
+            is_possible = ArchiveHandler.is_extract_possible(source_file_path, destination_directory)
+            if not is_possible:
+                raise ValueError('extraction not possible')
 
         ArchiveHandler._extract_tar_or_tgz_contents_private(source_file_path, destination_directory)
 
@@ -514,19 +654,21 @@ class ArchiveHandler:
         :param source_file_path: str, path to the archive file
         :param destination_directory: str, path to the destination directory
 
+        :raises FileNotFoundError: If the source file is not found.
         :raises TypeError: If the source file is not a supported archive format.
-        :raises TypeError: If the source file is not a supported archive format in the list.
+        :raises ValueError: If the extraction is not possible.
+            This can occur for several reasons such as source file, destination directory or archive contents.
         """
 
-        is_archive_file = ArchiveHandler.is_archive_format(source_file_path)
-        if not is_archive_file:
-            raise TypeError('file not a supported archive format')
+        # cache the stat results of the read-only checks only, the extraction writes files
+        with FileSystem.stat_cache():
+            file_type = ArchiveHandler.get_file_type_from_format(source_file_path)
+            extract_method_name = ArchiveHandler._extract_method_name_map.get(file_type)
+            if extract_method_name is None:
+                raise TypeError('file not a supported archive format')
+
+            is_possible = ArchiveHandler.is_extract_possible(source_file_path, destination_directory)
+            if not is_possible:
+                raise ValueError('extraction not possible')
 
-        if  ArchiveHandler.is_gzip_format(source_file_path):
-            ArchiveHandler.extract_gzip_contents(source_file_path, destination_directory)
-        elif ArchiveHandler.is_tar_format(source_file_path):
-            ArchiveHandler.extract_tar_contents(source_file_path, destination_directory)
-        elif ArchiveHandler.is_tgz_format(source_file_path):
-            ArchiveHandler.extract_tgz_contents(source_file_path, destination_directory)
-        else:
-            raise TypeError('file not listed as a supported archive format')
+        getattr(ArchiveHandler, extract_method_name)(source_file_path, destination_directory)
@@ -35,6 +35,21 @@ class ImageHandler:
         'TIFF': FileType.FILE_TYPE_IMAGE_TIFF
     }
 
+    # restrict the PIL plugin probe to the supported formats
+    _pil_formats = tuple(_pil_to_type_map.keys())
+
+    # unambiguous file signatures, a match restricts the PIL probe to that single format,
+    # formats with short signatures such as BMP and ICO are left to the full probe
+    _magic_to_pil_format_map = [
+        (b'\x89PNG\r\n\x1a\n', ('PNG',)),
+        (b'GIF87a', ('GIF',)),
+        (b'GIF89a', ('GIF',)),
+        (b'\xff\xd8\xff', ('JPEG',)),
+        (b'II*\x00', ('TIFF',)),
+        (b'MM\x00*', ('TIFF',))
+    ]
+    _magic_header_length = 8
+
     @staticmethod
     def get_file_extension_map() -> dict:
         """
@@ -60,7 +75,8 @@ class ImageHandler:
         """
         Determine the file type from the file format.
 
-        Method currently not implemented.
+        The file header is first compared against known image signatures, a match limits PIL to the
+        matching format so the other plugins are not probed. The image is still opened by PIL to validate it.
 
         :param file_path: str, path to the file
         :return: FileType, file type determined by the file format.
@@ -75,8 +91,14 @@ class ImageHandler:
             raise FileNotFoundError('file not found')
 
         try:
-            with Image.open(file_path) as img:
-                file_type_category = ImageHandler._pil_to_type_map.get(img.format or "", FileType.FILE_TYPE_UNKNOWN)
+            with open(file_path, 'rb') as file_handle:
+                header = file_handle.read(ImageHandler._magic_header_length)
+                pil_formats = next((formats for magic, formats in ImageHandler._magic_to_pil_format_map
+                                    if header.startswith(magic)), ImageHandler._pil_formats)
+                file_handle.seek(0)
+                with Image.open(file_handle, formats=pil_formats) as img:
+                    file_type_category = ImageHandler._pil_to_type_map.get(img.format or "",
+                                                                           FileType.FILE_TYPE_UNKNOWN)
 
         except IOError:
             file_type_category = FileType.FILE_TYPE_UNKNOWN
@@ -72,23 +72,39 @@ class TexHandler:
         if not is_file_found:
             raise FileNotFoundError('file not found')
 
-        is_utf8 = FileSystem.is_utf8_encoded(file_path)
-        if is_utf8:
-            latex2e_main_required_patterns = ['\\documentclass', '\\begin{document}', '\\end{document}']
-            latex209_main_required_patterns = ['\\documentstyle', '\\begin{document}', '\\end{document}']
-
-            with open(file_path, 'r', encoding='utf-8') as file:
-                buffer = file.read()
-                is_latex2e_main_format = all(pattern in buffer for pattern in latex2e_main_required_patterns)
-                is_latex209_main_format = all(pattern in buffer for pattern in latex209_main_required_patterns)
-
-                if is_latex2e_main_format:
-                    file_type_category = FileType.FILE_TYPE_TEX_LATEX_2E_MAIN
-                elif is_latex209_main_format:
-                    file_type_category = FileType.FILE_TYPE_TEX_LATEX_209_MAIN
-                else:
-                    file_type_category = FileType.FILE_TYPE_UNKNOWN
+        # the patterns are ASCII, so they can be searched for in the raw bytes before decoding
+        latex2e_main_required_patterns = [b'\\documentclass', b'\\begin{document}', b'\\end{document}']
+        latex209_main_required_patterns = [b'\\documentstyle', b'\\begin{document}', b'\\end{document}']
+
+        with open(file_path, 'rb') as file:
+            buffer = file.read()
+
+        is_latex2e_main_format = all(pattern in buffer for pattern in latex2e_main_required_patterns)
+        is_latex209_main_format = all(pattern in buffer for pattern in latex209_main_required_patterns)
+
+        if (is_latex2e_main_format or is_latex209_main_format) and TexHandler._is_utf8_buffer(buffer):
+            if is_latex2e_main_format:
+                file_type_category = FileType.FILE_TYPE_TEX_LATEX_2E_MAIN
+            else:
+                file_type_category = FileType.FILE_TYPE_TEX_LATEX_209_MAIN
         else:
             file_type_category = FileType.FILE_TYPE_UNKNOWN
 
         return file_type_category
+
+    @staticmethod
+    def _is_utf8_buffer(buffer: bytes) -> bool:
+        """
+        Determine if the binary buffer is UTF-8 encoded.
+
+        :param buffer: bytes, binary buffer
+        :return: bool, True if the buffer is UTF-8 encoded, otherwise False
+        """
+
+        try:
+            buffer.decode('utf-8')
+            is_utf8 = True
+        except UnicodeDecodeError:
+            is_utf8 = False
+
+        return is_utf8
@@ -4,6 +4,7 @@
 # Copyright (c) 2025 Jason Stuber
 # Licensed under the MIT License. See the LICENSE file for more details.
 
+from typing import Iterator, Optional, Union
 import xml.etree.ElementTree as xml_element_tree_implementation
 import xmltodict as xmltodict_implementation
 
@@ -11,6 +12,15 @@ from arxiv_bucket.file.file_system import FileSystem
 from arxiv_bucket.file.file_type import FileType
 
 
+class _DiscardTarget:
+    """
+    Parser target that builds nothing, used to check an XML file without creating an element tree.
+    """
+
+    def close(self) -> None:
+        return None
+
+
 class XmlHandler:
     """
     A class to handle Extensible Markup Language (XML) files.
@@ -20,6 +30,9 @@ class XmlHandler:
         '.xml': [FileType.FILE_TYPE_XML]
     }
 
+    # size of the chunks fed to the incremental XML parser
+    _read_chunk_size = 1 << 16
+
     @staticmethod
     def get_file_extension_map() -> dict:
         """
@@ -74,8 +87,12 @@ class XmlHandler:
             raise FileNotFoundError('file not found')
 
         try:
+            # feed the parser in chunks without building elements, so the memory use does not grow with the file
+            parser = xml_element_tree_implementation.XMLParser(target=_DiscardTarget())
             with open(file_path, 'r') as file_handle:
-                xml_element_tree_implementation.parse(file_handle)
+                while chunk := file_handle.read(XmlHandler._read_chunk_size):
+                    parser.feed(chunk)
+            parser.close()
             is_xml_format = True
         except xml_element_tree_implementation.ParseError:
             is_xml_format = False
@@ -108,3 +125,71 @@ class XmlHandler:
             raise ValueError(f"Failed to parse XML content: {e}")
 
         return xml_dict
+
+    @staticmethod
+    def iter_xml_children(file_path: str, root_tag: str) -> Iterator[tuple[str, Union[Optional[str], dict]]]:
+        """
+        Stream the children of the root element of a file in Extensible Markup Language (XML) format.
+
+        The file is parsed incrementally and each child is released once it has been yielded,
+        so the memory use does not grow with the number of children.
+
+        :param file_path: str, path to the file
+        :param root_tag: str, expected tag of the root element
+        :return: Iterator[tuple[str, Union[Optional[str], dict]]], (tag, value) of each child of the root element.
+            The value is the stripped text of the child, None if empty, or a dictionary of the
+            stripped texts of its own children if it has any.
+
+        :raises FileNotFoundError: If the file is not found.
+        :raises TypeError: If the root element does not have the expected tag, raised while iterating.
+        :raises ValueError: If the XML content cannot be parsed, raised while iterating.
+        """
+
+        if not FileSystem.is_file(file_path):
+            raise FileNotFoundError('file not found')
+
+        return XmlHandler._iter_xml_children(file_path, root_tag)
+
+    @staticmethod
+    def _iter_xml_children(file_path: str, root_tag: str) -> Iterator[tuple[str, Union[Optional[str], dict]]]:
+        """
+        Generator behind iter_xml_children, see there for the details.
+        """
+
+        root = None
+        depth = 0
+        try:
+            for event, element in xml_element_tree_implementation.iterparse(file_path, events=('start', 'end')):
+                if event == 'start':
+                    if root is None:
+                        if element.tag != root_tag:
+                            raise TypeError(f"unexpected root element '{element.tag}'")
+                        root = element
+                    depth += 1
+                    continue
+
+                depth -= 1
+                if depth == 1:
+                    if len(element):
+                        value = {child.tag: XmlHandler._get_element_text(child) for child in element}
+                    else:
+                        value = XmlHandler._get_element_text(element)
+                    yield element.tag, value
+                    root.remove(element)  # release the child, it is always the first one left
+        except xml_element_tree_implementation.ParseError as e:
+            raise ValueError(f"Failed to parse XML content: {e}")
+
+    @staticmethod
+    def _get_element_text(element: xml_element_tree_implementation.Element) -> Optional[str]:
+        """
+        Get the stripped text of an XML element.
+
+        :param element: Element, XML element
+        :return: Optional[str], stripped text of the element, None if the text is empty.
+        """
+
+        text = element.text
+        if text is not None:
+            text = text.strip() or None
+
+        return text
@@ -72,13 +72,14 @@ class HashService:
         return hash_encoder
 
     @staticmethod
-    def calculate_file_hash(file_path: str, hash_type: HashType, file_buffer_size: int=65536) -> str:
+    def calculate_file_hash(file_path: str, hash_type: HashType, file_buffer_size: int=1 << 20) -> str:
         """
         Calculate the hash for the given file.
+        The file is read into a single reused buffer, as in hashlib.file_digest, the hash update releases the GIL.
 
         :param file_path: str, path to the file
         :param hash_type: HashType, hash type category such as MD5 or SHA256
-        :param file_buffer_size: int, size of the file buffer for block encoding, 65536 default
+        :param file_buffer_size: int, size of the file buffer for block encoding, 1 MiB default
         :return: str, hash value as a hexadecimal hash key
 
         :raises ValueError: if the file buffer size is invalid
@@ -99,15 +100,17 @@ class HashService:
 
         hash_encoder = HashService._get_hash_encoder_instance(hash_type)
 
-        with open(file_path, 'rb') as file_handle:
+        buffer = bytearray(file_buffer_size)
+        view = memoryview(buffer)
+        with open(file_path, 'rb', buffering=0) as file_handle:
             is_reading = True
             while is_reading:
-                buffer = file_handle.read(file_buffer_size)
+                n_bytes = file_handle.readinto(buffer)
 
-                if not buffer:
+                if not n_bytes:
                     is_reading = False
                 else:
-                    hash_encoder.update(buffer)
+                    hash_encoder.update(view[:n_bytes])
 
             hash_value = hash_encoder.hexdigest()
 
@@ -4,11 +4,39 @@
 # Copyright (c) 2025 Jason Stuber
 # Licensed under the MIT License. See the LICENSE file for more details.
 
+import bisect
+from collections import OrderedDict
 import copy
 import json
-from typing import Optional
+import os
+import pickle
+from types import MappingProxyType
+from typing import Iterable, KeysView, Mapping, Optional
 
-from arxiv_bucket.file.file_system import FileSystem
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency, fall back to the standard library json module
+    orjson = None
+
+
+class DisabledMethod:
+    """
+    Descriptor that disables an inherited method in a subclass.
+    Looking up the method raises an AttributeError, so the method is reported as absent, e.g. by hasattr.
+    """
+
+    def __init__(self, replacement: str) -> None:
+        """
+        :param replacement: str, the name of the method to use instead, for the error message.
+        """
+        self._name = ''
+        self._replacement = replacement
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    def __get__(self, instance: object, owner: Optional[type] = None):
+        raise AttributeError(f"Direct access to base class '{self._name}' is not allowed. Use '{self._replacement}' instead.")
 
 
 class Registry:
@@ -16,6 +44,16 @@ class Registry:
     Generic base class for maintaining a registry of entries identified by unique keys.
     """
 
+    __slots__ = ('_registry', '_version', '_sorted_keys', '_sorted_keys_source', '_sorted_keys_version')
+
+    # registries loaded with use_cache=True, absolute file path -> (modification time ns, size bytes, registry)
+    # least recently used first, bounded by _load_cache_max_entries so the cached registries cannot grow without limit
+    _load_cache: OrderedDict[str, tuple[int, int, dict]] = OrderedDict()
+    _load_cache_max_entries = 8
+
+    # json.dump and pickle.dump issue many small writes, a large buffer reduces the number of write calls
+    _write_buffer_size = 1 << 20
+
     def __init__(self, file_path: Optional[str] = None) -> None:
         """
         Initializes the registry as an empty dictionary.
@@ -23,6 +61,14 @@ class Registry:
 
         self._registry = dict()
 
+        # incremented by every method that changes the registry, so derived lookups know when to rebuild
+        self._version = 0
+
+        # sorted copy of the keys for prefix lookups, built on demand
+        self._sorted_keys: list[str] = list()
+        self._sorted_keys_source: Optional[dict] = None
+        self._sorted_keys_version = -1
+
         if file_path is not None:
             self.load(file_path)
 
@@ -31,6 +77,7 @@ class Registry:
         Clears the registry and resets it to its default state.
         """
         self._registry.clear()
+        self._version += 1
 
     def is_key_present(self, hash_key: str) -> bool:
         """
@@ -53,6 +100,18 @@ class Registry:
             raise KeyError(f"Hash key '{hash_key}' not found in registry.")
         return self._registry[hash_key]
 
+    def get_entry_view(self, hash_key: str) -> Mapping:
+        """
+        Retrieve a read-only view of the entry associated with the given hash key.
+        The view is not a copy, it reflects later changes to the entry, so callers that only read the entry
+        do not need to copy it defensively. Only the top level of the entry is read-only.
+
+        :param hash_key: str, the hash key to look up.
+        :return: Mapping, read-only view of the entry.
+        :raises KeyError: If the hash key is not present in the registry.
+        """
+        return MappingProxyType(self.get_entry(hash_key))
+
     def add_entry(self, hash_key: str, entry: dict) -> None:
         """
         Add a new entry to the registry.
@@ -65,7 +124,53 @@ class Registry:
         if hash_key in self._registry:
             raise KeyError(f"Hash key '{hash_key}' already exists in registry.")
 
-        self._registry[hash_key] = copy.deepcopy(entry)
+        self._insert_entry(hash_key, Registry._copy_entry(entry))
+
+    def _insert_entry(self, hash_key: str, entry: dict) -> None:
+        """
+        Insert a new entry into the registry without copying it, the registry takes ownership of the entry.
+        This is used by subclasses that generate the entry themselves, so a copy is not needed.
+
+        :param hash_key: str, the unique key for the entry, this must not already be present.
+        :param entry: dict, the entry data.
+        """
+
+        # keep the sorted keys current if they are in use, instead of sorting all keys again on the next lookup
+        is_sorted_keys_current = self._is_sorted_keys_current()
+        self._registry[hash_key] = entry
+        self._version += 1
+        if is_sorted_keys_current:
+            bisect.insort(self._sorted_keys, hash_key)
+            self._sorted_keys_version = self._version
+
+    def bulk_add_entries(self, items: Iterable[tuple[str, dict]], check_dup: bool = True) -> None:
+        """
+        Add many new entries to the registry at once.
+        Unlike add_entry the entries are not copied, the registry takes ownership of the entry dictionaries.
+
+        :param items: Iterable[tuple[str, dict]], (hash key, entry) pairs to add.
+        :param check_dup: bool, raise if a key already exists or is repeated in the items, default True.
+            If False, existing entries are replaced and the last of any repeated keys is kept.
+
+        :raises KeyError: If check_dup is True and a key already exists or is repeated, no entries are added.
+        """
+
+        item_list = list(items)
+        new_entries = dict(item_list)
+
+        if check_dup:
+            duplicate_keys = new_entries.keys() & self._registry.keys()
+            if len(new_entries) != len(item_list):
+                seen_keys = set()
+                for hash_key, _ in item_list:
+                    if hash_key in seen_keys:
+                        duplicate_keys.add(hash_key)
+                    seen_keys.add(hash_key)
+            if duplicate_keys:
+                raise KeyError(f"Hash keys {sorted(duplicate_keys)} already exist in registry.")
+
+        self._registry.update(new_entries)
+        self._version += 1
 
     def update_entry(self, hash_key: str, entry: dict) -> None:
         """
@@ -78,7 +183,8 @@ class Registry:
         if hash_key not in self._registry:
             raise KeyError(f"Hash key '{hash_key}' not found in registry.")
 
-        self._registry[hash_key] = copy.deepcopy(entry)
+        self._registry[hash_key] = Registry._copy_entry(entry)
+        self._version += 1
 
     def delete_entry(self, hash_key: str) -> None:
         """
@@ -92,12 +198,71 @@ class Registry:
             raise KeyError(f"Hash key '{hash_key}' not found in registry.")
 
         del self._registry[hash_key]
+        self._version += 1
+
+    @staticmethod
+    def _copy_entry(value):
+        """
+        Create a deep copy of a registry entry.
+
+        Registry entries are JSON-like, nested dictionaries and lists of strings, numbers, booleans and None.
+        These are copied directly, which is considerably faster than copy.deepcopy.
+        Any other value type falls back to copy.deepcopy.
+
+        :param value: the entry, or a value within the entry, to copy
+        :return: deep copy of the value
+        """
+
+        if isinstance(value, dict):
+            value_copy = {key: Registry._copy_entry(item) for key, item in value.items()}
+        elif isinstance(value, list):
+            value_copy = [Registry._copy_entry(item) for item in value]
+        elif value is None or isinstance(value, (str, int, float)):
+            value_copy = value  # immutable, bool is a subclass of int
+        else:
+            value_copy = copy.deepcopy(value)
+
+        return value_copy
 
-    def list_keys(self) -> list[str]:
+    def list_keys(self) -> KeysView[str]:
         """
-        Return a list of all keys in the registry.
+        Return a view of all keys in the registry.
+        The view is not copied, it reflects later changes to the registry.
+        Use list(...) on the result if a list is required.
         """
-        return list(self._registry.keys())
+        return self._registry.keys()
+
+    def _is_sorted_keys_current(self) -> bool:
+        """
+        Determine if the sorted keys match the registry.
+        The sorted keys are stale if the registry has been replaced or changed by a registry method since they were
+        built. Writing to the underlying dictionary directly does not mark them stale.
+
+        :return: bool, True if the sorted keys are current, False otherwise.
+        """
+        return self._sorted_keys_source is self._registry and self._sorted_keys_version == self._version
+
+    def find_keys_with_prefix(self, prefix: str) -> list[str]:
+        """
+        Find all keys starting with the given prefix, for example an abbreviated hash.
+        The keys are kept sorted between calls, so each lookup is a binary search.
+
+        :param prefix: str, the key prefix.
+        :return: list[str], the matching keys in sorted order.
+        """
+
+        if not self._is_sorted_keys_current():
+            self._sorted_keys = sorted(self._registry)
+            self._sorted_keys_source = self._registry
+            self._sorted_keys_version = self._version
+
+        sorted_keys = self._sorted_keys
+        start_index = bisect.bisect_left(sorted_keys, prefix)
+        end_index = start_index
+        while end_index < len(sorted_keys) and sorted_keys[end_index].startswith(prefix):
+            end_index += 1
+
+        return sorted_keys[start_index:end_index]
 
     def __len__(self):
         """
@@ -105,29 +270,143 @@ class Registry:
         """
         return len(self._registry)
 
-    def save(self, file_path: str) -> None:
+    def save(self, file_path: str, indent: Optional[int] = None) -> None:
         """
         Save the registry to a JSON file.
 
         :param file_path: str, the path to the output JSON file.
+        :param indent: int, optional indentation for human-readable output, default None.
+            If None, the registry is written in the compact form, which is faster to write and smaller on disk.
+            With orjson installed, the compact form and an indent of 2 are written by orjson.
+            Non-ASCII characters are written as UTF-8 rather than escaped, so both writers give the same bytes.
+        """
+
+        Registry._load_cache.pop(os.path.abspath(file_path), None)
+
+        if orjson is not None and indent in (None, 2):
+            orjson_option = orjson.OPT_INDENT_2 if indent == 2 else 0
+            with open(file_path, 'wb') as file_handle:
+                file_handle.write(orjson.dumps(self._registry, option=orjson_option))
+        elif indent is not None:
+            with open(file_path, 'w', encoding='utf-8', buffering=Registry._write_buffer_size) as file_handle:
+                json.dump(self._registry, file_handle, indent=indent, ensure_ascii=False)
+        else:
+            with open(file_path, 'w', encoding='utf-8', buffering=Registry._write_buffer_size) as file_handle:
+                json.dump(self._registry, file_handle, separators=(',', ':'), ensure_ascii=False)
+
+    def save_streaming(self, file_path: str) -> None:
+        """
+        Save the registry to a JSON file one entry at a time.
+        The file is identical to the compact form written by save, but the full JSON text of the registry
+        is never held in memory, which keeps peak memory low for very large registries.
+
+        :param file_path: str, the path to the output JSON file.
+        """
+
+        Registry._load_cache.pop(os.path.abspath(file_path), None)
+
+        if orjson is not None:
+            dumps = orjson.dumps
+        else:
+            def dumps(value) -> bytes:
+                return json.dumps(value, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+        with open(file_path, 'wb', buffering=Registry._write_buffer_size) as file_handle:
+            separator = b'{'
+            for hash_key, entry in self._registry.items():
+                file_handle.write(separator)
+                file_handle.write(dumps(hash_key))
+                file_handle.write(b':')
+                file_handle.write(dumps(entry))
+                separator = b','
+            file_handle.write(b'{}' if separator == b'{' else b'}')
+
+    @classmethod
+    def clear_load_cache(cls) -> None:
+        """
+        Remove all file contents cached by loads with use_cache=True.
         """
 
-        with open(file_path, 'w', encoding='utf-8') as file_handle:
-            json.dump(self._registry, file_handle, indent=4)
+        Registry._load_cache.clear()
 
-    def load(self, file_path: str) -> None:
+    def load(self, file_path: str, use_cache: bool = False) -> None:
         """
         Load the registry from a JSON file.
 
         :param file_path: str, the path to the input JSON file.
+        :param use_cache: bool, reuse the registry parsed by a previous cached load of the same file, default False.
+            The cached registry is reused only if the modification time and size of the file are unchanged,
+            the registry receives its own copy of the cached entries.
+            Only the most recently loaded files are kept, see _load_cache_max_entries and clear_load_cache.
+
+        :raises FileNotFoundError: If the file does not exist.
+        """
+
+        self.clear()
+
+        # open directly instead of checking is_file first, which saves a stat call
+        try:
+            with open(file_path, 'rb') as file_handle:
+                if use_cache:
+                    cache_key = os.path.abspath(file_path)
+                    file_stat = os.fstat(file_handle.fileno())
+                    cached = Registry._load_cache.get(cache_key)
+                    if cached is not None and cached[:2] == (file_stat.st_mtime_ns, file_stat.st_size):
+                        Registry._load_cache.move_to_end(cache_key)
+                        self._registry = Registry._copy_entry(cached[2])
+                        self._version += 1
+                        return
+                buffer = file_handle.read()
+        except (FileNotFoundError, IsADirectoryError):
+            raise FileNotFoundError(f"File '{file_path}' not found.")
+
+        if orjson is not None:
+            self._registry = orjson.loads(buffer)
+        else:
+            self._registry = json.loads(buffer)
+        self._version += 1
+
+        if use_cache:
+            Registry._load_cache[cache_key] = (file_stat.st_mtime_ns, file_stat.st_size,
+                                               Registry._copy_entry(self._registry))
+            Registry._load_cache.move_to_end(cache_key)
+            if len(Registry._load_cache) > Registry._load_cache_max_entries:
+                Registry._load_cache.popitem(last=False)
+
+    def save_binary(self, file_path: str) -> None:
+        """
+        Save the registry to a binary pickle file.
+        This is faster to write and read than JSON, use save for files exchanged with other tools.
+
+        :param file_path: str, the path to the output pickle file.
+        """
+
+        Registry._load_cache.pop(os.path.abspath(file_path), None)
+
+        with open(file_path, 'wb', buffering=Registry._write_buffer_size) as file_handle:
+            pickle.dump(self._registry, file_handle, protocol=5)
+
+    def load_binary(self, file_path: str) -> None:
+        """
+        Load the registry from a binary pickle file written by save_binary.
+        Loading a pickle file can execute arbitrary code, only load files produced by a trusted source.
+
+        :param file_path: str, the path to the input pickle file.
 
         :raises FileNotFoundError: If the file does not exist.
+        :raises TypeError: If the file does not contain a registry.
         """
 
         self.clear()
 
-        if not FileSystem.is_file(file_path):
+        try:
+            with open(file_path, 'rb') as file_handle:
+                registry = pickle.load(file_handle)
+        except (FileNotFoundError, IsADirectoryError):
             raise FileNotFoundError(f"File '{file_path}' not found.")
 
-        with open(file_path, 'r', encoding='utf-8') as file_handle:
-            self._registry = json.load(file_handle)
+        if not isinstance(registry, dict):
+            raise TypeError(f"File '{file_path}' does not contain a registry.")
+
+        self._registry = registry
+        self._version += 1
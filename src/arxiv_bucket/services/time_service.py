@@ -5,6 +5,12 @@
 # Licensed under the MIT License. See the LICENSE file for more details.
 
 from datetime import datetime
+from functools import lru_cache
+
+try:
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:  # pragma: no cover - optional dependency, fall back to the standard library parser
+    _parse_datetime = datetime.fromisoformat
 
 
 class TimeService:
@@ -20,9 +26,27 @@ class TimeService:
         :param iso_timestamp1: str, ISO timestamp
         :param iso_timestamp2: str, ISO timestamp
         :return: bool, True if the first timestamp is newer than the second, otherwise False.
+
+        :raises ValueError: if a timestamp is not a valid ISO timestamp.
         """
 
-        dt1 = datetime.fromisoformat(iso_timestamp1)
-        dt2 = datetime.fromisoformat(iso_timestamp2)
+        # the parse validates the timestamps and is cached, as the same timestamps recur
+        dt1 = TimeService._parse_iso_timestamp(iso_timestamp1)
+        dt2 = TimeService._parse_iso_timestamp(iso_timestamp2)
+
+        is_newer = dt1 > dt2
+
+        return is_newer
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_iso_timestamp(iso_timestamp: str) -> datetime:
+        """
+        Parse an ISO 8601 timestamp.
+        The results are cached, as the same timestamps recur when comparing manifests.
+
+        :param iso_timestamp: str, ISO timestamp
+        :return: datetime, parsed timestamp
+        """
 
-        return dt1 > dt2
+        return _parse_datetime(iso_timestamp)
@@ -0,0 +1,14 @@
+# File: conftest.py
+# Description: Unit test configurations for arXiv methods.
+#
+# Copyright (c) 2025 Jason Stuber
+# Licensed under the MIT License. See the LICENSE file for more details.
+
+import matplotlib
+
+def pytest_configure(config):
+    """
+    Select the non-interactive 'Agg' matplotlib backend once, before any test module imports pyplot.
+    This prevents plots from being displayed during testing.
+    """
+    matplotlib.use('Agg', force=True)
@@ -37,6 +37,16 @@ def test_parse_bulk_archive_filename_valid(filename, expected):
     """
     assert BulkArchiveHandler.parse_bulk_archive_filename(filename) == expected
 
+def test_parse_bulk_archive_filename_is_cached():
+    """
+    Test that repeated filenames are parsed once.
+    """
+    BulkArchiveHandler.parse_bulk_archive_filename.cache_clear()
+    for _ in range(3):
+        assert BulkArchiveHandler.is_bulk_archive_filename("/tmp/arXiv_src_9902_005.tar") is True
+    cache_info = BulkArchiveHandler.parse_bulk_archive_filename.cache_info()
+    assert (cache_info.hits, cache_info.misses) == (2, 1)
+
 @pytest.mark.parametrize(
     "filename",
     [
@@ -12,39 +12,71 @@
 # - https://arxiv.org/help/license
 # - https://info.arxiv.org/help/bulk_data_s3.html
 
+import os
+import threading
+from types import SimpleNamespace
 import pytest
 from arxiv_bucket.arxiv.bulk_archive_registry import BulkArchiveRegistry
+from arxiv_bucket.file import file_system as file_system_module
+from arxiv_bucket.file.file_system import FileSystem
+
+
+@pytest.fixture
+def registry():
+    """Create a new, empty bulk archive registry for each test."""
+    return BulkArchiveRegistry()
+
+
+@pytest.fixture
+def arxiv_mocks(mocker):
+    """Patch the file checks and entry generation used by registration, the file checks pass by default."""
+    return SimpleNamespace(
+        is_file=mocker.patch('arxiv_bucket.file.file_system.FileSystem.is_file', return_value=True),
+        is_bulk_archive_filename=mocker.patch(
+            'arxiv_bucket.arxiv.bulk_archive_handler.BulkArchiveHandler.is_bulk_archive_filename', return_value=True),
+        generate_registry_entry=mocker.patch(
+            'arxiv_bucket.arxiv.bulk_archive_handler.BulkArchiveHandler.generate_registry_entry'),
+    )
 
 
 class TestBulkArchiveRegistry:
     """Test cases for the BulkArchiveRegistry class."""
 
-    def setup_method(self):
-        """Set up test fixtures before each test method."""
-        self.registry = BulkArchiveRegistry()
-
-    def test_inheritance(self):
+    def test_inheritance(self, registry):
         """Test that BulkArchiveRegistry properly inherits from Registry."""
         from arxiv_bucket.services.registry import Registry
-        assert isinstance(self.registry, Registry)
+        assert isinstance(registry, Registry)
 
-    def test_add_entry_raises_attribute_error(self):
+    def test_add_entry_raises_attribute_error(self, registry):
         """Test that add_entry raises AttributeError to prevent direct access."""
         with pytest.raises(AttributeError) as exc_info:
-            self.registry.add_entry("test_key", {"test": "data"})
+            registry.add_entry("test_key", {"test": "data"})
         
         assert "Direct access to base class 'add_entry' is not allowed" in str(exc_info.value)
         assert "Use 'register_bulk_archive' instead" in str(exc_info.value)
 
-    def test_update_entry_raises_attribute_error(self):
+    @pytest.mark.parametrize("method_name", ["add_entry", "bulk_add_entries", "update_entry"])
+    def test_base_class_methods_absent(self, registry, method_name):
+        """Test that the base class methods for adding entries are reported as absent."""
+        assert not hasattr(registry, method_name)
+        assert hasattr(registry, 'delete_entry')
+
+    def test_bulk_add_entries_raises_attribute_error(self, registry):
+        """Test that bulk_add_entries raises AttributeError to prevent direct access."""
+        with pytest.raises(AttributeError) as exc_info:
+            registry.bulk_add_entries([("test_key", {"test": "data"})])
+
+        assert "Direct access to base class 'bulk_add_entries' is not allowed" in str(exc_info.value)
+
+    def test_update_entry_raises_attribute_error(self, registry):
         """Test that update_entry raises AttributeError to prevent direct access."""
         with pytest.raises(AttributeError) as exc_info:
-            self.registry.update_entry("test_key", {"test": "data"})
+            registry.update_entry("test_key", {"test": "data"})
         
         assert "Direct access to base class 'update_entry' is not allowed" in str(exc_info.value)
         assert "Use 'register_bulk_archive' instead" in str(exc_info.value)
 
-    def test_find_bulk_archive_filename_found(self, mocker):
+    def test_find_bulk_archive_filename_found(self, registry, mocker):
         """Test finding a bulk archive filename that exists in the registry."""
         mock_get_basename = mocker.patch('arxiv_bucket.file.file_name.FileName.get_file_basename')
         mock_get_basename.return_value = "arXiv_src_9902_005.tar"
@@ -54,20 +86,20 @@ class TestBulkArchiveRegistry:
                 'filename': 'arXiv_src_9902_005.tar'
             }
         }
-        self.registry._registry[test_key] = test_entry
-        result = self.registry.find_bulk_archive_filename("/path/to/arXiv_src_9902_005.tar")
+        registry._registry[test_key] = test_entry
+        result = registry.find_bulk_archive_filename("/path/to/arXiv_src_9902_005.tar")
         assert result == test_key
         mock_get_basename.assert_called_once_with("/path/to/arXiv_src_9902_005.tar")
 
-    def test_find_bulk_archive_filename_not_found(self, mocker):
+    def test_find_bulk_archive_filename_not_found(self, registry, mocker):
         """Test finding a bulk archive filename that doesn't exist in the registry."""
         mock_get_basename = mocker.patch('arxiv_bucket.file.file_name.FileName.get_file_basename')
         mock_get_basename.return_value = "nonexistent_file.tar"
-        result = self.registry.find_bulk_archive_filename("/path/to/nonexistent_file.tar")
+        result = registry.find_bulk_archive_filename("/path/to/nonexistent_file.tar")
         assert result is None
         mock_get_basename.assert_called_once_with("/path/to/nonexistent_file.tar")
 
-    def test_find_bulk_archive_filename_multiple_matches_returns_first(self, mocker):
+    def test_find_bulk_archive_filename_multiple_matches_returns_first(self, registry, mocker):
         """Test that when multiple entries match, the first one is returned."""
         mock_get_basename = mocker.patch('arxiv_bucket.file.file_name.FileName.get_file_basename')
         mock_get_basename.return_value = "arXiv_src_9902_005.tar"
@@ -78,160 +110,182 @@ class TestBulkArchiveRegistry:
                 'filename': 'arXiv_src_9902_005.tar'
             }
         }
-        self.registry._registry[test_key1] = test_entry
-        self.registry._registry[test_key2] = test_entry
-        result = self.registry.find_bulk_archive_filename("/path/to/arXiv_src_9902_005.tar")
+        registry._registry[test_key1] = test_entry
+        registry._registry[test_key2] = test_entry
+        result = registry.find_bulk_archive_filename("/path/to/arXiv_src_9902_005.tar")
         assert result in [test_key1, test_key2]
 
-    def test_register_bulk_archive_success(self, mocker):
+    def test_find_bulk_archive_filename_after_delete(self, registry):
+        """Test that the filename index follows deleted entries."""
+        test_entry = {'metadata': {'filename': 'arXiv_src_9902_005.tar'}}
+        registry._registry["test_key1"] = test_entry
+        registry._registry["test_key2"] = test_entry
+        assert registry.find_bulk_archive_filename("arXiv_src_9902_005.tar") == "test_key1"
+
+        registry.delete_entry("test_key1")
+        registry._insert_entry("test_key3", {'metadata': {'filename': 'arXiv_src_9902_006.tar'}})
+        assert registry.find_bulk_archive_filename("arXiv_src_9902_005.tar") == "test_key2"
+        assert registry.find_bulk_archive_filename("arXiv_src_9902_006.tar") == "test_key3"
+
+        registry.delete_entry("test_key2")
+        assert registry.find_bulk_archive_filename("arXiv_src_9902_005.tar") is None
+
+    def test_find_bulk_archive_filename_after_registry_replaced(self, registry):
+        """Test that the filename index is rebuilt when the registry is replaced, e.g. by load."""
+        registry._registry = {"test_key1": {'metadata': {'filename': 'arXiv_src_9902_005.tar'}}}
+        assert registry.find_bulk_archive_filename("arXiv_src_9902_005.tar") == "test_key1"
+
+        registry._registry = {"test_key2": {'metadata': {'filename': 'arXiv_src_9902_006.tar'}}}
+        assert registry.find_bulk_archive_filename("arXiv_src_9902_005.tar") is None
+        assert registry.find_bulk_archive_filename("arXiv_src_9902_006.tar") == "test_key2"
+
+    def test_find_bulk_archive_filename_after_clear_and_replace(self, registry):
+        """Test that the filename index follows clear and replaced entries when the number of entries is unchanged."""
+        registry._insert_entry("k1", {'metadata': {'filename': 'arXiv_src_0001_001.tar'}})
+        assert registry.find_bulk_archive_filename("arXiv_src_0001_001.tar") == "k1"
+
+        registry.clear()
+        registry._insert_entry("k2", {'metadata': {'filename': 'arXiv_src_0002_001.tar'}})
+        assert registry.find_bulk_archive_filename("arXiv_src_0001_001.tar") is None
+        assert registry.find_bulk_archive_filename("arXiv_src_0002_001.tar") == "k2"
+
+        registry.delete_entry("k2")
+        registry._insert_entry("k2", {'metadata': {'filename': 'arXiv_src_0003_001.tar'}})
+        assert registry.find_bulk_archive_filename("arXiv_src_0002_001.tar") is None
+        assert registry.find_bulk_archive_filename("arXiv_src_0003_001.tar") == "k2"
+
+    def test_register_bulk_archive_success(self, registry, arxiv_mocks, mocker):
         """Test successful registration of a bulk archive."""
         file_path = "/path/to/arXiv_src_9902_005.tar"
         test_key = "test_key"
         test_entry = {"metadata": {"filename": "arXiv_src_9902_005.tar"}}
         test_errors = []
-        mock_is_file = mocker.patch('arxiv_bucket.file.file_system.FileSystem.is_file')
-        mock_is_bulk_archive = mocker.patch('arxiv_bucket.arxiv.bulk_archive_handler.BulkArchiveHandler.is_bulk_archive_filename')
-        mock_generate_entry = mocker.patch('arxiv_bucket.arxiv.bulk_archive_handler.BulkArchiveHandler.generate_registry_entry')
-        mock_is_file.return_value = True
-        mock_is_bulk_archive.return_value = True
-        mock_generate_entry.return_value = (test_key, test_entry, test_errors)
-        mocker.patch.object(self.registry, 'find_bulk_archive_filename', return_value=None)
-        mocker.patch.object(self.registry, 'is_key_present', return_value=False)
-        self.registry.register_bulk_archive(file_path)
-        mock_is_file.assert_called_once_with(file_path)
-        mock_is_bulk_archive.assert_called_once_with(file_path)
-        mock_generate_entry.assert_called_once_with(file_path)
-        assert self.registry._registry[test_key] == test_entry
-
-    def test_register_bulk_archive_file_not_found(self, mocker):
+        arxiv_mocks.generate_registry_entry.return_value = (test_key, test_entry, test_errors)
+        mocker.patch.object(registry, 'find_bulk_archive_filename', return_value=None)
+        registry.register_bulk_archive(file_path)
+        arxiv_mocks.is_file.assert_called_once_with(file_path)
+        arxiv_mocks.is_bulk_archive_filename.assert_called_once_with(file_path)
+        arxiv_mocks.generate_registry_entry.assert_called_once_with(file_path)
+        assert registry._registry[test_key] == test_entry
+
+    def test_register_bulk_archive_caches_stat(self, registry, mocker, tmp_path):
+        """Test that the repeated existence checks during registration stat the file only once."""
+        file_path = str(tmp_path / "arXiv_src_9902_005.tar")
+        open(file_path, 'wb').close()
+        mock_stat = mocker.spy(os, 'stat')
+
+        def generate_registry_entry(path):
+            assert FileSystem.is_file(path)
+            return "test_key", {"metadata": {"filename": "arXiv_src_9902_005.tar"}}, []
+
+        mocker.patch('arxiv_bucket.arxiv.bulk_archive_handler.BulkArchiveHandler.generate_registry_entry',
+                     side_effect=generate_registry_entry)
+        registry.register_bulk_archive(file_path)
+        assert [call.args[0] for call in mock_stat.call_args_list].count(file_path) == 1
+        assert registry.is_key_present("test_key")
+
+    def test_register_bulk_archive_file_not_found(self, registry, arxiv_mocks):
         """Test registration fails when file does not exist."""
         file_path = "/path/to/nonexistent.tar"
-        mock_is_file = mocker.patch('arxiv_bucket.file.file_system.FileSystem.is_file')
-        mock_is_file.return_value = False
+        arxiv_mocks.is_file.return_value = False
         with pytest.raises(FileNotFoundError) as exc_info:
-            self.registry.register_bulk_archive(file_path)
+            registry.register_bulk_archive(file_path)
         assert f"File '{file_path}' not found" in str(exc_info.value)
-        mock_is_file.assert_called_once_with(file_path)
+        arxiv_mocks.is_file.assert_called_once_with(file_path)
 
-    def test_register_bulk_archive_invalid_filename(self, mocker):
+    def test_register_bulk_archive_invalid_filename(self, registry, arxiv_mocks):
         """Test registration fails when filename is not a valid bulk archive filename."""
         file_path = "/path/to/invalid_file.txt"
-        mock_is_file = mocker.patch('arxiv_bucket.file.file_system.FileSystem.is_file')
-        mock_is_bulk_archive = mocker.patch('arxiv_bucket.arxiv.bulk_archive_handler.BulkArchiveHandler.is_bulk_archive_filename')
-        mock_is_file.return_value = True
-        mock_is_bulk_archive.return_value = False
+        arxiv_mocks.is_bulk_archive_filename.return_value = False
         with pytest.raises(ValueError) as exc_info:
-            self.registry.register_bulk_archive(file_path)
+            registry.register_bulk_archive(file_path)
         assert f"File '{file_path}' is not a valid bulk archive filename" in str(exc_info.value)
-        mock_is_file.assert_called_once_with(file_path)
-        mock_is_bulk_archive.assert_called_once_with(file_path)
+        arxiv_mocks.is_file.assert_called_once_with(file_path)
+        arxiv_mocks.is_bulk_archive_filename.assert_called_once_with(file_path)
 
-    def test_register_bulk_archive_already_registered_by_filename(self, mocker):
+    def test_register_bulk_archive_already_registered_by_filename(self, registry, arxiv_mocks):
         """Test registration fails when file is already registered."""
         file_path = "/path/to/arXiv_src_9902_005.tar"
-        mock_is_file = mocker.patch('arxiv_bucket.file.file_system.FileSystem.is_file')
-        mock_is_bulk_archive = mocker.patch('arxiv_bucket.arxiv.bulk_archive_handler.BulkArchiveHandler.is_bulk_archive_filename')
-        mock_is_file.return_value = True
-        mock_is_bulk_archive.return_value = True
-        mocker.patch.object(self.registry, 'find_bulk_archive_filename', return_value="existing_key")
+        registry._registry["existing_key"] = {"metadata": {"filename": "arXiv_src_9902_005.tar"}}
         with pytest.raises(ValueError) as exc_info:
-            self.registry.register_bulk_archive(file_path)
+            registry.register_bulk_archive(file_path)
         assert f"File '{file_path}' is already registered" in str(exc_info.value)
+        arxiv_mocks.generate_registry_entry.assert_not_called()
 
-    def test_register_bulk_archive_key_already_exists(self, mocker):
+    def test_register_bulk_archive_key_already_exists(self, registry, mocker):
         pass
 
-    def test_register_bulk_archive_with_errors(self, mocker):
+    def test_register_bulk_archive_with_errors(self, registry, arxiv_mocks, mocker):
         """Test registration fails when bulk archive has errors."""
         file_path = "/path/to/arXiv_src_9902_005.tar"
         test_key = "test_key"
         test_entry = {"metadata": {"filename": "arXiv_src_9902_005.tar"}}
         test_errors = ["Error 1", "Error 2"]
-        mock_is_file = mocker.patch('arxiv_bucket.file.file_system.FileSystem.is_file')
-        mock_is_bulk_archive = mocker.patch('arxiv_bucket.arxiv.bulk_archive_handler.BulkArchiveHandler.is_bulk_archive_filename')
-        mock_generate_entry = mocker.patch('arxiv_bucket.arxiv.bulk_archive_handler.BulkArchiveHandler.generate_registry_entry')
-        mock_is_file.return_value = True
-        mock_is_bulk_archive.return_value = True
-        mock_generate_entry.return_value = (test_key, test_entry, test_errors)
-        mocker.patch.object(self.registry, 'find_bulk_archive_filename', return_value=None)
-        mocker.patch.object(self.registry, 'is_key_present', return_value=False)
+        arxiv_mocks.generate_registry_entry.return_value = (test_key, test_entry, test_errors)
+        mocker.patch.object(registry, 'find_bulk_archive_filename', return_value=None)
         with pytest.raises(ValueError) as exc_info:
-            self.registry.register_bulk_archive(file_path)
+            registry.register_bulk_archive(file_path)
         assert f"Bulk archive '{file_path}' has errors: {test_errors}" in str(exc_info.value)
 
-    def test_find_bulk_archive_filename_empty_registry(self, mocker):
+    def test_find_bulk_archive_filename_empty_registry(self, registry, mocker):
         """Test finding a filename in an empty registry returns None."""
         mocker.patch('arxiv_bucket.file.file_name.FileName.get_file_basename', return_value="test.tar")
-        result = self.registry.find_bulk_archive_filename("/path/to/test.tar")
+        result = registry.find_bulk_archive_filename("/path/to/test.tar")
         assert result is None
 
-    def test_find_bulk_archive_filename_entry_without_metadata(self, mocker):
+    def test_find_bulk_archive_filename_entry_without_metadata(self, registry, mocker):
         """Test finding a filename when registry entry doesn't have expected metadata structure."""
         mock_get_basename = mocker.patch('arxiv_bucket.file.file_name.FileName.get_file_basename')
         mock_get_basename.return_value = "test.tar"
         test_key = "test_key"
-        self.registry._registry[test_key] = {"invalid": "structure"}
-        result = self.registry.find_bulk_archive_filename("/path/to/test.tar")
+        registry._registry[test_key] = {"invalid": "structure"}
+        result = registry.find_bulk_archive_filename("/path/to/test.tar")
         assert result is None
 
-    def test_registry_starts_empty(self):
+    def test_registry_starts_empty(self, registry):
         """Test that a new registry instance starts with an empty registry."""
-        assert len(self.registry._registry) == 0
+        assert len(registry._registry) == 0
 
-    def test_inherited_methods_accessible(self):
+    def test_inherited_methods_accessible(self, registry):
         """Test that inherited methods from Registry base class are accessible."""
         # These methods should be accessible from the base class
-        assert hasattr(self.registry, 'is_key_present')
-        assert hasattr(self.registry, 'get_entry')
-        assert hasattr(self.registry, 'clear')
+        assert hasattr(registry, 'is_key_present')
+        assert hasattr(registry, 'get_entry')
+        assert hasattr(registry, 'clear')
         
         # Test that base class methods work
-        assert self.registry.is_key_present("nonexistent") is False
+        assert registry.is_key_present("nonexistent") is False
 
-    def test_register_bulk_archive_key_already_exists_same_metadata(self, mocker):
+    def test_register_bulk_archive_key_already_exists_same_metadata(self, registry, arxiv_mocks, mocker):
         """If the key exists and metadata is the same, do nothing (ignore)."""
         file_path = "/path/to/arXiv_src_9902_005.tar"
         test_key = "existing_key"
         test_entry = {"metadata": {"filename": "arXiv_src_9902_005.tar"}}
         test_errors = []
-        mock_is_file = mocker.patch('arxiv_bucket.file.file_system.FileSystem.is_file')
-        mock_is_bulk_archive = mocker.patch('arxiv_bucket.arxiv.bulk_archive_handler.BulkArchiveHandler.is_bulk_archive_filename')
-        mock_generate_entry = mocker.patch('arxiv_bucket.arxiv.bulk_archive_handler.BulkArchiveHandler.generate_registry_entry')
-        mock_is_file.return_value = True
-        mock_is_bulk_archive.return_value = True
-        mock_generate_entry.return_value = (test_key, test_entry, test_errors)
-        self.registry._registry[test_key] = {"metadata": {"filename": "arXiv_src_9902_005.tar"}}
-        mocker.patch.object(self.registry, 'find_bulk_archive_filename', return_value=None)
-        self.registry.register_bulk_archive(file_path)
-        existing_entry = self.registry._registry[test_key]
+        arxiv_mocks.generate_registry_entry.return_value = (test_key, test_entry, test_errors)
+        registry._registry[test_key] = {"metadata": {"filename": "arXiv_src_9902_005.tar"}}
+        mocker.patch.object(registry, 'find_bulk_archive_filename', return_value=None)
+        registry.register_bulk_archive(file_path)
+        existing_entry = registry._registry[test_key]
         assert "diagnostics" not in existing_entry
 
-    def test_register_bulk_archive_key_already_exists_conflict(self, mocker):
+    def test_register_bulk_archive_key_already_exists_conflict(self, registry, arxiv_mocks, mocker):
         """If the key exists and metadata is different, should raise KeyError."""
         file_path = "/path/to/arXiv_src_9902_005.tar"
         test_key = "existing_key"
         test_entry = {"metadata": {"filename": "arXiv_src_9902_005.tar"}}
         test_errors = []
-        mock_is_file = mocker.patch('arxiv_bucket.file.file_system.FileSystem.is_file')
-        mock_is_bulk_archive = mocker.patch('arxiv_bucket.arxiv.bulk_archive_handler.BulkArchiveHandler.is_bulk_archive_filename')
-        mock_generate_entry = mocker.patch('arxiv_bucket.arxiv.bulk_archive_handler.BulkArchiveHandler.generate_registry_entry')
-        mock_is_file.return_value = True
-        mock_is_bulk_archive.return_value = True
-        mock_generate_entry.return_value = (test_key, test_entry, test_errors)
-        self.registry._registry[test_key] = {"metadata": {"filename": "something_else.tar"}}
-        mocker.patch.object(self.registry, 'find_bulk_archive_filename', return_value=None)
+        arxiv_mocks.generate_registry_entry.return_value = (test_key, test_entry, test_errors)
+        registry._registry[test_key] = {"metadata": {"filename": "something_else.tar"}}
+        mocker.patch.object(registry, 'find_bulk_archive_filename', return_value=None)
         with pytest.raises(KeyError):
-            self.registry.register_bulk_archive(file_path)
+            registry.register_bulk_archive(file_path)
 
 
 class TestBulkArchiveRegistryIntegration:
     """Integration tests for BulkArchiveRegistry with real method calls."""
 
-    def setup_method(self):
-        """Set up test fixtures before each test method."""
-        self.registry = BulkArchiveRegistry()
-
-    def test_register_and_find_integration(self, mocker):
+    def test_register_and_find_integration(self, registry, arxiv_mocks, mocker):
         """Test the integration between register_bulk_archive and find_bulk_archive_filename."""
         file_path = "/path/to/arXiv_src_9902_005.tar"
         basename = "arXiv_src_9902_005.tar"
@@ -239,15 +293,153 @@ class TestBulkArchiveRegistryIntegration:
         test_entry = {"metadata": {"filename": basename}}
         test_errors = []
         mock_get_basename = mocker.patch('arxiv_bucket.file.file_name.FileName.get_file_basename')
-        mock_is_file = mocker.patch('arxiv_bucket.file.file_system.FileSystem.is_file')
-        mock_is_bulk_archive = mocker.patch('arxiv_bucket.arxiv.bulk_archive_handler.BulkArchiveHandler.is_bulk_archive_filename')
-        mock_generate_entry = mocker.patch('arxiv_bucket.arxiv.bulk_archive_handler.BulkArchiveHandler.generate_registry_entry')
         mock_get_basename.return_value = basename
-        mock_is_file.return_value = True
-        mock_is_bulk_archive.return_value = True
-        mock_generate_entry.return_value = (test_key, test_entry, test_errors)
-        self.registry.register_bulk_archive(file_path)
-        found_key = self.registry.find_bulk_archive_filename(file_path)
+        arxiv_mocks.generate_registry_entry.return_value = (test_key, test_entry, test_errors)
+        registry.register_bulk_archive(file_path)
+        assert registry._filename_index == {basename: test_key}
+        found_key = registry.find_bulk_archive_filename(file_path)
         assert found_key == test_key
-        assert self.registry.is_key_present(test_key)
-        assert self.registry.get_entry(test_key) == test_entry
+        assert registry.is_key_present(test_key)
+        assert registry.get_entry(test_key) == test_entry
+
+    def test_register_many_builds_filename_index_once(self, registry, arxiv_mocks):
+        """Test that successive registrations update the filename index instead of rebuilding it."""
+        arxiv_mocks.generate_registry_entry.side_effect = [
+            (f"key{index}", {"metadata": {"filename": f"arXiv_src_9902_00{index}.tar"}}, []) for index in range(3)
+        ]
+
+        registry.register_bulk_archive("/path/to/arXiv_src_9902_000.tar")
+        filename_index = registry._filename_index
+        registry.register_bulk_archive("/path/to/arXiv_src_9902_001.tar")
+        registry.register_bulk_archive("/path/to/arXiv_src_9902_002.tar")
+
+        assert registry._filename_index is filename_index
+        assert filename_index == {f"arXiv_src_9902_00{index}.tar": f"key{index}" for index in range(3)}
+        with pytest.raises(ValueError):
+            registry.register_bulk_archive("/other/path/arXiv_src_9902_001.tar")
+
+
+class TestBulkArchiveRegistryBatch:
+    """Test cases for registering several bulk archives at once."""
+
+    @pytest.fixture
+    def mock_handler(self, arxiv_mocks):
+        """Mock the file checks and generate entries from the filenames."""
+
+        def generate_registry_entry(file_path):
+            basename = os.path.basename(file_path)
+            return f"key_{basename}", {"metadata": {"filename": basename}}, []
+
+        arxiv_mocks.generate_registry_entry.side_effect = generate_registry_entry
+        return arxiv_mocks.generate_registry_entry
+
+    def test_register_bulk_archives(self, registry, mock_handler):
+        """Test that all bulk archives are registered and can be found."""
+        file_path_list = [f"/path/to/arXiv_src_9902_00{index}.tar" for index in range(3)]
+        registry.register_bulk_archives(iter(file_path_list))
+        assert registry.list_keys() == {f"key_arXiv_src_9902_00{index}.tar" for index in range(3)}
+        for file_path in file_path_list:
+            assert registry.find_bulk_archive_filename(file_path) == f"key_{os.path.basename(file_path)}"
+        assert mock_handler.call_count == 3
+
+    def test_register_bulk_archives_concurrent(self, registry, arxiv_mocks):
+        """Test that the registry entries are generated concurrently."""
+        barrier = threading.Barrier(2, timeout=10)
+
+        def generate_registry_entry(file_path):
+            barrier.wait()  # both files must be in progress at the same time
+            basename = os.path.basename(file_path)
+            return f"key_{basename}", {"metadata": {"filename": basename}}, []
+
+        arxiv_mocks.generate_registry_entry.side_effect = generate_registry_entry
+        registry.register_bulk_archives(["/path/to/arXiv_src_9902_000.tar", "/path/to/arXiv_src_9902_001.tar"],
+                                        max_workers=2)
+        assert list(registry.list_keys()) == ["key_arXiv_src_9902_000.tar", "key_arXiv_src_9902_001.tar"]
+
+    @pytest.mark.parametrize("max_workers", [None, 1])
+    def test_register_bulk_archives_stat_cache_in_workers(self, registry, arxiv_mocks, max_workers):
+        """Test that each registry entry is generated within a stat_cache context of its own thread."""
+        is_stat_cache_active = []
+
+        def generate_registry_entry(file_path):
+            is_stat_cache_active.append(getattr(file_system_module._stat_cache_local, 'entries', None) is not None)
+            basename = os.path.basename(file_path)
+            return f"key_{basename}", {"metadata": {"filename": basename}}, []
+
+        arxiv_mocks.generate_registry_entry.side_effect = generate_registry_entry
+        registry.register_bulk_archives(["/path/to/arXiv_src_9902_000.tar", "/path/to/arXiv_src_9902_001.tar"],
+                                        max_workers=max_workers)
+        assert is_stat_cache_active == [True, True]
+
+    def test_register_bulk_archives_single_worker(self, registry, mocker, mock_handler):
+        """Test that a single worker generates the entries in the calling thread."""
+        mock_executor = mocker.patch('arxiv_bucket.arxiv.bulk_archive_registry.ThreadPoolExecutor')
+        registry.register_bulk_archives(["/path/to/arXiv_src_9902_000.tar"], max_workers=1)
+        mock_executor.assert_not_called()
+        assert registry.list_keys() == {"key_arXiv_src_9902_000.tar"}
+
+    def test_register_bulk_archives_empty(self, registry, mock_handler):
+        """Test that an empty batch does nothing."""
+        registry.register_bulk_archives([])
+        assert len(registry) == 0
+        mock_handler.assert_not_called()
+
+    def test_register_bulk_archives_file_not_found(self, registry, arxiv_mocks, mock_handler):
+        """Test that nothing is registered if a file does not exist."""
+        arxiv_mocks.is_file.side_effect = lambda path: 'missing' not in path
+        with pytest.raises(FileNotFoundError):
+            registry.register_bulk_archives(["/path/to/arXiv_src_9902_000.tar", "/missing/arXiv_src_9902_001.tar"])
+        assert len(registry) == 0
+        mock_handler.assert_not_called()
+
+    def test_register_bulk_archives_invalid_filename(self, registry, arxiv_mocks, mock_handler):
+        """Test that nothing is registered if a filename is not a bulk archive filename."""
+        arxiv_mocks.is_bulk_archive_filename.side_effect = lambda path: path.endswith('.tar')
+        with pytest.raises(ValueError, match="not a valid bulk archive filename"):
+            registry.register_bulk_archives(["/path/to/arXiv_src_9902_000.tar", "/path/to/other.txt"])
+        assert len(registry) == 0
+
+    @pytest.mark.parametrize("file_path_list", [
+        ["/path/to/arXiv_src_9902_000.tar", "/other/arXiv_src_9902_000.tar"],
+        ["/path/to/arXiv_src_9902_001.tar", "/path/to/arXiv_src_9902_005.tar"],
+    ])
+    def test_register_bulk_archives_already_registered(self, registry, mock_handler, file_path_list):
+        """Test that a filename already in the registry or repeated in the batch is rejected."""
+        registry._registry["existing_key"] = {"metadata": {"filename": "arXiv_src_9902_005.tar"}}
+        with pytest.raises(ValueError, match="is already registered"):
+            registry.register_bulk_archives(file_path_list)
+        assert registry.list_keys() == {"existing_key"}
+        mock_handler.assert_not_called()
+
+    def test_register_bulk_archives_with_errors(self, registry, mock_handler):
+        """Test that nothing is registered if a bulk archive has errors."""
+        mock_handler.side_effect = [
+            ("key0", {"metadata": {"filename": "arXiv_src_9902_000.tar"}}, []),
+            ("key1", {"metadata": {"filename": "arXiv_src_9902_001.tar"}}, ["Error 1"]),
+        ]
+        with pytest.raises(ValueError, match="has errors"):
+            registry.register_bulk_archives(["/path/to/arXiv_src_9902_000.tar", "/path/to/arXiv_src_9902_001.tar"])
+        assert len(registry) == 0
+
+    def test_register_bulk_archives_key_conflict(self, registry, mock_handler):
+        """Test that a key registered with a different entry raises KeyError."""
+        mock_handler.side_effect = [
+            ("key0", {"metadata": {"filename": "arXiv_src_9902_000.tar"}}, []),
+            ("key0", {"metadata": {"filename": "arXiv_src_9902_001.tar"}}, []),
+        ]
+        with pytest.raises(KeyError):
+            registry.register_bulk_archives(["/path/to/arXiv_src_9902_000.tar", "/path/to/arXiv_src_9902_001.tar"])
+        assert len(registry) == 0
+
+    def test_register_bulk_archives_identical_entry(self, registry, mock_handler):
+        """Test that a key already registered with an identical entry is skipped."""
+        registry._registry["key0"] = {"metadata": {"filename": "other.tar"}}
+        mock_handler.side_effect = [
+            ("key0", {"metadata": {"filename": "other.tar"}}, []),
+            ("key1", {"metadata": {"filename": "arXiv_src_9902_001.tar"}}, []),
+        ]
+        registry.register_bulk_archives(["/path/to/arXiv_src_9902_000.tar", "/path/to/arXiv_src_9902_001.tar"])
+        assert registry._registry == {
+            "key0": {"metadata": {"filename": "other.tar"}},
+            "key1": {"metadata": {"filename": "arXiv_src_9902_001.tar"}},
+        }
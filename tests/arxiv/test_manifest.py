@@ -12,18 +12,24 @@
 # - https://arxiv.org/help/license
 # - https://info.arxiv.org/help/bulk_data_s3.html
 
-import copy
+import hashlib
+from matplotlib.figure import Figure
 import matplotlib.pyplot as plt
 import os
 import pytest
-import tempfile
-import warnings
+from types import MappingProxyType
 
 from arxiv_bucket.arxiv.manifest import Manifest
+from arxiv_bucket.file.file_name import FileName
+from arxiv_bucket.file.file_system import FileSystem
+from arxiv_bucket.file.handler.xml_handler import XmlHandler
 
-# Sample valid xml_dict
-valid_xml_dict = {
-    'arXivSRC': {
+def _make_xml_dict(omit=(), **overrides):
+    """
+    Build a sample xml_dict from scratch, dropping the 'arXivSRC' keys in omit
+    and replacing 'arXivSRC' values with the keyword overrides.
+    """
+    arxiv_src = {
         'file': [
             {
                 'content_md5sum': 'cacbfede21d5dfef26f367ec99384546',
@@ -38,9 +44,15 @@ valid_xml_dict = {
                 'yymm': '0001'
             }
         ],
-        'timestamp': '2010-12-23 00:00:00'
+        'timestamp': '2010-12-23 00:00:00',
+        **overrides
     }
-}
+    for key in omit:
+        del arxiv_src[key]
+    return {'arXivSRC': arxiv_src}
+
+# Sample valid xml_dict, read-only since it is shared, tests needing a variant use _make_xml_dict
+VALID_XML_DICT = MappingProxyType({'arXivSRC': MappingProxyType(_make_xml_dict()['arXivSRC'])})
 
 def test_manifest_constructor():
     """
@@ -110,7 +122,7 @@ def test_is_arxiv_keys_present_with_valid_data():
     """
     Test that the method returns True for a valid xml_dict.
     """
-    assert Manifest._is_arxiv_keys_present(valid_xml_dict) is True
+    assert Manifest._is_arxiv_keys_present(VALID_XML_DICT) is True
 
 def test_is_arxiv_keys_present_with_missing_top_level_key():
     """
@@ -124,13 +136,11 @@ def test_is_arxiv_keys_present_with_missing_arxivsrc_keys():
     Test that the method returns False when 'arXivSRC' keys are missing.
     """
 
-    invalid_dict = copy.deepcopy(valid_xml_dict)
-    del invalid_dict['arXivSRC']['file']
+    invalid_dict = _make_xml_dict(omit=['file'])
 
     assert Manifest._is_arxiv_keys_present(invalid_dict) is False
 
-    invalid_dict = copy.deepcopy(valid_xml_dict)
-    del invalid_dict['arXivSRC']['timestamp']
+    invalid_dict = _make_xml_dict(omit=['timestamp'])
 
     assert Manifest._is_arxiv_keys_present(invalid_dict) is False
 
@@ -139,8 +149,7 @@ def test_is_arxiv_keys_valid_with_non_string_value_in_timestamp():
     """
     Test that the method returns False when a value in 'file' is not a string.
     """
-    invalid_dict = copy.deepcopy(valid_xml_dict)
-    invalid_dict['arXivSRC']['timestamp'] = 1234  # should be a string
+    invalid_dict = _make_xml_dict(timestamp=1234)  # should be a string
 
     assert Manifest._is_arxiv_keys_present(invalid_dict) is False
 
@@ -220,121 +229,79 @@ def test_convert_arxiv_file_entry_timestamp_to_iso():
     assert result == expected_output
 
 
-def test_convert_arxiv_timestamp_to_iso_invalid_format():
+@pytest.mark.parametrize("input_timestamp", [
+    'Invalid Timestamp',
+    'Foo Apr  7 04:58:03 2025',  # unknown weekday
+    'Mon Foo  7 04:58:03 2025',  # unknown month
+    'Mon Apr  7 04-58-03 2025',  # wrong time separators
+    'Mon Apr  x 04:58:03 2025',  # non-numeric day
+    'Mon Apr 31 04:58:03 2025',  # day out of range
+    'Mon Apr +7 04:58:03 2025',  # signed day
+    'Mon Apr  7 04:58:03 +2025',  # signed year
+    'Mon Apr  7 +4:58:03 2025',  # signed hour
+    'Mon Apr  \u0667 04:58:03 2025',  # non-ASCII digit
+])
+def test_convert_arxiv_timestamp_to_iso_invalid_format(input_timestamp):
     """
     Test _convert_arxiv_timestamp_to_iso method with an invalid timestamp format.
     """
-    # Invalid input timestamp
-    input_timestamp = 'Invalid Timestamp'
-
     # Assert that a ValueError is raised
     with pytest.raises(ValueError):
         Manifest._convert_arxiv_timestamp_to_iso(input_timestamp)
 
 
-def test_convert_arxiv_file_entry_timestamp_to_iso_invalid_format():
+@pytest.mark.parametrize("input_timestamp", [
+    'Invalid Timestamp',
+    '2010/12/23 00:13:59',  # wrong date separators
+    '2010-12-23T00:13:59',  # wrong date and time separator
+    '2010-12-23 00.13.59',  # wrong time separators
+    '2010-1x-23 00:13:59',  # non-numeric month
+    '2010-13-23 00:13:59',  # month out of range
+    '2010-12-23 +0:13:59',  # signed hour
+    '2010-12-23 0 :13:59',  # space in hour
+    '+010-12-23 00:13:59',  # signed year
+    '2010-12-\u0662\u0663 00:13:59',  # non-ASCII digits
+])
+def test_convert_arxiv_file_entry_timestamp_to_iso_invalid_format(input_timestamp):
     """
     Test _convert_arxiv_file_timestamp_to_iso method with an invalid timestamp format.
     """
-    # Invalid input timestamp
-    input_timestamp = 'Invalid Timestamp'
-
     # Assert that a ValueError is raised
     with pytest.raises(ValueError):
         Manifest._convert_arxiv_file_entry_timestamp_to_iso(input_timestamp)
 
 
-def test_is_file_entry_consistent_valid_entry():
-    """
-    Test _is_file_entry_consistent with a valid file entry.
-    """
-    valid_entry = {
-        'content_md5sum': '5f4774a944c17e67f334ebb9bf912dbf',
-        'filename': 'src/arXiv_src_1508_002.tar',
-        'first_item': '1508.00577',
-        'last_item': '1508.01014',
-        'md5sum': '271195f030a45b84d397dc8c540bde7f',
-        'num_items': '438',
-        'seq_num': '2',
-        'size': '537749445',
-        'timestamp': '2017-08-05 06:13:16',
-        'yymm': '1508'
-    }
-    assert Manifest._is_file_entry_consistent(valid_entry) is True
-
-
-def test_is_file_entry_consistent_invalid_filename():
-    """
-    Test _is_file_entry_consistent with an invalid filename.
-    """
-    invalid_entry = {
-        'content_md5sum': '5f4774a944c17e67f334ebb9bf912dbf',
-        'filename': 'src/invalid_filename.tar',
-        'first_item': '1508.00577',
-        'last_item': '1508.01014',
-        'md5sum': '271195f030a45b84d397dc8c540bde7f',
-        'num_items': '438',
-        'seq_num': '2',
-        'size': '537749445',
-        'timestamp': '2017-08-05 06:13:16',
-        'yymm': '1508'
-    }
-    assert Manifest._is_file_entry_consistent(invalid_entry) is False
+BASE_ENTRY = {
+    'content_md5sum': '5f4774a944c17e67f334ebb9bf912dbf',
+    'filename': 'src/arXiv_src_1508_002.tar',
+    'first_item': '1508.00577',
+    'last_item': '1508.01014',
+    'md5sum': '271195f030a45b84d397dc8c540bde7f',
+    'num_items': '438',
+    'seq_num': '2',
+    'size': '537749445',
+    'timestamp': '2017-08-05 06:13:16',
+    'yymm': '1508'
+}
 
-def test_is_file_entry_consistent_invalid_month():
+@pytest.mark.parametrize("overrides, expected", [
+    ({}, True),
+    ({'filename': 'src/invalid_filename.tar'}, False),
+    ({'yymm': '1513'}, False),  # invalid month
+    ({'filename': 'src/arXiv_src_1508_003.tar'}, False),  # seq_num mismatch
+])
+def test_is_file_entry_consistent(overrides, expected):
     """
-    Test _is_file_entry_consistent with an invalid month in 'yymm'.
+    Test _is_file_entry_consistent with valid and invalid file entries.
     """
-    invalid_entry = {
-        'content_md5sum': '5f4774a944c17e67f334ebb9bf912dbf',
-        'filename': 'src/arXiv_src_1508_002.tar',
-        'first_item': '1508.00577',
-        'last_item': '1508.01014',
-        'md5sum': '271195f030a45b84d397dc8c540bde7f',
-        'num_items': '438',
-        'seq_num': '2',
-        'size': '537749445',
-        'timestamp': '2017-08-05 06:13:16',
-        'yymm': '1513'  # Invalid month
-    }
-    assert Manifest._is_file_entry_consistent(invalid_entry) is False
-
-def test_is_file_entry_consistent_invalid_seq_num():
-    """
-    Test _is_file_entry_consistent with an invalid sequence number in the filename.
-    """
-    invalid_entry = {
-        'content_md5sum': '5f4774a944c17e67f334ebb9bf912dbf',
-        'filename': 'src/arXiv_src_1508_003.tar',  # seq_num mismatch
-        'first_item': '1508.00577',
-        'last_item': '1508.01014',
-        'md5sum': '271195f030a45b84d397dc8c540bde7f',
-        'num_items': '438',
-        'seq_num': '2',
-        'size': '537749445',
-        'timestamp': '2017-08-05 06:13:16',
-        'yymm': '1508'
-    }
-    assert Manifest._is_file_entry_consistent(invalid_entry) is False
+    entry = {**BASE_ENTRY, **overrides}
+    assert Manifest._is_file_entry_consistent(entry) is expected
 
 def test_process_file_entry_valid():
     """
     Test _process_file_entry with a valid file entry.
     """
-    valid_entry = {
-        'content_md5sum': '5f4774a944c17e67f334ebb9bf912dbf',
-        'filename': 'src/arXiv_src_1508_002.tar',
-        'first_item': '1508.00577',
-        'last_item': '1508.01014',
-        'md5sum': '271195f030a45b84d397dc8c540bde7f',
-        'num_items': '438',
-        'seq_num': '2',
-        'size': '537749445',
-        'timestamp': '2017-08-05 06:13:16',
-        'yymm': '1508'
-    }
-
-    processed_entry = Manifest._process_file_entry(valid_entry)
+    processed_entry = Manifest._process_file_entry(BASE_ENTRY)
 
     assert processed_entry == {
         'filename': 'src/arXiv_src_1508_002.tar',
@@ -350,52 +317,35 @@ def test_process_file_entry_valid():
         }
     }
 
-def test_process_file_entry_inconsistent():
-    """
-    Test _process_file_entry with an inconsistent file entry.
-    """
-    inconsistent_entry = {
-        'content_md5sum': '5f4774a944c17e67f334ebb9bf912dbf',
-        'filename': 'src/arXiv_src_1508_003.tar',  # seq_num mismatch
-        'first_item': '1508.00577',
-        'last_item': '1508.01014',
-        'md5sum': '271195f030a45b84d397dc8c540bde7f',
-        'num_items': '438',
-        'seq_num': '2',
-        'size': '537749445',
-        'timestamp': '2017-08-05 06:13:16',
-        'yymm': '1508'
-    }
-
-    with pytest.raises(ValueError, match="Entry inconsistent"):
-        Manifest._process_file_entry(inconsistent_entry)
-
-def test_process_file_entry_invalid_yymm():
-    """
-    Test _process_file_entry with an invalid 'yymm' value.
-    """
-    invalid_entry = {
-        'content_md5sum': '5f4774a944c17e67f334ebb9bf912dbf',
-        'filename': 'src/arXiv_src_1513_002.tar',  # Invalid month
-        'first_item': '1508.00577',
-        'last_item': '1508.01014',
-        'md5sum': '271195f030a45b84d397dc8c540bde7f',
-        'num_items': '438',
-        'seq_num': '2',
-        'size': '537749445',
-        'timestamp': '2017-08-05 06:13:16',
-        'yymm': '1513'
-    }
+@pytest.mark.parametrize("yymm, expected_year, expected_month", [
+    ('9108', 1991, 8),
+    ('9912', 1999, 12),
+    ('0001', 2000, 1),
+    ('9001', 2090, 1),
+])
+def test_process_file_entry_year_month(yymm, expected_year, expected_month):
+    """
+    Test that _process_file_entry converts yymm to the year and month, with years after 90 in the 1900s.
+    """
+    entry = {**BASE_ENTRY, 'yymm': yymm, 'filename': f'src/arXiv_src_{yymm}_002.tar'}
+    processed_entry = Manifest._process_file_entry(entry)
 
-    with pytest.raises(ValueError, match="Entry inconsistent"):
-        Manifest._process_file_entry(invalid_entry)
+    assert (processed_entry['year'], processed_entry['month']) == (expected_year, expected_month)
 
-@pytest.fixture
-def valid_xml_file():
+@pytest.mark.parametrize("overrides", [
+    {'filename': 'src/arXiv_src_1508_003.tar'},  # seq_num mismatch
+    {'filename': 'src/arXiv_src_1513_002.tar', 'yymm': '1513'},  # invalid month
+])
+def test_process_file_entry_inconsistent(overrides):
     """
-    Create a temporary XML file with valid arXiv data for testing.
+    Test _process_file_entry with inconsistent file entries.
     """
-    xml_content = """<arXivSRC>
+    entry = {**BASE_ENTRY, **overrides}
+
+    with pytest.raises(ValueError, match="Entry inconsistent"):
+        Manifest._process_file_entry(entry)
+
+VALID_XML_BYTES = b"""<arXivSRC>
         <timestamp>Mon Apr  7 04:58:03 2025</timestamp>
         <file>
             <content_md5sum>cacbfede21d5dfef26f367ec99384546</content_md5sum>
@@ -422,11 +372,71 @@ def valid_xml_file():
             <yymm>0002</yymm>
         </file>
     </arXivSRC>"""
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".xml") as temp_file:
-        temp_file.write(xml_content.encode('utf-8'))
-        temp_file_path = temp_file.name
-    yield temp_file_path
-    os.remove(temp_file_path)
+
+INVALID_STRUCTURE_XML_BYTES = b"""<invalid></invalid>"""
+
+INCONSISTENT_XML_BYTES = b"""<arXivSRC>
+        <timestamp>Mon Apr  7 04:58:03 2025</timestamp>
+        <file>
+            <content_md5sum>d90df481661ccdd7e8be883796539743</content_md5sum>
+            <filename>src/arXiv_src_0002_001.tar</filename>
+            <first_item>astro-ph0002001</first_item>
+            <last_item>quant-ph0002094</last_item>
+            <md5sum>4592ab506cf775afecf4ad560d982a00</md5sum>
+            <num_items>2365</num_items>
+            <seq_num>1</seq_num>
+            <size>227036528</size>
+            <timestamp>2010-12-23 00:18:09</timestamp>
+            <yymm>0002</yymm>
+        </file>
+        <file>
+            <content_md5sum>cacbfede21d5dfef26f367ec99384546</content_md5sum>
+            <filename>invalid_filename.tar</filename>
+            <first_item>astro-ph0001001</first_item>
+            <last_item>quant-ph0001119</last_item>
+            <md5sum>949ae880fbaf4649a485a8d9e07f370b</md5sum>
+            <num_items>2364</num_items>
+            <seq_num>1</seq_num>
+            <size>225605507</size>
+            <timestamp>2010-12-23 00:13:59</timestamp>
+            <yymm>0001</yymm>
+        </file>        
+    </arXivSRC>"""
+
+def _cached_xml_file(request, xml_bytes):
+    """
+    Materialize the XML content once in the pytest cache directory and return its path.
+    The file name is the SHA-1 of the content, so an existing file can be reused as is.
+    """
+    cache_dir = request.config.cache.mkdir('arxiv_xml_fixtures')
+    file_path = cache_dir / f'{hashlib.sha1(xml_bytes).hexdigest()}.xml'
+    if not file_path.is_file():
+        # write to a unique temporary name first, so parallel workers never read a partial file
+        temp_path = file_path.with_suffix(f'.{os.getpid()}.tmp')
+        temp_path.write_bytes(xml_bytes)
+        os.replace(temp_path, file_path)
+    return str(file_path)
+
+@pytest.fixture(scope='session')
+def valid_xml_file(request):
+    """
+    Provide an XML file with valid arXiv data for testing.
+    """
+    return _cached_xml_file(request, VALID_XML_BYTES)
+
+@pytest.fixture(scope='session')
+def invalid_structure_xml_file(request):
+    """
+    Provide an XML file without the arXiv structure for testing.
+    """
+    return _cached_xml_file(request, INVALID_STRUCTURE_XML_BYTES)
+
+@pytest.fixture(scope='session')
+def inconsistent_xml_file(request):
+    """
+    Provide an XML file with an inconsistent file entry for testing.
+    """
+    return _cached_xml_file(request, INCONSISTENT_XML_BYTES)
 
 def test_import_arxiv_xml_valid(valid_xml_file):
     """
@@ -451,68 +461,47 @@ def test_import_arxiv_xml_file_not_found():
     with pytest.raises(FileNotFoundError, match='file not found'):
         manifest.import_arxiv_xml('non_existent_file.xml')
 
-def test_import_arxiv_xml_invalid_structure():
+def test_import_arxiv_xml_invalid_structure(invalid_structure_xml_file):
     """
     Test import_arxiv_xml with an invalid XML structure.
     """
-    invalid_xml_content = """<invalid></invalid>"""
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".xml") as temp_file:
-        temp_file.write(invalid_xml_content.encode('utf-8'))
-        temp_file_path = temp_file.name
-
     manifest = Manifest()
 
     with pytest.raises(TypeError, match='Entries missing in arXiv XML file'):
-        manifest.import_arxiv_xml(temp_file_path)
-
-    os.remove(temp_file_path)
+        manifest.import_arxiv_xml(invalid_structure_xml_file)
 
-def test_import_arxiv_xml_inconsistent_entry():
+def test_import_arxiv_xml_inconsistent_entry_leaves_manifest_empty(inconsistent_xml_file):
     """
-    Test import_arxiv_xml with an inconsistent file entry.
+    Test that import_arxiv_xml leaves the manifest empty when an entry fails part way through the file.
     """
-    inconsistent_xml_content = """<arXivSRC>
-        <timestamp>Mon Apr  7 04:58:03 2025</timestamp>
-        <file>
-            <content_md5sum>d90df481661ccdd7e8be883796539743</content_md5sum>
-            <filename>src/arXiv_src_0002_001.tar</filename>
-            <first_item>astro-ph0002001</first_item>
-            <last_item>quant-ph0002094</last_item>
-            <md5sum>4592ab506cf775afecf4ad560d982a00</md5sum>
-            <num_items>2365</num_items>
-            <seq_num>1</seq_num>
-            <size>227036528</size>
-            <timestamp>2010-12-23 00:18:09</timestamp>
-            <yymm>0002</yymm>
-        </file>
-        <file>
-            <content_md5sum>cacbfede21d5dfef26f367ec99384546</content_md5sum>
-            <filename>invalid_filename.tar</filename>
-            <first_item>astro-ph0001001</first_item>
-            <last_item>quant-ph0001119</last_item>
-            <md5sum>949ae880fbaf4649a485a8d9e07f370b</md5sum>
-            <num_items>2364</num_items>
-            <seq_num>1</seq_num>
-            <size>225605507</size>
-            <timestamp>2010-12-23 00:13:59</timestamp>
-            <yymm>0001</yymm>
-        </file>        
-    </arXivSRC>"""
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".xml") as temp_file:
-        temp_file.write(inconsistent_xml_content.encode('utf-8'))
-        temp_file_path = temp_file.name
-
     manifest = Manifest()
 
     with pytest.raises(ValueError, match='Entry inconsistent'):
-        manifest.import_arxiv_xml(temp_file_path)
-
-    os.remove(temp_file_path)
+        manifest.import_arxiv_xml(inconsistent_xml_file)
+    assert manifest._manifest == {'metadata': {}, 'contents': {}}
+
+@pytest.mark.parametrize("children", [
+    [('file', dict(BASE_ENTRY))],  # no timestamp
+    [('timestamp', 'Mon Apr  7 04:58:03 2025')],  # no file entries
+    [('timestamp', 'Mon Apr  7 04:58:03 2025'), ('timestamp', 'Mon Apr  7 04:58:03 2025'),
+     ('file', dict(BASE_ENTRY))],  # repeated timestamp
+    [('timestamp', None), ('file', dict(BASE_ENTRY))],  # empty timestamp
+    [('timestamp', 'Mon Apr  7 04:58:03 2025'), ('file', {**BASE_ENTRY, 'size': None})],  # empty value
+    [('timestamp', 'Mon Apr  7 04:58:03 2025'), ('file', 'not an entry')],
+    [('timestamp', 'Mon Apr  7 04:58:03 2025'), ('other', 'unexpected'), ('file', dict(BASE_ENTRY))],
+])
+def test_import_xml_children_missing_entries(children):
+    """
+    Test _import_xml_children with missing, repeated or unexpected children.
+    """
+    with pytest.raises(TypeError, match='Entries missing in arXiv XML file'):
+        Manifest()._import_xml_children(children)
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def manifest_with_data():
     """
     Fixture to provide a Manifest instance with preloaded data.
+    Built once per module and shared, so tests must not modify it.
     """
     manifest = Manifest()
     manifest._manifest = {
@@ -603,10 +592,11 @@ def test_get_statistics_empty_manifest():
 
     assert statistics == {}
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def manifest_with_duplicate_keys():
     """
     Fixture to provide a Manifest instance with duplicate (year, month) keys.
+    Built once per module and shared, so tests must not modify it.
     """
     manifest = Manifest()
     manifest._manifest = {
@@ -652,10 +642,29 @@ def test_get_statistics_branch_coverage(manifest_with_duplicate_keys):
 
     assert statistics == expected_statistics
 
-@pytest.fixture
+def test_get_statistics_many_entries():
+    """
+    Test get_statistics with many synthetic entries spread over a few (year, month) keys.
+    """
+    n_entries = 10000
+    manifest = Manifest()
+    manifest._manifest['contents'] = {
+        f'arXiv_src_{k}.tar': {'year': 2000 + k % 5, 'month': 1 + k % 12, 'size_bytes': k, 'n_submissions': 1}
+        for k in range(n_entries)
+    }
+
+    statistics = manifest.get_statistics()
+
+    assert len(statistics) == 60
+    assert sum(value['size_bytes'] for value in statistics.values()) == n_entries * (n_entries - 1) // 2
+    assert sum(value['n_submissions'] for value in statistics.values()) == n_entries
+    assert statistics[(2000, 1)]['n_submissions'] == len(range(0, n_entries, 60))
+
+@pytest.fixture(scope='module')
 def mock_statistics():
     """
     Fixture to provide mock statistics data for testing.
+    Built once per module and shared, so tests must not modify it.
     """
     return {
         (2025, 1): {'size_bytes': 225605507, 'n_submissions': 2364},
@@ -663,62 +672,72 @@ def mock_statistics():
         (2025, 3): {'size_bytes': 230986882, 'n_submissions': 2600},
     }
 
-@pytest.fixture(autouse=True)
-def use_agg_backend():
+@pytest.fixture(scope='module')
+def summary_figures():
     """
-    Automatically set the matplotlib backend to 'Agg' for all tests.
-    This prevents plots from being displayed during testing.
+    Provide three preallocated figures, reused by the plot tests in this module.
+    The figures are not registered with pyplot, so no figure manager or window is created.
     """
-    plt.switch_backend('Agg')
+    return [Figure() for _ in range(3)]
 
-def test_plot_summary_statistics(monkeypatch, mock_statistics):
+@pytest.mark.filterwarnings("ignore::UserWarning")
+def test_plot_summary_statistics(monkeypatch, mock_statistics, summary_figures):
     """
     Test the plot_summary_statistics method by mocking the output of get_statistics.
     """
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore", UserWarning)
-        # Create a Manifest instance
-        manifest = Manifest()
-
-        # Mock the get_statistics method
-        def mock_get_statistics(self):
-            return mock_statistics
+    # Create a Manifest instance
+    manifest = Manifest()
 
-        monkeypatch.setattr(Manifest, "get_statistics", mock_get_statistics)
+    # Mock the get_statistics method
+    monkeypatch.setattr(Manifest, "get_statistics", lambda self: mock_statistics)
 
-        # Call the method
-        manifest.plot_summary_statistics()
+    # Draw into the preallocated figures
+    manifest.plot_summary_statistics(figs=summary_figures)
 
-        # Get all active figures
-        figures = [plt.figure(i) for i in plt.get_fignums()]
+    # Check the titles and labels of the plots
+    expected_titles = [
+        'Number of Submissions per Month',
+        'Size in GB per Month',
+        'Averaged Monthly Submission Size in MB'
+    ]
+    expected_ylabels = ['Number of Submissions', 'Size (GB)', 'Average Submission Size (MB)']
+    for fig, expected_title, expected_ylabel in zip(summary_figures, expected_titles, expected_ylabels):
+        assert len(fig.axes) == 1
+        assert fig.axes[0].get_title() == expected_title
+        assert fig.axes[0].get_xlabel() == 'Date (Year-Month)'
+        assert fig.axes[0].get_ylabel() == expected_ylabel
 
-        # Ensure three figures were created
-        assert len(figures) == 3
+@pytest.mark.parametrize("n_figures", [0, 2, 4])
+def test_plot_summary_statistics_wrong_number_of_figures(monkeypatch, mock_statistics, n_figures):
+    """
+    Test that plot_summary_statistics raises ValueError unless exactly three figures are passed.
+    """
+    monkeypatch.setattr(Manifest, "get_statistics", lambda self: mock_statistics)
+    figs = [Figure() for _ in range(n_figures)]
 
-        # Check the titles of the plots
-        expected_titles = [
-            'Number of Submissions per Month',
-            'Size in GB per Month',
-            'Averaged Monthly Submission Size in MB'
-        ]
-        for fig, expected_title in zip(figures, expected_titles):
-            assert fig.axes[0].get_title() == expected_title
+    with pytest.raises(ValueError, match=f'Expected 3 figures, got {n_figures}'):
+        Manifest().plot_summary_statistics(figs=figs)
+    assert all(len(fig.axes) == 0 for fig in figs)
 
-        # Check the x-axis labels
-        expected_xlabels = ['Date (Year-Month)', 'Date (Year-Month)', 'Date (Year-Month)']
-        for fig, expected_xlabel in zip(figures, expected_xlabels):
-            assert fig.axes[0].get_xlabel() == expected_xlabel
+@pytest.mark.filterwarnings("ignore::UserWarning")
+def test_plot_summary_statistics_creates_figures(monkeypatch, mock_statistics):
+    """
+    Test that plot_summary_statistics creates three pyplot figures when none are passed.
+    """
+    monkeypatch.setattr(Manifest, "get_statistics", lambda self: mock_statistics)
+    figure_numbers_before = set(plt.get_fignums())
 
-        # Check the y-axis labels
-        expected_ylabels = ['Number of Submissions', 'Size (GB)', 'Average Submission Size (MB)']
-        for fig, expected_ylabel in zip(figures, expected_ylabels):
-            assert fig.axes[0].get_ylabel() == expected_ylabel
+    Manifest().plot_summary_statistics()
 
-        # Clean up the figures after the test
-        plt.close('all')
+    new_figure_numbers = set(plt.get_fignums()) - figure_numbers_before
+    try:
+        assert len(new_figure_numbers) == 3
+    finally:
+        for number in new_figure_numbers:
+            plt.close(number)
 
 
-def test_info(mocker):
+def test_info(capsys):
     """
     Test the info() method of the Manifest class.
     """
@@ -759,24 +778,21 @@ def test_info(mocker):
         }
     }
 
-    # Mock the print function to capture output
-    mock_print = mocker.patch("builtins.print")
-
     # Call the info() method
     manifest.info()
 
     # Verify the printed output in the correct order
-    expected_calls = [
-        mocker.call("Manifest Information:"),
-        mocker.call("Metadata:"),
-        mocker.call("  Manifest Timestamp: 2025-04-07T08:58:03+00:00"),
-        mocker.call("Number of Bulk Archives: 2"),
-        mocker.call("Total Number of Submissions: 4729"),
-        mocker.call("Total Size: 0.453 GB"),
-        mocker.call("Average Submission Size: 0.096 MB"),
+    expected_lines = [
+        "Manifest Information:",
+        "Metadata:",
+        "  Manifest Timestamp: 2025-04-07T08:58:03+00:00",
+        "Number of Bulk Archives: 2",
+        "Total Number of Submissions: 4729",
+        "Total Size: 0.453 GB",
+        "Average Submission Size: 0.096 MB",
     ]
 
-    mock_print.assert_has_calls(expected_calls, any_order=False)
+    assert capsys.readouterr().out.splitlines() == expected_lines
 
 def test_info_with_empty_metadata(capsys):
     """
@@ -837,7 +853,7 @@ def test_import_arxiv_xml_invalid_format(monkeypatch, tmp_path):
     file_path.write_text("not xml content")
 
     # Patch XmlHandler.is_xml_format to return False
-    monkeypatch.setattr("arxiv_bucket.arxiv.manifest.XmlHandler.is_xml_format", lambda x: False)
+    monkeypatch.setattr(XmlHandler, "is_xml_format", lambda x: False)
 
     manifest = Manifest()
     with pytest.raises(TypeError, match="file is not in XML format."):
@@ -854,38 +870,32 @@ class DummyXmlHandlerForDuplicate:
         return True
 
     @staticmethod
-    def read_xml_to_dict(path):
+    def iter_xml_children(path, root_tag):
         # Two entries with the same filename to trigger the KeyError
-        return {
-            'arXivSRC': {
-                'timestamp': 'Mon Apr  7 04:58:03 2025',
-                'file': [
-                    {
-                        'filename': 'src/arXiv_src_2504_001.tar',
-                        'size': '123',
-                        'timestamp': '2025-04-07 04:58:03',
-                        'yymm': '2504',
-                        'seq_num': '001',
-                        'num_items': '10',
-                        'md5sum': 'abc',
-                        'content_md5sum': 'def',
-                        'first_item': '1',
-                        'last_item': '10'
-                    },
-                    {
-                        'filename': 'src/arXiv_src_2504_001.tar',  # Duplicate filename
-                        'size': '456',
-                        'timestamp': '2025-04-07 05:00:00',
-                        'yymm': '2504',
-                        'seq_num': '001',
-                        'num_items': '20',
-                        'md5sum': 'ghi',
-                        'content_md5sum': 'jkl',
-                        'first_item': '11',
-                        'last_item': '30'
-                    }
-                ]
-            }
+        yield 'timestamp', 'Mon Apr  7 04:58:03 2025'
+        yield 'file', {
+            'filename': 'src/arXiv_src_2504_001.tar',
+            'size': '123',
+            'timestamp': '2025-04-07 04:58:03',
+            'yymm': '2504',
+            'seq_num': '001',
+            'num_items': '10',
+            'md5sum': 'abc',
+            'content_md5sum': 'def',
+            'first_item': '1',
+            'last_item': '10'
+        }
+        yield 'file', {
+            'filename': 'src/arXiv_src_2504_001.tar',  # Duplicate filename
+            'size': '456',
+            'timestamp': '2025-04-07 05:00:00',
+            'yymm': '2504',
+            'seq_num': '001',
+            'num_items': '20',
+            'md5sum': 'ghi',
+            'content_md5sum': 'jkl',
+            'first_item': '11',
+            'last_item': '30'
         }
 
 @pytest.fixture
@@ -901,6 +911,7 @@ def test_import_arxiv_xml_duplicate_filename_raises_keyerror(patch_manifest_depe
     manifest = Manifest()
     with pytest.raises(KeyError, match="Bulk archive base filenames not unique"):
         manifest.import_arxiv_xml("dummy_path.xml")
+    assert manifest._manifest == {'metadata': {}, 'contents': {}}
 
 def test_list_keys():
     """
@@ -912,6 +923,13 @@ def test_list_keys():
     manifest._manifest['contents']['key2'] = {"baz": "qux"}
     keys = manifest.list_keys()
     assert keys == {"key1", "key2"}
+    assert isinstance(keys, frozenset)
+    assert manifest.list_keys() is keys
+
+    manifest._manifest['contents'] = {**manifest._manifest['contents'], 'key3': {}}
+    assert manifest.list_keys() == {"key1", "key2", "key3"}
+    manifest.clear()
+    assert manifest.list_keys() == set()
 
 class DummyTimeService:
     @staticmethod
@@ -919,7 +937,7 @@ class DummyTimeService:
         # Simple string comparison for testing; real logic is in TimeService
         return ts1 > ts2
 
-@pytest.fixture(autouse=True)
+@pytest.fixture
 def patch_time_service(monkeypatch):
     # Patch TimeService used in Manifest
     monkeypatch.setattr("arxiv_bucket.arxiv.manifest.TimeService", DummyTimeService)
@@ -933,7 +951,7 @@ def make_manifest(timestamp, keys):
     m._manifest['contents'] = {k: {} for k in keys}
     return m
 
-def test_is_newer_than_true():
+def test_is_newer_than_true(patch_time_service):
     """
     Test that is_newer_than returns True when self is newer and has at least one new entry, no deletions.
     """
@@ -941,7 +959,7 @@ def test_is_newer_than_true():
     m2 = make_manifest("2022-01-01T00:00:00+00:00", {"a"})
     assert m1.is_newer_than(m2) is True
 
-def test_is_newer_than_false():
+def test_is_newer_than_false(patch_time_service):
     """
     Test that is_newer_than returns False when self is older and the other has at least one new entry, no deletions.
     """
@@ -949,7 +967,7 @@ def test_is_newer_than_false():
     m2 = make_manifest("2022-01-02T00:00:00+00:00", {"a", "b"})
     assert m1.is_newer_than(m2) is False
 
-def test_is_newer_than_equal():
+def test_is_newer_than_equal(patch_time_service):
     """
     Test that is_newer_than returns False when timestamps and keys are identical.
     """
@@ -957,7 +975,7 @@ def test_is_newer_than_equal():
     m2 = make_manifest("2022-01-01T00:00:00+00:00", {"a", "b"})
     assert m1.is_newer_than(m2) is False
 
-def test_is_newer_than_identical_time_different_keys():
+def test_is_newer_than_identical_time_different_keys(patch_time_service):
     """
     Test that is_newer_than raises ValueError if timestamps are equal but keys differ.
     """
@@ -966,7 +984,7 @@ def test_is_newer_than_identical_time_different_keys():
     with pytest.raises(ValueError, match="identical times must have identical keys"):
         m1.is_newer_than(m2)
 
-def test_is_newer_than_newer_manifest_no_new_entries():
+def test_is_newer_than_newer_manifest_no_new_entries(patch_time_service):
     """
     Test that is_newer_than raises ValueError if self is newer but has no new entries.
     """
@@ -975,7 +993,7 @@ def test_is_newer_than_newer_manifest_no_new_entries():
     with pytest.raises(ValueError, match="must have at least one new entry"):
         m1.is_newer_than(m2)
 
-def test_is_newer_than_newer_manifest_with_deletions():
+def test_is_newer_than_newer_manifest_with_deletions(patch_time_service):
     """
     Test that is_newer_than raises ValueError if self is newer but has deleted entries.
     """
@@ -984,7 +1002,7 @@ def test_is_newer_than_newer_manifest_with_deletions():
     with pytest.raises(ValueError, match="Inconsistent manifest metadata, newer manifest must have at least one new entry"):
         m1.is_newer_than(m2)
 
-def test_is_newer_than_older_manifest_no_new_entries():
+def test_is_newer_than_older_manifest_no_new_entries(patch_time_service):
     """
     Test that is_newer_than raises ValueError if self is older but the other has no new entries.
     """
@@ -993,7 +1011,7 @@ def test_is_newer_than_older_manifest_no_new_entries():
     with pytest.raises(ValueError, match="must have at least one new entry"):
         m1.is_newer_than(m2)
 
-def test_is_newer_than_older_manifest_with_deletions():
+def test_is_newer_than_older_manifest_with_deletions(patch_time_service):
     """
     Test that is_newer_than raises ValueError if self is older but has deleted entries compared to the other.
     """
@@ -1002,7 +1020,7 @@ def test_is_newer_than_older_manifest_with_deletions():
     with pytest.raises(ValueError, match="Inconsistent manifest metadata, newer manifest must have at least one new entry"):
         m1.is_newer_than(m2)
 
-def test_is_newer_than_newer_manifest_new_entries_but_deleted_key():
+def test_is_newer_than_newer_manifest_new_entries_but_deleted_key(patch_time_service):
     """
     Test that is_newer_than raises ValueError (line 154) if self is newer but has no new entries compared to other,
     and both have different keys (e.g., self: {'a', 'b'}, other: {'b', 'c'}).
@@ -1012,7 +1030,7 @@ def test_is_newer_than_newer_manifest_new_entries_but_deleted_key():
     with pytest.raises(ValueError, match="cannot have entries deleted"):
         m1.is_newer_than(m2)
 
-def test_is_newer_than_older_manifest_deleted_key_but_newer_entries():
+def test_is_newer_than_older_manifest_deleted_key_but_newer_entries(patch_time_service):
     """
     Test that is_newer_than raises ValueError (line 154) if self is newer but has no new entries compared to other,
     and both have different keys (e.g., self: {'a', 'b'}, other: {'b', 'c'}).
@@ -1098,9 +1116,10 @@ def test_plot_summary_statistics_empty(monkeypatch):
     # Mock get_statistics to return empty dict
     monkeypatch.setattr(Manifest, "get_statistics", lambda self: {})
 
-    # Should not raise or plot anything
+    # Should not raise or plot anything, other tests on the same worker may own open figures
+    figure_numbers_before = plt.get_fignums()
     manifest.plot_summary_statistics()
-    assert plt.get_fignums() == []
+    assert plt.get_fignums() == figure_numbers_before
 
 def test_list_entries_by_date_exact():
     """
@@ -1144,6 +1163,31 @@ def test_list_entries_by_date_none():
     assert results == []
 
 
+def test_list_entries_by_date_index_reused_and_rebuilt():
+    """
+    Test that list_entries_by_date reuses its date index and rebuilds it when the contents change.
+    """
+    manifest = Manifest()
+    manifest._manifest['contents'] = {
+        'file1': {'year': 2025, 'month': 8},
+        'file2': {'year': 2024, 'month': 1},
+        'file3': {'year': 2025, 'month': 8},
+    }
+    assert manifest.list_entries_by_date(2024, 1, is_from_date_onwards=True) == ['file1', 'file2', 'file3']
+    date_index = manifest._date_index
+    assert manifest.list_entries_by_date(2025, 8, is_from_date_onwards=True) == ['file1', 'file3']
+    assert manifest.list_entries_by_date(2023, 12, is_from_date_onwards=True) == ['file1', 'file2', 'file3']
+    assert manifest.list_entries_by_date(2024, 2, is_from_date_onwards=True) == ['file1', 'file3']
+    assert manifest._date_index is date_index
+
+    manifest._manifest['contents'] = {**manifest._manifest['contents'], 'file4': {'year': 2026, 'month': 2}}
+    assert manifest.list_entries_by_date(2025, 9, is_from_date_onwards=True) == ['file4']
+    assert manifest.list_entries_by_date(2025, 8) == ['file1', 'file3']
+
+    manifest.clear()
+    assert manifest.list_entries_by_date(2025, 8) == []
+
+
 def test_list_filenames():
     """
     Test the list_filenames method to ensure it returns all filenames in the manifest.
@@ -1170,6 +1214,42 @@ def test_list_filenames():
     assert set(filenames) == set(expected)
 
 
+def test_list_filenames_cached(monkeypatch):
+    """
+    Test that list_filenames reuses the cached basenames until the contents are replaced or changed.
+    """
+    calls = []
+
+    def mock_get_file_basename(filename):
+        calls.append(filename)
+        return filename.split('/')[-1]
+
+    monkeypatch.setattr(FileName, "get_file_basename", mock_get_file_basename)
+
+    manifest = Manifest()
+    manifest._manifest['contents'] = {'arXiv_src_0001_001.tar': {'filename': 'src/arXiv_src_0001_001.tar'}}
+    filenames = manifest.list_filenames()
+    filenames.append('modified by the caller')
+    assert manifest.list_filenames() == ['arXiv_src_0001_001.tar']
+    assert len(calls) == 1
+
+    # replacing the contents with an added entry rebuilds the cache
+    manifest._manifest['contents'] = {**manifest._manifest['contents'],
+                                      'arXiv_src_0002_001.tar': {'filename': 'src/arXiv_src_0002_001.tar'}}
+    assert manifest.list_filenames() == ['arXiv_src_0001_001.tar', 'arXiv_src_0002_001.tar']
+    assert len(calls) == 3
+
+    # clearing the contents rebuilds the cache
+    manifest.clear()
+    assert manifest.list_filenames() == []
+
+    # importing entries into the current contents rebuilds the cache
+    manifest._import_xml_children([('timestamp', 'Mon Apr  7 04:58:03 2025'), ('file', dict(BASE_ENTRY))])
+    assert manifest.list_filenames() == ['arXiv_src_1508_002.tar']
+    assert manifest.list_keys() == {'arXiv_src_1508_002.tar'}
+    assert manifest.list_entries_by_date(2015, 8) == ['arXiv_src_1508_002.tar']
+
+
 def test_find_bulk_archive_files_not_in_manifest(monkeypatch):
     """
     Test find_bulk_archive_files_not_in_manifest returns files in the directory not in the manifest.
@@ -1181,7 +1261,7 @@ def test_find_bulk_archive_files_not_in_manifest(monkeypatch):
     }
 
     # Mock FileSystem.is_directory to always return True
-    monkeypatch.setattr("arxiv_bucket.arxiv.manifest.FileSystem.is_directory", lambda path: True)
+    monkeypatch.setattr(FileSystem, "is_directory", lambda path: True)
     # Mock FileSystem.list_files to return a mix of files and accept the extra argument
     files_in_dir = [
         'arXiv_src_0001_001.tar',  # in manifest
@@ -1189,7 +1269,7 @@ def test_find_bulk_archive_files_not_in_manifest(monkeypatch):
         'arXiv_src_0003_001.tar',  # not in manifest
         'not_a_bulk_file.txt',     # not a bulk archive file
     ]
-    monkeypatch.setattr("arxiv_bucket.arxiv.manifest.FileSystem.list_files", lambda path, include_subdirectories=False: files_in_dir)
+    monkeypatch.setattr(FileSystem, "list_files", lambda path, include_subdirectories=False: files_in_dir)
 
     missing = manifest.find_bulk_archive_files_not_in_manifest("/dummy/path")
     assert missing == ['arXiv_src_0003_001.tar']
@@ -1205,7 +1285,7 @@ def test_find_bulk_archive_files_not_in_manifest(monkeypatch):
     }
 
     # Mock FileSystem.is_directory to always return True
-    monkeypatch.setattr("arxiv_bucket.arxiv.manifest.FileSystem.is_directory", lambda path: True)
+    monkeypatch.setattr(FileSystem, "is_directory", lambda path: True)
     # Mock FileSystem.list_files to return a mix of files and accept the extra argument
     files_in_dir = [
         'arXiv_src_0001_001.tar',  # in manifest
@@ -1213,7 +1293,7 @@ def test_find_bulk_archive_files_not_in_manifest(monkeypatch):
         'arXiv_src_0003_001.tar',  # not in manifest
         'not_a_bulk_file.txt',     # not a bulk archive file
     ]
-    monkeypatch.setattr("arxiv_bucket.arxiv.manifest.FileSystem.list_files", lambda path, include_subdirectories=False: files_in_dir)
+    monkeypatch.setattr(FileSystem, "list_files", lambda path, include_subdirectories=False: files_in_dir)
 
     missing = manifest.find_bulk_archive_files_not_in_manifest("/dummy/path")
     assert missing == ['arXiv_src_0003_001.tar']
@@ -1223,9 +1303,9 @@ def test_find_bulk_archive_files_not_in_manifest_directory_not_found(monkeypatch
     Test find_bulk_archive_files_not_in_manifest raises FileNotFoundError if directory does not exist.
     """
     manifest = Manifest()
-    monkeypatch.setattr("arxiv_bucket.arxiv.manifest.FileSystem.is_directory", lambda path: False)
+    monkeypatch.setattr(FileSystem, "is_directory", lambda path: False)
     # Also patch list_files to accept the extra argument, even though it won't be called
-    monkeypatch.setattr("arxiv_bucket.arxiv.manifest.FileSystem.list_files", lambda path, include_subdirectories=False: [])
+    monkeypatch.setattr(FileSystem, "list_files", lambda path, include_subdirectories=False: [])
     with pytest.raises(FileNotFoundError):
         manifest.find_bulk_archive_files_not_in_manifest("/not/a/real/path")
 
@@ -1234,7 +1314,7 @@ def test_find_bulk_archive_files_not_in_manifest_directory_not_found(monkeypatch
     Test find_bulk_archive_files_not_in_manifest raises FileNotFoundError if directory does not exist.
     """
     manifest = Manifest()
-    monkeypatch.setattr("arxiv_bucket.arxiv.manifest.FileSystem.is_directory", lambda path: False)
+    monkeypatch.setattr(FileSystem, "is_directory", lambda path: False)
     with pytest.raises(FileNotFoundError):
         manifest.find_bulk_archive_files_not_in_manifest("/not/a/real/path")
 
@@ -1250,8 +1330,8 @@ def test_find_keys_without_local_files_all_present(monkeypatch):
     }
     # All files are present in the directory (as basenames)
     local_files = ['arXiv_src_0001_001.tar', 'arXiv_src_0002_001.tar', 'arXiv_src_0003_001.tar']
-    monkeypatch.setattr("arxiv_bucket.arxiv.manifest.FileSystem.is_directory", lambda path: True)
-    monkeypatch.setattr("arxiv_bucket.arxiv.manifest.FileSystem.list_files", lambda path, include_subdirectories=False: local_files)
+    monkeypatch.setattr(FileSystem, "is_directory", lambda path: True)
+    monkeypatch.setattr(FileSystem, "list_files", lambda path, include_subdirectories=False: local_files)
     key_list = ['arXiv_src_0001_001.tar', 'arXiv_src_0002_001.tar', 'arXiv_src_0003_001.tar']
     missing = manifest.find_keys_without_local_files("/dummy/path", key_list)
     assert missing == []
@@ -1268,8 +1348,8 @@ def test_find_keys_without_local_files_some_missing(monkeypatch):
     }
     # Only some files are present in the directory
     local_files = ['arXiv_src_0001_001.tar']
-    monkeypatch.setattr("arxiv_bucket.arxiv.manifest.FileSystem.is_directory", lambda path: True)
-    monkeypatch.setattr("arxiv_bucket.arxiv.manifest.FileSystem.list_files", lambda path, include_subdirectories=False: local_files)
+    monkeypatch.setattr(FileSystem, "is_directory", lambda path: True)
+    monkeypatch.setattr(FileSystem, "list_files", lambda path, include_subdirectories=False: local_files)
     key_list = ['arXiv_src_0001_001.tar', 'arXiv_src_0002_001.tar', 'arXiv_src_0003_001.tar']
     missing = manifest.find_keys_without_local_files("/dummy/path", key_list)
     assert set(missing) == {'arXiv_src_0002_001.tar', 'arXiv_src_0003_001.tar'}
@@ -1285,8 +1365,8 @@ def test_find_keys_without_local_files_none_exist(monkeypatch):
     }
     # No files are present in the directory
     local_files = []
-    monkeypatch.setattr("arxiv_bucket.arxiv.manifest.FileSystem.is_directory", lambda path: True)
-    monkeypatch.setattr("arxiv_bucket.arxiv.manifest.FileSystem.list_files", lambda path, include_subdirectories=False: local_files)
+    monkeypatch.setattr(FileSystem, "is_directory", lambda path: True)
+    monkeypatch.setattr(FileSystem, "list_files", lambda path, include_subdirectories=False: local_files)
     key_list = ['arXiv_src_0001_001.tar', 'arXiv_src_0002_001.tar']
     missing = manifest.find_keys_without_local_files("/dummy/path", key_list)
     assert set(missing) == set(key_list)
@@ -1300,8 +1380,8 @@ def test_find_keys_without_local_files_key_not_in_manifest(monkeypatch):
         'arXiv_src_0001_001.tar': {'filename': 'src/arXiv_src_0001_001.tar'},
     }
     local_files = ['arXiv_src_0001_001.tar']
-    monkeypatch.setattr("arxiv_bucket.arxiv.manifest.FileSystem.is_directory", lambda path: True)
-    monkeypatch.setattr("arxiv_bucket.arxiv.manifest.FileSystem.list_files", lambda path, include_subdirectories=False: local_files)
+    monkeypatch.setattr(FileSystem, "is_directory", lambda path: True)
+    monkeypatch.setattr(FileSystem, "list_files", lambda path, include_subdirectories=False: local_files)
     key_list = ['arXiv_src_0001_001.tar', 'arXiv_src_0002_001.tar']  # 2nd key not in manifest
     missing = manifest.find_keys_without_local_files("/dummy/path", key_list)
     assert missing == []
@@ -1311,7 +1391,7 @@ def test_find_keys_without_local_files_directory_not_found(monkeypatch):
     Test that FileNotFoundError is raised if the directory does not exist.
     """
     manifest = Manifest()
-    monkeypatch.setattr("arxiv_bucket.arxiv.manifest.FileSystem.is_directory", lambda path: False)
+    monkeypatch.setattr(FileSystem, "is_directory", lambda path: False)
     key_list = ['arXiv_src_0001_001.tar']
     try:
         manifest.find_keys_without_local_files("/not/a/real/path", key_list)
@@ -1320,6 +1400,61 @@ def test_find_keys_without_local_files_directory_not_found(monkeypatch):
     else:
         assert False, "Expected FileNotFoundError"
 
+def test_directory_queries_share_listing_within_stat_cache(tmp_path, mocker):
+    """
+    Test that back-to-back directory queries inside one stat_cache context scan the directory once.
+    """
+    manifest = Manifest()
+    manifest._manifest['contents'] = {
+        'arXiv_src_0001_001.tar': {'filename': 'src/arXiv_src_0001_001.tar'},
+        'arXiv_src_0002_001.tar': {'filename': 'src/arXiv_src_0002_001.tar'},
+    }
+    (tmp_path / 'arXiv_src_0001_001.tar').write_bytes(b'')
+    (tmp_path / 'arXiv_src_0003_001.tar').write_bytes(b'')
+    spy_scandir = mocker.spy(os, 'scandir')
+
+    with FileSystem.stat_cache():
+        assert manifest.find_bulk_archive_files_not_in_manifest(str(tmp_path)) == ['arXiv_src_0003_001.tar']
+        assert manifest.find_keys_without_local_files(str(tmp_path), list(manifest._manifest['contents'])) == \
+            ['arXiv_src_0002_001.tar']
+
+    assert spy_scandir.call_count == 1
+
+@pytest.mark.parametrize("max_workers", [None, 1])
+def test_verify_files(tmp_path, max_workers):
+    """
+    Test that verify_files compares the MD5 hashes of the local files with the manifest.
+    """
+    (tmp_path / 'arXiv_src_0001_001.tar').write_bytes(b'first')
+    (tmp_path / 'arXiv_src_0002_001.tar').write_bytes(b'changed')
+    manifest = Manifest()
+    manifest._manifest['contents'] = {
+        'arXiv_src_0001_001.tar': {'filename': 'src/arXiv_src_0001_001.tar',
+                                   'hash': {'MD5': hashlib.md5(b'first').hexdigest()}},
+        'arXiv_src_0002_001.tar': {'filename': 'src/arXiv_src_0002_001.tar',
+                                   'hash': {'MD5': hashlib.md5(b'second').hexdigest()}},
+        'arXiv_src_0003_001.tar': {'filename': 'src/arXiv_src_0003_001.tar',
+                                   'hash': {'MD5': hashlib.md5(b'third').hexdigest()}},
+    }
+    key_list = ['arXiv_src_0003_001.tar', 'arXiv_src_0001_001.tar', 'arXiv_src_0002_001.tar']
+    result = manifest.verify_files(str(tmp_path), key_list, max_workers=max_workers)
+    assert result == {
+        'arXiv_src_0003_001.tar': False,
+        'arXiv_src_0001_001.tar': True,
+        'arXiv_src_0002_001.tar': False,
+    }
+    assert list(result) == key_list
+
+def test_verify_files_errors(tmp_path):
+    """
+    Test that verify_files raises on a missing directory or a key not in the manifest.
+    """
+    manifest = Manifest()
+    with pytest.raises(FileNotFoundError, match="Directory not found"):
+        manifest.verify_files(str(tmp_path / 'missing'), [])
+    with pytest.raises(KeyError, match="not found in the manifest"):
+        manifest.verify_files(str(tmp_path), ['arXiv_src_0001_001.tar'])
+
 def test_get_bulk_archive_filename_valid(monkeypatch):
     """
     Test get_bulk_archive_filename returns the correct basename for a valid key.
@@ -1330,7 +1465,7 @@ def test_get_bulk_archive_filename_valid(monkeypatch):
         'arXiv_src_0002_001.tar': {'filename': 'src/arXiv_src_0002_001.tar'},
     }
     # Patch FileName.get_file_basename to just return the basename
-    monkeypatch.setattr("arxiv_bucket.arxiv.manifest.FileName.get_file_basename", lambda f: f.split('/')[-1])
+    monkeypatch.setattr(FileName, "get_file_basename", lambda f: f.split('/')[-1])
     result = manifest.get_bulk_archive_filename('arXiv_src_0001_001.tar')
     assert result == 'arXiv_src_0001_001.tar'
     result2 = manifest.get_bulk_archive_filename('arXiv_src_0002_001.tar')
@@ -195,6 +195,16 @@ class TestSubmissionRegistry:
         with pytest.raises(AttributeError):
             self.registry.add_entry("test_key", {"test": "data"})
 
+    @pytest.mark.parametrize("method_name", ["add_entry", "bulk_add_entries", "update_entry"])
+    def test_base_class_methods_absent(self, method_name):
+        """Test that the base class methods for adding entries are reported as absent."""
+        assert not hasattr(self.registry, method_name)
+
+    def test_bulk_add_entries_raises_attribute_error(self):
+        """Test that bulk_add_entries raises AttributeError to prevent direct access."""
+        with pytest.raises(AttributeError):
+            self.registry.bulk_add_entries([("test_key", {"test": "data"})])
+
     def test_update_entry_raises_attribute_error(self):
         """Test that update_entry raises AttributeError to prevent direct access."""
         with pytest.raises(AttributeError):
@@ -216,6 +226,7 @@ class TestSubmissionRegistry:
         self.registry.register_submission(file_path, bulk_archive_hash)
         assert self.registry.is_key_present(test_key)
         assert self.registry.get_entry(test_key)["metadata"]["filename"] == "1234.5678v1.tar.gz"
+        assert self.registry.get_entry(test_key) is test_entry  # the generated entry is stored without a copy
 
     def test_register_submission_file_not_found(self, mocker):
         """Test that FileNotFoundError is raised if the file does not exist."""
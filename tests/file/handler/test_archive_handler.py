@@ -4,10 +4,14 @@
 # Copyright (c) 2025 Jason Stuber
 # Licensed under the MIT License. See the LICENSE file for more details.
 
+import io
+import multiprocessing
 import os
 import struct
+import tarfile
 import pytest
 
+from arxiv_bucket.file.file_system import FileSystem
 from arxiv_bucket.file.handler.archive_handler import ArchiveHandler
 from arxiv_bucket.file.file_type import FileType
 
@@ -63,6 +67,71 @@ def test_get_file_type_from_format(filename, expected_file_type, file_test_fixtu
     file_type = ArchiveHandler.get_file_type_from_format(full_path)
     assert expected_file_type == file_type
 
+def test_classify_batch(file_test_fixtures_directory):
+    """
+    Test that classify_batch returns the file types in the order of the file paths.
+    """
+    filenames = ['archive/tar_archive_file.tar', 'archive/tgz_archive_file.tgz', 'archive/gzip_single_file.gz',
+                 'archive/zip_archive_file.zip']
+    file_paths = [os.path.join(file_test_fixtures_directory, filename) for filename in filenames]
+
+    file_types = ArchiveHandler.classify_batch(file_paths, max_workers=2, chunk_size=1)
+
+    assert file_types == [FileType.FILE_TYPE_ARCHIVE_TAR, FileType.FILE_TYPE_ARCHIVE_TGZ,
+                          FileType.FILE_TYPE_ARCHIVE_GZ, FileType.FILE_TYPE_UNKNOWN]
+
+def test_classify_batch_missing_file(file_test_fixtures_directory):
+    """
+    Test that classify_batch reports a missing file as unknown and keeps the results of the other files.
+    """
+    file_paths = [os.path.join(file_test_fixtures_directory, 'archive/tar_archive_file.tar'),
+                  os.path.join(file_test_fixtures_directory, 'archive/this_is_not_a_file.tar')]
+
+    file_types = ArchiveHandler.classify_batch(file_paths, max_workers=1)
+
+    assert file_types == [FileType.FILE_TYPE_ARCHIVE_TAR, FileType.FILE_TYPE_UNKNOWN]
+
+@pytest.mark.parametrize("side_effect", [FileNotFoundError('file not found'), PermissionError('permission denied')])
+def test_get_file_type_from_format_or_unknown_error(side_effect, mocker):
+    """
+    Test that a file that is missing or cannot be read is reported as unknown.
+    """
+    mocker.patch('arxiv_bucket.file.handler.archive_handler.ArchiveHandler.get_file_type_from_format',
+                 side_effect=side_effect)
+
+    assert ArchiveHandler._get_file_type_from_format_or_unknown('archive.tar') == FileType.FILE_TYPE_UNKNOWN
+
+def test_get_file_type_from_format_or_unknown(file_test_fixtures_directory):
+    """
+    Test that the file type of a readable file is determined from its format.
+    """
+    file_path = os.path.join(file_test_fixtures_directory, 'archive/tgz_archive_file.tgz')
+
+    assert ArchiveHandler._get_file_type_from_format_or_unknown(file_path) == FileType.FILE_TYPE_ARCHIVE_TGZ
+
+@pytest.mark.parametrize("start_method", [None, 'spawn', 'forkserver'])
+def test_classify_batch_mp_context(start_method, mocker):
+    """
+    Test that classify_batch starts the worker processes with the given context, and with spawn by default.
+    """
+    if start_method is not None and start_method not in multiprocessing.get_all_start_methods():
+        pytest.skip(f'start method {start_method} not available')
+    mock_executor = mocker.patch('arxiv_bucket.file.handler.archive_handler.ProcessPoolExecutor')
+    mock_executor.return_value.__enter__.return_value.map.return_value = iter([])
+    mp_context = None if start_method is None else multiprocessing.get_context(start_method)
+
+    assert ArchiveHandler.classify_batch([], mp_context=mp_context) == []
+
+    expected_start_method = start_method or 'spawn'
+    assert mock_executor.call_args.kwargs['mp_context'].get_start_method() == expected_start_method
+
+def test_classify_batch_invalid_chunk_size():
+    """
+    Test that classify_batch raises ValueError for a chunk size that is not positive.
+    """
+    with pytest.raises(ValueError):
+        ArchiveHandler.classify_batch([], chunk_size=0)
+
 @pytest.mark.parametrize("filename, expected_is_archive_file", [
     ('archive/tar_archive_file.tar', True),  # tar file
     ('archive/tgz_archive_file.tgz', True),  # tar.gz file
@@ -476,6 +545,52 @@ def test_extract_tar_or_tgz_contents_private(mocker):
     mock_tar.getmembers.assert_called_once()
     mock_tar.extract.assert_called_once_with(mock_member, destination_directory)
 
+@pytest.mark.filterwarnings("ignore:Python 3.14 will, by default, filter extracted tar archives:DeprecationWarning")
+def test_extract_tar_contents_within_stat_cache(tmp_path):
+    """
+    Test that files extracted within an enclosing stat_cache context are seen by later checks in the context.
+    """
+    source_file_path = str(tmp_path / 'nested.tar')
+    with tarfile.open(source_file_path, 'w') as tar:
+        tar_info = tarfile.TarInfo('sub/a.txt')
+        tar_info.size = 4
+        tar.addfile(tar_info, io.BytesIO(b'text'))
+    destination_directory = tmp_path / 'dst'
+    (destination_directory / 'sub').mkdir(parents=True)
+    destination_filename = str(destination_directory / 'sub' / 'a.txt')
+
+    with FileSystem.stat_cache():
+        assert not FileSystem.is_file(destination_filename)
+
+        ArchiveHandler.extract_tar_contents(source_file_path, str(destination_directory))
+
+        assert FileSystem.is_file(destination_filename)
+        assert ArchiveHandler.check_extract_possible(source_file_path, str(destination_directory)) == \
+            ['destination file already exists']
+
+@pytest.mark.filterwarnings("ignore:Python 3.14 will, by default, filter extracted tar archives:DeprecationWarning")
+def test_extract_contents_updates_cached_listing(tmp_path):
+    """
+    Test that a second extraction into the same directory within a stat_cache context is refused.
+    """
+    source_file_path = str(tmp_path / 'top_level.tar')
+    with tarfile.open(source_file_path, 'w') as tar:
+        tar_info = tarfile.TarInfo('a.txt')
+        tar_info.size = 4
+        tar.addfile(tar_info, io.BytesIO(b'text'))
+    destination_directory = tmp_path / 'dst'
+    destination_directory.mkdir()
+
+    with FileSystem.stat_cache():
+        assert ArchiveHandler.check_extract_possible(source_file_path, str(destination_directory)) == []
+
+        ArchiveHandler.extract_contents(source_file_path, str(destination_directory))
+
+        assert ArchiveHandler.check_extract_possible(source_file_path, str(destination_directory)) == \
+            ['destination file already exists']
+        with pytest.raises(ValueError):
+            ArchiveHandler.extract_contents(source_file_path, str(destination_directory))
+
 def test_is_extract_possible_source_file_not_found(file_test_fixtures_directory):
     """
     Test the is_extract_possible when the source file is not found.
@@ -566,101 +681,76 @@ def test_extract_contents_not_archive(mocker):
     """
     Test the extract_contents when this is not an archive file.
     """
-    # set up the mocks
-    mock_is_archive_format = mocker.patch('arxiv_bucket.file.handler.archive_handler.ArchiveHandler.is_archive_format')
-    mock_is_gzip_format = mocker.patch('arxiv_bucket.file.handler.archive_handler.ArchiveHandler.is_gzip_format')
-    mock_is_tar_format = mocker.patch('arxiv_bucket.file.handler.archive_handler.ArchiveHandler.is_tar_format')
-    mock_is_tgz_format = mocker.patch('arxiv_bucket.file.handler.archive_handler.ArchiveHandler.is_tgz_format')
-
-    mock_is_archive_format.return_value = True
-    mock_is_gzip_format.return_value = False
-    mock_is_tar_format.return_value = False
-    mock_is_tgz_format.return_value = False
-
-    # Test unsupported format
-    with pytest.raises(TypeError, match='file not listed as a supported archive format'):
-        ArchiveHandler.extract_contents('unsupported_format_file', 'destination_directory')
-
-def test_extract_contents_format_not_listed(mocker):
-    """
-    Test the extract_contents when the format is not in the listed supported types.
-    """
-    # set up the mock
-    mock_is_archive_format = mocker.patch('arxiv_bucket.file.handler.archive_handler.ArchiveHandler.is_archive_format')
-    mock_is_archive_format.return_value = False
+    mocker.patch('arxiv_bucket.file.handler.archive_handler.ArchiveHandler.get_file_type_from_format',
+                 return_value=FileType.FILE_TYPE_UNKNOWN)
+    mock_is_extract = mocker.patch('arxiv_bucket.file.handler.archive_handler.ArchiveHandler.is_extract_possible')
 
     # Test not supported archive format
     with pytest.raises(TypeError, match='file not a supported archive format'):
         ArchiveHandler.extract_contents('not_supported_archive_file', 'destination_directory')
 
-def test_extract_contents_gzip(mocker):
+    mock_is_extract.assert_not_called()
+
+def test_extract_contents_extract_not_possible(mocker):
     """
-    Test the extract_contents for gzip format.
+    Test the extract_contents when the extraction is not possible.
     """
-    mock_is_archive = mocker.patch('arxiv_bucket.file.handler.archive_handler.ArchiveHandler.is_archive_format')
-    mock_is_gzip = mocker.patch('arxiv_bucket.file.handler.archive_handler.ArchiveHandler.is_gzip_format')
-    mock_is_tar = mocker.patch('arxiv_bucket.file.handler.archive_handler.ArchiveHandler.is_tar_format')
-    mock_is_tgz = mocker.patch('arxiv_bucket.file.handler.archive_handler.ArchiveHandler.is_tgz_format')
-    mock_extract_gzip = mocker.patch('arxiv_bucket.file.handler.archive_handler.ArchiveHandler.extract_gzip_contents')
-    mock_extract_tar = mocker.patch('arxiv_bucket.file.handler.archive_handler.ArchiveHandler.extract_tar_contents')
-    mock_extract_tgz = mocker.patch('arxiv_bucket.file.handler.archive_handler.ArchiveHandler.extract_tgz_contents')
-
-    mock_is_archive.return_value = True
-    mock_is_gzip.return_value = True
-    mock_is_tar.return_value = False
-    mock_is_tgz.return_value = False
+    mocker.patch('arxiv_bucket.file.handler.archive_handler.ArchiveHandler.get_file_type_from_format',
+                 return_value=FileType.FILE_TYPE_ARCHIVE_TAR)
+    mocker.patch('arxiv_bucket.file.handler.archive_handler.ArchiveHandler.is_extract_possible', return_value=False)
+    mock_extract_tar_or_tgz = mocker.patch('arxiv_bucket.file.handler.archive_handler.ArchiveHandler._extract_tar_or_tgz_contents_private')
 
-    ArchiveHandler.extract_contents('dummy_path.gz', 'dummy_dest')
+    with pytest.raises(ValueError, match='extraction not possible'):
+        ArchiveHandler.extract_contents('dummy_path.tar', 'dummy_dest')
 
-    mock_extract_gzip.assert_called_once_with('dummy_path.gz', 'dummy_dest')
-    mock_extract_tar.assert_not_called()
-    mock_extract_tgz.assert_not_called()
+    mock_extract_tar_or_tgz.assert_not_called()
 
-def test_extract_contents_tar(mocker):
+@pytest.mark.parametrize("file_type, expected_method", [
+    (FileType.FILE_TYPE_ARCHIVE_GZ, '_extract_gzip_contents_private'),
+    (FileType.FILE_TYPE_ARCHIVE_TAR, '_extract_tar_or_tgz_contents_private'),
+    (FileType.FILE_TYPE_ARCHIVE_TGZ, '_extract_tar_or_tgz_contents_private')
+])
+def test_extract_contents_dispatch(file_type, expected_method, mocker):
     """
-    Test the extract_contents for tar format.
+    Test that extract_contents dispatches to the extraction method of the detected archive format.
     """
-    mock_is_archive = mocker.patch('arxiv_bucket.file.handler.archive_handler.ArchiveHandler.is_archive_format')
-    mock_is_gzip = mocker.patch('arxiv_bucket.file.handler.archive_handler.ArchiveHandler.is_gzip_format')
-    mock_is_tar = mocker.patch('arxiv_bucket.file.handler.archive_handler.ArchiveHandler.is_tar_format')
-    mock_is_tgz = mocker.patch('arxiv_bucket.file.handler.archive_handler.ArchiveHandler.is_tgz_format')
-    mock_extract_gzip = mocker.patch('arxiv_bucket.file.handler.archive_handler.ArchiveHandler.extract_gzip_contents')
-    mock_extract_tar = mocker.patch('arxiv_bucket.file.handler.archive_handler.ArchiveHandler.extract_tar_contents')
-    mock_extract_tgz = mocker.patch('arxiv_bucket.file.handler.archive_handler.ArchiveHandler.extract_tgz_contents')
-
-    mock_is_archive.return_value = True
-    mock_is_gzip.return_value = False
-    mock_is_tar.return_value = True
-    mock_is_tgz.return_value = False
+    mock_get_file_type = mocker.patch('arxiv_bucket.file.handler.archive_handler.ArchiveHandler.get_file_type_from_format',
+                                      return_value=file_type)
+    mock_is_extract = mocker.patch('arxiv_bucket.file.handler.archive_handler.ArchiveHandler.is_extract_possible',
+                                   return_value=True)
+    mock_methods = {
+        method: mocker.patch(f'arxiv_bucket.file.handler.archive_handler.ArchiveHandler.{method}')
+        for method in ['_extract_gzip_contents_private', '_extract_tar_or_tgz_contents_private']
+    }
 
-    ArchiveHandler.extract_contents('dummy_path.tar', 'dummy_dest')
+    ArchiveHandler.extract_contents('dummy_path', 'dummy_dest')
 
-    mock_extract_tar.assert_called_once_with('dummy_path.tar', 'dummy_dest')
-    mock_extract_gzip.assert_not_called()
-    mock_extract_tgz.assert_not_called()
+    mock_get_file_type.assert_called_once_with('dummy_path')
+    mock_is_extract.assert_called_once_with('dummy_path', 'dummy_dest')
+    for method, mock_method in mock_methods.items():
+        if method == expected_method:
+            mock_method.assert_called_once_with('dummy_path', 'dummy_dest')
+        else:
+            mock_method.assert_not_called()
 
-def test_extract_contents_tgz(mocker):
+def test_extract_contents_file_not_found():
     """
-    Test the extract_contents for tgz format.
+    Test the extract_contents when the source file is not found.
     """
-    mock_is_archive = mocker.patch('arxiv_bucket.file.handler.archive_handler.ArchiveHandler.is_archive_format')
-    mock_is_gzip = mocker.patch('arxiv_bucket.file.handler.archive_handler.ArchiveHandler.is_gzip_format')
-    mock_is_tar = mocker.patch('arxiv_bucket.file.handler.archive_handler.ArchiveHandler.is_tar_format')
-    mock_is_tgz = mocker.patch('arxiv_bucket.file.handler.archive_handler.ArchiveHandler.is_tgz_format')
-    mock_extract_gzip = mocker.patch('arxiv_bucket.file.handler.archive_handler.ArchiveHandler.extract_gzip_contents')
-    mock_extract_tar = mocker.patch('arxiv_bucket.file.handler.archive_handler.ArchiveHandler.extract_tar_contents')
-    mock_extract_tgz = mocker.patch('arxiv_bucket.file.handler.archive_handler.ArchiveHandler.extract_tgz_contents')
-
-    mock_is_archive.return_value = True
-    mock_is_gzip.return_value = False
-    mock_is_tar.return_value = False
-    mock_is_tgz.return_value = True
+    with pytest.raises(FileNotFoundError):
+        ArchiveHandler.extract_contents('this_is_not_a_file', 'dummy_dest')
 
-    ArchiveHandler.extract_contents('dummy_path.tgz', 'dummy_dest')
+def test_get_file_type_from_format_probes_once(mocker, file_test_fixtures_directory):
+    """
+    Test that get_file_type_from_format probes the tar and gzip formats once each.
+    """
+    spy_tar = mocker.spy(ArchiveHandler, '_is_tar_or_tgz_format')
+    spy_gzip = mocker.spy(ArchiveHandler, '_is_gzip_or_tgz_format')
+    full_path = os.path.join(file_test_fixtures_directory, 'archive/tgz_archive_file.tgz')
 
-    mock_extract_tgz.assert_called_once_with('dummy_path.tgz', 'dummy_dest')
-    mock_extract_gzip.assert_not_called()
-    mock_extract_tar.assert_not_called()
+    assert ArchiveHandler.get_file_type_from_format(full_path) == FileType.FILE_TYPE_ARCHIVE_TGZ
+    assert spy_tar.call_count == 1
+    assert spy_gzip.call_count == 1
 
 def test_extract_gzip_contents_success(mocker, file_test_fixtures_directory):
     """
@@ -904,6 +994,28 @@ def test_list_gzip_contents_filename_field_present_and_absent(tmp_path):
     result = ArchiveHandler._list_gzip_contents(file_without_name)
     assert result == []
 
+def test_list_gzip_contents_long_filename_field(tmp_path):
+    """
+    Test _list_gzip_contents with a filename field that spans several read blocks.
+    """
+    long_name = "a" * 3000 + ".txt"
+    file_with_name = make_gzip_file_with_flags(tmp_path, flags=0x08, filename=long_name)
+    result = ArchiveHandler._list_gzip_contents(file_with_name)
+    assert result == [long_name]
+
+@pytest.mark.parametrize("content, block_size, expected_field", [
+    (b'name.txt\0rest', 1024, b'name.txt'),   # terminator in the first block
+    (b'name.txt\0rest', 3, b'name.txt'),      # terminator after several blocks
+    (b'\0rest', 4, b''),                      # empty field
+    (b'name.txt', 3, b'name.txt'),            # end of file before the terminator
+])
+def test_read_null_terminated_field(content, block_size, expected_field):
+    """
+    Test _read_null_terminated_field for terminators in different blocks and a missing terminator.
+    """
+    field = ArchiveHandler._read_null_terminated_field(io.BytesIO(content), block_size=block_size)
+    assert field == expected_field
+
 def test_list_gzip_contents_invalid_compression_format(tmp_path, monkeypatch):
     # Patch is_gzip_format to return True so we get past that check
     monkeypatch.setattr(ArchiveHandler, "is_gzip_format", lambda x: True)
@@ -985,6 +1097,28 @@ def test_check_extract_possible_destination_file_exists(mocker, file_test_fixtur
     errors = ArchiveHandler.check_extract_possible(source_file_path, destination_directory)
     assert 'destination file already exists' in errors
 
+@pytest.mark.parametrize("contents, expected_errors", [
+    (['existing.txt'], ['destination file already exists']),             # top level file exists
+    (['Existing.TXT'], ['destination file already exists']),             # top level file differing only by case
+    (['subdir/existing.txt'], ['destination file already exists']),      # nested file exists
+    (['subdir'], []),                                                    # directory with the same name
+    (['new.txt', 'subdir/new.txt'], []),                                 # no file exists
+])
+def test_check_extract_possible_destination_listing(contents, expected_errors, mocker, tmp_path,
+                                                    file_test_fixtures_directory):
+    """
+    Test check_extract_possible for top level and nested destination files.
+    """
+    (tmp_path / 'existing.txt').write_text('existing')
+    (tmp_path / 'subdir').mkdir()
+    (tmp_path / 'subdir' / 'existing.txt').write_text('existing')
+
+    source_file_path = os.path.join(file_test_fixtures_directory, 'archive/tar_archive_file.tar')
+    mocker.patch('arxiv_bucket.file.handler.archive_handler.ArchiveHandler.list_contents', return_value=contents)
+
+    errors = ArchiveHandler.check_extract_possible(source_file_path, str(tmp_path))
+    assert errors == expected_errors
+
 def test_check_extract_possible_success(mocker, file_test_fixtures_directory):
     """
     Test check_extract_possible when extraction is possible (no errors).
@@ -994,4 +1128,16 @@ def test_check_extract_possible_success(mocker, file_test_fixtures_directory):
     mocker.patch('arxiv_bucket.file.handler.archive_handler.ArchiveHandler.list_contents', return_value=['sample_contents.txt'])
 
     errors = ArchiveHandler.check_extract_possible(source_file_path, destination_directory)
-    assert errors == []
\ No newline at end of file
+    assert errors == []
+
+def test_list_gzip_contents_truncated_header(tmp_path, monkeypatch):
+    """
+    Test _list_gzip_contents returns an empty list when the gzip header is truncated.
+    """
+    monkeypatch.setattr(ArchiveHandler, "is_gzip_format", lambda x: True)
+
+    truncated_gzip = tmp_path / "truncated.gz"
+    truncated_gzip.write_bytes(b'\x1f\x8b\x08\x08')
+
+    result = ArchiveHandler._list_gzip_contents(str(truncated_gzip))
+    assert result == []
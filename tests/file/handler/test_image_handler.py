@@ -6,6 +6,7 @@
 
 import os
 import pytest
+from PIL import Image
 
 from arxiv_bucket.file.handler.image_handler import ImageHandler
 from arxiv_bucket.file.file_type import FileType
@@ -53,6 +54,56 @@ def test_get_file_type_from_format(filename, expected_file_type, file_test_fixtu
     file_type = ImageHandler.get_file_type_from_format(full_path)
     assert file_type == expected_file_type
 
+def test_get_file_type_from_format_restricts_pil_formats(file_test_fixtures_directory, mocker):
+    """
+    Test that get_file_type_from_format only probes the supported PIL formats.
+    """
+    spy_open = mocker.spy(Image, 'open')
+    full_path = os.path.join(file_test_fixtures_directory, 'image/bmp_example.bmp')
+
+    file_type = ImageHandler.get_file_type_from_format(full_path)
+
+    assert file_type == FileType.FILE_TYPE_IMAGE_BMP
+    assert spy_open.call_args.kwargs['formats'] == ('BMP', 'GIF', 'ICO', 'PNG', 'JPEG', 'TIFF')
+
+@pytest.mark.parametrize("filename, expected_file_type, expected_formats", [
+    ('image/gif_example.gif', FileType.FILE_TYPE_IMAGE_GIF, ('GIF',)),
+    ('image/jpg_example.jpg', FileType.FILE_TYPE_IMAGE_JPG, ('JPEG',)),
+    ('image/png_example.png', FileType.FILE_TYPE_IMAGE_PNG, ('PNG',)),
+    ('image/tiff_example.tiff', FileType.FILE_TYPE_IMAGE_TIFF, ('TIFF',))
+])
+def test_get_file_type_from_format_signature_restricts_pil(filename, expected_file_type, expected_formats,
+                                                           file_test_fixtures_directory, mocker):
+    """
+    Test that get_file_type_from_format probes only the format matching a known signature.
+    """
+    spy_open = mocker.spy(Image, 'open')
+    full_path = os.path.join(file_test_fixtures_directory, filename)
+
+    file_type = ImageHandler.get_file_type_from_format(full_path)
+
+    assert file_type == expected_file_type
+    spy_open.assert_called_once()
+    assert spy_open.call_args.kwargs['formats'] == expected_formats
+
+def test_get_file_type_from_format_signature_invalid_image(tmp_path):
+    """
+    Test that a file with an image signature but no valid image is reported as unknown.
+    """
+    file_path = tmp_path / 'fake.png'
+    file_path.write_bytes(b'\x89PNG\r\n\x1a\n' + b'not an image')
+
+    assert ImageHandler.get_file_type_from_format(str(file_path)) == FileType.FILE_TYPE_UNKNOWN
+
+def test_get_file_type_from_format_unreadable(file_test_fixtures_directory, mocker):
+    """
+    Test that a file that cannot be read is reported as unknown.
+    """
+    mocker.patch('arxiv_bucket.file.handler.image_handler.open', side_effect=PermissionError, create=True)
+    full_path = os.path.join(file_test_fixtures_directory, 'image/png_example.png')
+
+    assert ImageHandler.get_file_type_from_format(full_path) == FileType.FILE_TYPE_UNKNOWN
+
 def test_get_file_type_from_format_raise_file_not_found(file_test_fixtures_directory):
     """
     Test the get_file_type_from_format method when the file is not found or the path directs to a non-file.
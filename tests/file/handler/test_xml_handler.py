@@ -4,8 +4,6 @@
 # Copyright (c) 2025 Jason Stuber
 # Licensed under the MIT License. See the LICENSE file for more details.
 
-import os
-import tempfile
 import pytest
 
 from arxiv_bucket.file.file_system import FileSystem
@@ -63,55 +61,43 @@ def test_get_file_type_from_format_unknown(mocker):
     assert XmlHandler.get_file_type_from_format("dummy_path.unknown") == FileType.FILE_TYPE_UNKNOWN
 
 
-def test_is_xml_format_with_valid_xml():
+def test_is_xml_format_with_valid_xml(tmp_path):
     """
     Test the is_xml_format method with valid XML content.
 
     This test creates a temporary file containing valid XML content and verifies
     that the method correctly identifies it as XML.
     """
-    with tempfile.NamedTemporaryFile(delete=False, mode='w') as temp_file:
-        temp_file.write("<root><child>Test</child></root>")
-        temp_file_path = temp_file.name
+    temp_file_path = tmp_path / "test.xml"
+    temp_file_path.write_text("<root><child>Test</child></root>")
 
-    try:
-        assert XmlHandler.is_xml_format(temp_file_path) is True
-    finally:
-        os.remove(temp_file_path)
+    assert XmlHandler.is_xml_format(str(temp_file_path)) is True
 
 
-def test_is_xml_format_with_invalid_xml():
+def test_is_xml_format_with_invalid_xml(tmp_path):
     """
     Test the is_xml_format method with invalid XML content.
 
     This test creates a temporary file containing invalid XML content (missing a closing tag)
     and verifies that the method correctly identifies it as not being XML.
     """
-    with tempfile.NamedTemporaryFile(delete=False, mode='w') as temp_file:
-        temp_file.write("<root><child>Test</child>")  # Missing closing tag
-        temp_file_path = temp_file.name
+    temp_file_path = tmp_path / "test.xml"
+    temp_file_path.write_text("<root><child>Test</child>")  # Missing closing tag
 
-    try:
-        assert XmlHandler.is_xml_format(temp_file_path) is False
-    finally:
-        os.remove(temp_file_path)
+    assert XmlHandler.is_xml_format(str(temp_file_path)) is False
 
 
-def test_is_xml_format_with_non_xml_content():
+def test_is_xml_format_with_non_xml_content(tmp_path):
     """
     Test the is_xml_format method with non-XML content.
 
     This test creates a temporary file containing non-XML content and verifies
     that the method correctly identifies it as not being XML.
     """
-    with tempfile.NamedTemporaryFile(delete=False, mode='w') as temp_file:
-        temp_file.write("This is not XML content.")
-        temp_file_path = temp_file.name
+    temp_file_path = tmp_path / "test.xml"
+    temp_file_path.write_text("This is not XML content.")
 
-    try:
-        assert XmlHandler.is_xml_format(temp_file_path) is False
-    finally:
-        os.remove(temp_file_path)
+    assert XmlHandler.is_xml_format(str(temp_file_path)) is False
 
 
 def test_is_xml_format_file_not_found(mocker):
@@ -195,3 +181,57 @@ def test_read_xml_to_dict_invalid_xml_parsing(mocker):
 
     with pytest.raises(ValueError, match="Failed to parse XML content: Parsing error"):
         XmlHandler.read_xml_to_dict("invalid_file.xml")
+
+
+def test_iter_xml_children(tmp_path):
+    """
+    Test that iter_xml_children streams the children of the root element as (tag, value) tuples.
+    """
+    file_path = tmp_path / "test.xml"
+    file_path.write_text("""<root>
+        <timestamp> Mon Apr  7 04:58:03 2025 </timestamp>
+        <empty/>
+        <file><name>a.tar</name><size>1</size><note/></file>
+        <file><name>b.tar</name><size>2</size><note>  </note></file>
+    </root>""")
+
+    children = XmlHandler.iter_xml_children(str(file_path), 'root')
+
+    assert list(children) == [
+        ('timestamp', 'Mon Apr  7 04:58:03 2025'),
+        ('empty', None),
+        ('file', {'name': 'a.tar', 'size': '1', 'note': None}),
+        ('file', {'name': 'b.tar', 'size': '2', 'note': None}),
+    ]
+
+
+def test_iter_xml_children_file_not_found(mocker):
+    """
+    Test that iter_xml_children raises FileNotFoundError before iterating when the file does not exist.
+    """
+    mocker.patch("arxiv_bucket.file.file_system.FileSystem.is_file", return_value=False)
+    with pytest.raises(FileNotFoundError, match="file not found"):
+        XmlHandler.iter_xml_children("non_existent_file.xml", 'root')
+
+
+def test_iter_xml_children_unexpected_root(tmp_path):
+    """
+    Test that iter_xml_children raises TypeError when the root element has another tag.
+    """
+    file_path = tmp_path / "test.xml"
+    file_path.write_text("<other><child>Test</child></other>")
+
+    with pytest.raises(TypeError, match="unexpected root element 'other'"):
+        list(XmlHandler.iter_xml_children(str(file_path), 'root'))
+
+
+def test_iter_xml_children_invalid_xml(tmp_path):
+    """
+    Test that iter_xml_children raises ValueError when the XML content cannot be parsed.
+    """
+    file_path = tmp_path / "test.xml"
+    file_path.write_text("<root><child>Test</child>")  # Missing closing tag
+
+    with pytest.raises(ValueError, match="Failed to parse XML content"):
+        list(XmlHandler.iter_xml_children(str(file_path), 'root'))
+
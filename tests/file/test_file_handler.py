@@ -4,6 +4,7 @@
 # Copyright (c) 2025 Jason Stuber
 # Licensed under the MIT License. See the LICENSE file for more details.
 
+import sys
 import pytest
 from arxiv_bucket.file.file_handler import FileHandler
 from arxiv_bucket.file.file_type import FileType
@@ -26,6 +27,7 @@ def test_get_metadata_valid_file(mock_file, mocker):
     mock_hash = mocker.patch.object(HashService, 'calculate_file_hash', return_value="dummy_hash")
     metadata = FileHandler.get_metadata(str(mock_file), [HashType.HASH_TYPE_MD5])
     assert metadata['filename'] == "test_file.txt"
+    assert metadata['filename'] is sys.intern("test_file.txt")
     assert metadata['size_bytes'] == len("This is a test file.")
     assert metadata['hash'][HashType.HASH_TYPE_MD5.value] == "dummy_hash"
     assert 'timestamp_iso' in metadata
@@ -226,3 +228,23 @@ def test__get_file_handlers_from_extension_duplicate_handler(mocker):
     handlers = FileHandler._get_file_handlers_from_extension('pdf')
     # Should only include the handler once
     assert handlers == [handler]
+
+def test__get_file_handlers_from_extension_reuses_map(mocker):
+    """
+    Test that the extension to handler map is built once per handler list and rebuilt when the list is replaced.
+    """
+    handler = mocker.Mock()
+    handler.get_file_extension_map.return_value = ['.pdf']
+    handler_list = [handler]
+    mocker.patch.object(FileHandler, '_get_file_handlers', return_value=handler_list)
+
+    assert FileHandler._get_file_handlers_from_extension('.PDF') == [handler]
+    assert FileHandler._get_file_handlers_from_extension('.pdf') == [handler]
+    assert handler.get_file_extension_map.call_count == 1
+
+    other_handler = mocker.Mock()
+    other_handler.get_file_extension_map.return_value = ['.txt']
+    mocker.patch.object(FileHandler, '_get_file_handlers', return_value=[other_handler])
+
+    assert FileHandler._get_file_handlers_from_extension('.pdf') == []
+    assert FileHandler._get_file_handlers_from_extension('.txt') == [other_handler]
@@ -36,6 +36,16 @@ def test_get_file_basename(filename, expected_basename):
     """
     assert FileName.get_file_basename(filename) == expected_basename
 
+def test_get_file_basename_is_cached():
+    """
+    Test that repeated paths are served from the cache.
+    """
+    FileName.get_file_basename.cache_clear()
+    assert FileName.get_file_basename('/path/to/file/example.txt') == 'example.txt'
+    assert FileName.get_file_basename('/path/to/file/example.txt') == 'example.txt'
+    cache_info = FileName.get_file_basename.cache_info()
+    assert (cache_info.hits, cache_info.misses) == (1, 1)
+
 @pytest.mark.parametrize("path", [
     "valid_filename.txt",
     "another_valid-file+name=1.txt",
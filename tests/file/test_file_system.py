@@ -28,6 +28,55 @@ def test_is_file(file_test_fixtures_directory):
     file_path = 'this_is_not_a_file'
     assert not FileSystem.is_file(file_path)
 
+def test_is_file_with_stat_cache(file_test_fixtures_directory, mocker):
+    """
+    Test that is_file issues a single stat call per path within a stat_cache context
+    """
+
+    file_path = os.path.join(file_test_fixtures_directory, 'txt/text_file.txt')
+    spy_stat = mocker.spy(os, 'stat')
+
+    with FileSystem.stat_cache():
+        assert FileSystem.is_file(file_path)
+        assert FileSystem.is_file(file_path)
+        assert not FileSystem.is_file(file_test_fixtures_directory)
+        assert not FileSystem.is_file('this_is_not_a_file')
+        assert not FileSystem.is_file('this_is_not_a_file')
+
+        # nested contexts share the outer cache
+        with FileSystem.stat_cache():
+            assert FileSystem.is_file(file_path)
+
+    assert spy_stat.call_count == 3
+
+    # the cache is cleared when the outermost context exits
+    spy_stat.reset_mock()
+    with FileSystem.stat_cache():
+        assert FileSystem.is_file(file_path)
+    assert spy_stat.call_count == 1
+
+def test_clear_stat_cache(tmp_path):
+    """
+    Test that clear_stat_cache drops the cached stat results and listings of the active stat_cache context
+    """
+
+    file_path = str(tmp_path / 'new_file.txt')
+
+    # no active context, nothing to clear
+    FileSystem.clear_stat_cache()
+
+    with FileSystem.stat_cache():
+        assert not FileSystem.is_file(file_path)
+        assert FileSystem.list_files(str(tmp_path)) == []
+
+        with open(file_path, 'w') as file_handle:
+            file_handle.write('text')
+        assert not FileSystem.is_file(file_path)
+
+        FileSystem.clear_stat_cache()
+        assert FileSystem.is_file(file_path)
+        assert FileSystem.list_files(str(tmp_path)) == ['new_file.txt']
+
 def test_is_directory(file_test_fixtures_directory):
     """
     Test the is_directory method
@@ -302,6 +351,30 @@ def test_list_files(file_test_fixtures_directory):
     filtered_filename_list = [fn for fn in filename_list if '__pycache__' not in fn and '.DS_Store' not in fn]
     assert set(expected_filenames) == set(filtered_filename_list)
 
+def test_list_files_with_stat_cache(file_test_fixtures_directory, mocker):
+    """
+    Test that list_files scans a directory once per listing within a stat_cache context
+    """
+
+    spy_scandir = mocker.spy(os, 'scandir')
+    spy_walk = mocker.spy(os, 'walk')
+
+    with FileSystem.stat_cache():
+        files = FileSystem.list_files(file_test_fixtures_directory)
+        files.append('modified by the caller')
+        assert FileSystem.list_files(file_test_fixtures_directory) == ['top_level_text_file.txt']
+        assert spy_scandir.call_count == 1
+
+        # os.walk scans each directory of the tree, the listing including subdirectories is cached separately
+        all_files = FileSystem.list_files(file_test_fixtures_directory, include_subdirectories=True)
+        assert FileSystem.list_files(file_test_fixtures_directory, include_subdirectories=True) == all_files
+        assert spy_walk.call_count == 1
+
+    # the cache is cleared when the outermost context exits
+    spy_scandir.reset_mock()
+    assert FileSystem.list_files(file_test_fixtures_directory) == ['top_level_text_file.txt']
+    assert spy_scandir.call_count == 1
+
 def test_list_files_raise_directory_not_found(file_test_fixtures_directory):
     """
     Test the list_files method when the directory is not found
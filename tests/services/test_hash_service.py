@@ -7,7 +7,6 @@
 from hashlib import md5, sha256, sha512, sha3_512
 import os
 import pytest
-import tempfile
 
 
 from typing import cast
@@ -76,41 +75,33 @@ def test_get_hash_encoder_instance_raise_hash_type_category_unknown():
     (HashType.HASH_TYPE_SHA3_512, 'd0aea0ad35f929cfefadda45a1a5f582f435ef21fdc55a505be59e51fd54c1'
                                   '70b1eb7ef9512db04ec1251288c034062e2e7da59cab7c22f949dd0d6da4bde9ad'),
 ])
-def test_calculate_file_hash_all_hash_types(hash_type_category, expected_hash_key):
+def test_calculate_file_hash_all_hash_types(hash_type_category, expected_hash_key, tmp_path):
     """
     Test the calculate_file_hash method for all specified hash types.
     """
     test_content = b"This is a test file content for hashing."
-    with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-        temp_file.write(test_content)
-        temp_file_path = temp_file.name
+    temp_file_path = tmp_path / "test.bin"
+    temp_file_path.write_bytes(test_content)
 
-    try:
-        hash_key = HashService.calculate_file_hash(temp_file_path, hash_type_category)
-        assert hash_key == expected_hash_key
-    finally:
-        os.remove(temp_file_path)
+    hash_key = HashService.calculate_file_hash(str(temp_file_path), hash_type_category)
+    assert hash_key == expected_hash_key
 
-@pytest.mark.parametrize("buffer_size", [None, 256, 1024, 16384, 32768, 65536])
-def test_calculate_file_hash_all_buffer_sizes(buffer_size):
+@pytest.mark.parametrize("buffer_size", [None, 7, 16, 256, 1024, 16384, 32768, 65536])
+def test_calculate_file_hash_all_buffer_sizes(buffer_size, tmp_path):
     """
     Test the calculate_file_hash method for a range of buffer sizes.
     """
     test_content = b"This is a test file content for hashing."
     expected_key_sha_256 = '730d388b796882f7ae83e0733272094f491b276da07c06372e1d87e19f8190a7'
 
-    with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-        temp_file.write(test_content)
-        temp_file_path = temp_file.name
+    temp_file_path = tmp_path / "test.bin"
+    temp_file_path.write_bytes(test_content)
 
-    try:
-        if buffer_size is None:
-            hash_key = HashService.calculate_file_hash(temp_file_path, HashType.HASH_TYPE_SHA256)
-        else:
-            hash_key = HashService.calculate_file_hash(temp_file_path, HashType.HASH_TYPE_SHA256, file_buffer_size=buffer_size)
-        assert hash_key == expected_key_sha_256
-    finally:
-        os.remove(temp_file_path)
+    if buffer_size is None:
+        hash_key = HashService.calculate_file_hash(str(temp_file_path), HashType.HASH_TYPE_SHA256)
+    else:
+        hash_key = HashService.calculate_file_hash(str(temp_file_path), HashType.HASH_TYPE_SHA256, file_buffer_size=buffer_size)
+    assert hash_key == expected_key_sha_256
 
 @pytest.mark.parametrize("file_buffer_size", [0, -1])
 def test_calculate_file_hash_raise_file_buffer_size_not_positive(file_buffer_size):
@@ -169,20 +160,15 @@ def test_calculate_buffer_hash(hash_type_category, expected_hash_key):
     hash_key = HashService.calculate_buffer_hash(buffer, hash_type_category)
     assert hash_key == expected_hash_key
 
-def test_calculate_buffer_hash_raise_hash_type_unknown():
+def test_calculate_buffer_hash_raise_hash_type_unknown(tmp_path):
     """
     Test the calculate_buffer_hash method when the hash type is unknown.
     """
     test_content = b"This is a test file content for hashing."
-    with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-        temp_file.write(test_content)
-        temp_file_path = temp_file.name
-
-    try:
-        with open(temp_file_path, 'rb') as file_handle:
-            buffer = file_handle.read()
-
-        with pytest.raises(ValueError):
-            HashService.calculate_buffer_hash(buffer, cast(HashType, 1337))
-    finally:
-        os.remove(temp_file_path)
+    temp_file_path = tmp_path / "test.bin"
+    temp_file_path.write_bytes(test_content)
+
+    buffer = temp_file_path.read_bytes()
+
+    with pytest.raises(ValueError):
+        HashService.calculate_buffer_hash(buffer, cast(HashType, 1337))
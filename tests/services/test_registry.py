@@ -5,9 +5,23 @@
 # Licensed under the MIT License. See the LICENSE file for more details.
 
 import json
+import os
+import pickle
 import pytest
+from arxiv_bucket.services import registry as registry_module
 from arxiv_bucket.services.registry import Registry
 
+@pytest.fixture(params=['orjson', 'json'])
+def json_backend(request, monkeypatch):
+    """
+    Fixture to run a test with orjson, if installed, and with the standard library json fallback.
+    """
+    if request.param == 'orjson':
+        pytest.importorskip('orjson')
+    else:
+        monkeypatch.setattr(registry_module, 'orjson', None)
+    return request.param
+
 def test_registry_initialization():
     """
     Test that Registry initializes with an empty _registry dictionary.
@@ -16,6 +30,15 @@ def test_registry_initialization():
     assert isinstance(reg._registry, dict)
     assert reg._registry == {}
 
+def test_registry_slots():
+    """
+    Test that the registry stores its state in slots rather than an instance dictionary.
+    """
+    reg = Registry()
+    assert not hasattr(reg, '__dict__')
+    with pytest.raises(AttributeError):
+        reg.other = 1
+
 def test_registry_clear():
     """
     Test that Registry.clear() empties the _registry dictionary.
@@ -63,6 +86,21 @@ def test_get_entry_returns_reference():
     entry["b"]["c"] = 99
     assert reg._registry["key1"]["b"]["c"] == 99
 
+def test_get_entry_view():
+    """
+    Test that get_entry_view returns a read-only view of the entry in Registry.
+    """
+    reg = Registry()
+    reg._registry["key1"] = {"a": 1, "b": {"c": 2}}
+    entry_view = reg.get_entry_view("key1")
+    assert entry_view == {"a": 1, "b": {"c": 2}}
+    with pytest.raises(TypeError):
+        entry_view["a"] = 2
+    reg._registry["key1"]["a"] = 3
+    assert entry_view["a"] == 3
+    with pytest.raises(KeyError):
+        reg.get_entry_view("missing")
+
 def test_get_entry_keyerror():
     """
     Test that get_entry raises KeyError if the hash key is not present in Registry.
@@ -80,6 +118,39 @@ def test_add_entry_and_get_entry():
     entry = reg.get_entry("key1")
     assert entry == {"foo": "bar"}
 
+def test_add_entry_and_update_entry_store_copies():
+    """
+    Test that add_entry and update_entry store copies that are independent of the given entry.
+    """
+    reg = Registry()
+    entry = {"metadata": {"hash": {"MD5": "x"}, "size_bytes": 1, "ratio": 0.5, "valid": True, "note": None},
+             "diagnostics": {"error_log": ["a"]}, "tags": {"x"}}
+    reg.add_entry("key1", entry)
+    entry["metadata"]["hash"]["MD5"] = "y"
+    entry["diagnostics"]["error_log"].append("b")
+    entry["tags"].add("y")
+
+    stored = reg.get_entry("key1")
+    assert stored["metadata"] == {"hash": {"MD5": "x"}, "size_bytes": 1, "ratio": 0.5, "valid": True, "note": None}
+    assert stored["diagnostics"] == {"error_log": ["a"]}
+    assert stored["tags"] == {"x"}
+
+    reg.update_entry("key1", entry)
+    entry["diagnostics"]["error_log"].append("c")
+    assert reg.get_entry("key1")["diagnostics"] == {"error_log": ["a", "b"]}
+
+def test_insert_entry_stores_without_copy():
+    """
+    Test that _insert_entry stores the given entry object and keeps the sorted keys current.
+    """
+    reg = Registry()
+    reg.add_entry("key2", {})
+    assert reg.find_keys_with_prefix("key") == ["key2"]
+    entry = {"foo": "bar"}
+    reg._insert_entry("key1", entry)
+    assert reg.get_entry("key1") is entry
+    assert reg._sorted_keys == ["key1", "key2"]
+
 def test_add_entry_duplicate_key():
     """
     Test that adding an entry with a duplicate key raises KeyError.
@@ -89,6 +160,42 @@ def test_add_entry_duplicate_key():
     with pytest.raises(KeyError):
         reg.add_entry("key1", {"baz": "qux"})
 
+def test_bulk_add_entries():
+    """
+    Test adding many entries at once, the entries are stored without copying.
+    """
+    reg = Registry()
+    reg.add_entry("key1", {"foo": "bar"})
+    entry2 = {"baz": "qux"}
+    reg.bulk_add_entries(iter([("key2", entry2), ("key3", {"n": 3})]))
+    assert reg._registry == {"key1": {"foo": "bar"}, "key2": {"baz": "qux"}, "key3": {"n": 3}}
+    assert reg.get_entry("key2") is entry2
+
+@pytest.mark.parametrize("items, expected_keys", [
+    ([("key1", {}), ("key2", {})], "['key1']"),
+    ([("key2", {}), ("key3", {}), ("key2", {})], "['key2']"),
+    ([("key2", {}), ("key1", {}), ("key2", {})], "['key1', 'key2']"),
+])
+def test_bulk_add_entries_duplicate_keys(items, expected_keys):
+    """
+    Test that duplicate keys are reported and nothing is added.
+    """
+    reg = Registry()
+    reg.add_entry("key1", {"foo": "bar"})
+    with pytest.raises(KeyError) as exc_info:
+        reg.bulk_add_entries(items)
+    assert expected_keys in str(exc_info.value)
+    assert reg._registry == {"key1": {"foo": "bar"}}
+
+def test_bulk_add_entries_without_duplicate_check():
+    """
+    Test that duplicates replace entries when the check is disabled.
+    """
+    reg = Registry()
+    reg.add_entry("key1", {"foo": "bar"})
+    reg.bulk_add_entries([("key1", {"foo": "new"}), ("key2", {"n": 1}), ("key2", {"n": 2})], check_dup=False)
+    assert reg._registry == {"key1": {"foo": "new"}, "key2": {"n": 2}}
+
 def test_update_entry():
     """
     Test updating an existing entry.
@@ -132,6 +239,68 @@ def test_list_keys():
     reg.add_entry("key2", {"baz": "qux"})
     keys = reg.list_keys()
     assert set(keys) == {"key1", "key2"}
+    assert "key1" in keys
+
+def test_list_keys_is_view():
+    """
+    Test that list_keys returns a view that reflects later changes.
+    """
+    reg = Registry()
+    keys = reg.list_keys()
+    reg.add_entry("key1", {"foo": "bar"})
+    assert list(keys) == ["key1"]
+
+@pytest.mark.parametrize("prefix, expected_keys", [
+    ("ab", ["ab01", "ab02", "abff"]),
+    ("ab0", ["ab01", "ab02"]),
+    ("ab02", ["ab02"]),
+    ("", ["0f00", "ab01", "ab02", "abff", "b000"]),
+    ("c", []),
+    ("aa", []),
+])
+def test_find_keys_with_prefix(prefix, expected_keys):
+    """
+    Test finding keys by prefix.
+    """
+    reg = Registry()
+    for key in ["abff", "b000", "ab02", "0f00", "ab01"]:
+        reg.add_entry(key, {})
+    assert reg.find_keys_with_prefix(prefix) == expected_keys
+
+def test_find_keys_with_prefix_follows_changes():
+    """
+    Test that prefix lookups reflect entries added, deleted or loaded after the first lookup.
+    """
+    reg = Registry()
+    reg.add_entry("ab02", {})
+    assert reg.find_keys_with_prefix("ab") == ["ab02"]
+
+    reg.add_entry("ab01", {})
+    assert reg._sorted_keys == ["ab01", "ab02"]
+    assert reg.find_keys_with_prefix("ab") == ["ab01", "ab02"]
+
+    reg.delete_entry("ab02")
+    reg.add_entry("ab03", {})
+    assert reg.find_keys_with_prefix("ab") == ["ab01", "ab03"]
+
+    reg.bulk_add_entries([("ab00", {})])
+    assert reg.find_keys_with_prefix("ab") == ["ab00", "ab01", "ab03"]
+
+    reg._registry = {"ab04": {}, "ab05": {}}
+    assert reg.find_keys_with_prefix("ab") == ["ab04", "ab05"]
+
+def test_find_keys_with_prefix_after_clear():
+    """
+    Test that prefix lookups do not return cleared keys when the same number of keys is added again.
+    """
+    reg = Registry()
+    reg.add_entry("abc", {})
+    assert reg.find_keys_with_prefix("a") == ["abc"]
+
+    reg.clear()
+    reg.add_entry("zzz", {})
+    assert reg.find_keys_with_prefix("a") == []
+    assert reg.find_keys_with_prefix("z") == ["zzz"]
 
 def test_len():
     """
@@ -146,7 +315,7 @@ def test_len():
     reg.delete_entry("key1")
     assert len(reg) == 1
 
-def test_save(tmp_path):
+def test_save(tmp_path, json_backend):
     reg = Registry()
     reg._registry = {'abc': {'foo': 'bar'}, 'def': {'baz': 42}}
     file_path = tmp_path / "test.json"
@@ -155,7 +324,54 @@ def test_save(tmp_path):
         data = json.load(f)
     assert data == reg._registry
 
-def test_load(tmp_path, monkeypatch):
+@pytest.mark.parametrize("indent, expected_text", [
+    (None, '{"abc":{"foo":"bar"}}'),
+    (2, '{\n  "abc": {\n    "foo": "bar"\n  }\n}'),
+    (4, '{\n    "abc": {\n        "foo": "bar"\n    }\n}'),
+])
+def test_save_indent(tmp_path, json_backend, indent, expected_text):
+    """
+    Test that save writes compact JSON by default and indented JSON when requested.
+    """
+    reg = Registry()
+    reg._registry = {'abc': {'foo': 'bar'}}
+    file_path = tmp_path / "test.json"
+    reg.save(str(file_path), indent=indent)
+    assert file_path.read_text(encoding='utf-8') == expected_text
+
+@pytest.mark.parametrize("indent, expected_text", [
+    (None, '{"caf\u00e9":{"name":"\u00c5ngstr\u00f6m \u03b1"}}'),
+    (2, '{\n  "caf\u00e9": {\n    "name": "\u00c5ngstr\u00f6m \u03b1"\n  }\n}'),
+    (4, '{\n    "caf\u00e9": {\n        "name": "\u00c5ngstr\u00f6m \u03b1"\n    }\n}'),
+])
+def test_save_non_ascii(tmp_path, json_backend, indent, expected_text):
+    """
+    Test that both JSON writers store non-ASCII characters as UTF-8 and read them back unchanged.
+    """
+    reg = Registry()
+    reg._registry = {'caf\u00e9': {'name': '\u00c5ngstr\u00f6m \u03b1'}}
+    file_path = tmp_path / "non_ascii.json"
+    reg.save(str(file_path), indent=indent)
+    assert file_path.read_bytes() == expected_text.encode('utf-8')
+    assert Registry(str(file_path))._registry == reg._registry
+
+@pytest.mark.parametrize("registry_data", [
+    {},
+    {'abc': {'foo': 'bar'}},
+    {'abc': {'foo': 'bar'}, 'def': {'baz': [42, None, True]}, 'ghi': {'unicode': 'caf\u00e9'}},
+])
+def test_save_streaming(tmp_path, json_backend, registry_data):
+    """
+    Test that the streaming writer produces the same file as save.
+    """
+    reg = Registry()
+    reg._registry = registry_data
+    reg.save(str(tmp_path / "save.json"))
+    reg.save_streaming(str(tmp_path / "streaming.json"))
+    assert (tmp_path / "streaming.json").read_bytes() == (tmp_path / "save.json").read_bytes()
+    assert Registry(str(tmp_path / "streaming.json"))._registry == registry_data
+
+def test_load(tmp_path, monkeypatch, json_backend):
     reg = Registry()
     file_path = tmp_path / "test.json"
     data = {"abc": {"foo": "bar"}}
@@ -171,6 +387,16 @@ def test_load_file_not_found(monkeypatch):
     with pytest.raises(FileNotFoundError):
         reg.load("missing.json")
 
+def test_load_directory_not_found(tmp_path, json_backend):
+    """
+    Test that load raises FileNotFoundError if the path is a directory.
+    """
+    reg = Registry()
+    reg._registry = {"abc": {"foo": "bar"}}
+    with pytest.raises(FileNotFoundError):
+        reg.load(str(tmp_path))
+    assert reg._registry == {}
+
 def test_registry_init_with_file_path(tmp_path):
     # Prepare a sample registry dict and write it to a temp file
     sample_data = {
@@ -194,3 +420,134 @@ def test_registry_init_with_file_path(tmp_path):
     finally:
         # Restore the original method
         arxiv_bucket.file.file_system.FileSystem.is_file = original_is_file
+
+def test_save_load_round_trip(tmp_path, json_backend):
+    """
+    Test that a saved registry is loaded back unchanged.
+    """
+    reg = Registry()
+    reg._registry = {'abc': {'metadata': {'filename': 'a.tar', 'size_bytes': 42, 'hash': {'MD5': 'x'}},
+                             'origin': {'uri': 's3://arxiv/src/a.tar'}},
+                     'def': {'diagnostics': {'error_log': ['key conflicts']}, 'unicode': 'caf\u00e9'}}
+    file_path = tmp_path / "round_trip.json"
+    reg.save(str(file_path))
+
+    loaded = Registry(str(file_path))
+    assert loaded._registry == reg._registry
+
+def test_load_use_cache(tmp_path, json_backend):
+    """
+    Test that a cached load reuses the parsed registry until the file changes.
+    """
+    Registry.clear_load_cache()
+    file_path = tmp_path / "cached.json"
+    file_path.write_text('{"abc":{"foo":"bar"}}', encoding='utf-8')
+
+    reg1 = Registry()
+    reg1.load(str(file_path), use_cache=True)
+    assert reg1._registry == {'abc': {'foo': 'bar'}}
+    reg1._registry['abc']['foo'] = 'changed after load'
+
+    # a cache hit does not read or parse the file again, shown by changing the file but keeping its size and time
+    file_stat = os.stat(file_path)
+    file_path.write_text('{"abc":{"foo":"baz"}}', encoding='utf-8')
+    os.utime(file_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns))
+
+    reg2 = Registry()
+    reg2.load(str(file_path), use_cache=True)
+    assert reg2._registry == {'abc': {'foo': 'bar'}}
+
+    # each load receives its own copy of the cached entries
+    reg2._registry['abc']['foo'] = 'changed'
+    reg3 = Registry()
+    reg3.load(str(file_path), use_cache=True)
+    assert reg3._registry == {'abc': {'foo': 'bar'}}
+
+def test_load_use_cache_invalidated(tmp_path, json_backend):
+    """
+    Test that the cache is not used after the file is modified or saved.
+    """
+    Registry.clear_load_cache()
+    file_path = tmp_path / "cached.json"
+    file_path.write_text('{"abc":{"foo":"bar"}}', encoding='utf-8')
+
+    reg = Registry()
+    reg.load(str(file_path), use_cache=True)
+
+    file_path.write_text('{"abc":{"foo":"barbaz"}}', encoding='utf-8')
+    reg.load(str(file_path), use_cache=True)
+    assert reg._registry == {'abc': {'foo': 'barbaz'}}
+
+    reg.add_entry('def', {'baz': 42})
+    reg.save(str(file_path))
+    assert str(file_path) not in Registry._load_cache
+    reg.load(str(file_path), use_cache=True)
+    assert reg._registry == {'abc': {'foo': 'barbaz'}, 'def': {'baz': 42}}
+
+def test_load_without_cache(tmp_path):
+    """
+    Test that the cache is not populated by default.
+    """
+    Registry.clear_load_cache()
+    file_path = tmp_path / "uncached.json"
+    file_path.write_text('{"abc":{"foo":"bar"}}', encoding='utf-8')
+    Registry(str(file_path))
+    assert len(Registry._load_cache) == 0
+
+def test_load_use_cache_bounded(tmp_path, monkeypatch):
+    """
+    Test that the cache keeps only the most recently loaded files.
+    """
+    Registry.clear_load_cache()
+    monkeypatch.setattr(Registry, '_load_cache_max_entries', 2)
+    file_paths = [str(tmp_path / f"cached{k}.json") for k in range(3)]
+    for file_path in file_paths:
+        with open(file_path, 'w', encoding='utf-8') as file_handle:
+            file_handle.write('{}')
+
+    reg = Registry()
+    reg.load(file_paths[0], use_cache=True)
+    reg.load(file_paths[1], use_cache=True)
+    reg.load(file_paths[0], use_cache=True)
+    reg.load(file_paths[2], use_cache=True)
+    assert list(Registry._load_cache) == [file_paths[0], file_paths[2]]
+
+    Registry.clear_load_cache()
+    assert len(Registry._load_cache) == 0
+
+def test_save_load_binary_round_trip(tmp_path):
+    """
+    Test that a registry saved in binary form is loaded back unchanged.
+    """
+    reg = Registry()
+    reg._registry = {'abc': {'metadata': {'filename': 'a.tar', 'size_bytes': 42, 'hash': {'MD5': 'x'}}},
+                     'def': {'diagnostics': {'error_log': ['key conflicts']}, 'unicode': 'caf\u00e9'}}
+    file_path = tmp_path / "registry.pkl"
+    reg.save_binary(str(file_path))
+
+    loaded = Registry()
+    loaded.add_entry('old', {})
+    loaded.load_binary(str(file_path))
+    assert loaded._registry == reg._registry
+
+@pytest.mark.parametrize("path_name", ["missing.pkl", ""])
+def test_load_binary_file_not_found(tmp_path, path_name):
+    """
+    Test that load_binary raises FileNotFoundError for a missing file or a directory.
+    """
+    reg = Registry()
+    with pytest.raises(FileNotFoundError):
+        reg.load_binary(str(tmp_path / path_name))
+
+def test_load_binary_not_a_registry(tmp_path):
+    """
+    Test that load_binary rejects a pickle that does not contain a dictionary.
+    """
+    file_path = tmp_path / "list.pkl"
+    with open(file_path, 'wb') as file_handle:
+        pickle.dump(['abc'], file_handle)
+
+    reg = Registry()
+    with pytest.raises(TypeError):
+        reg.load_binary(str(file_path))
+    assert reg._registry == {}
@@ -4,6 +4,7 @@
 # Copyright (c) 2025 Jason Stuber
 # Licensed under the MIT License. See the LICENSE file for more details.
 
+import pytest
 from arxiv_bucket.services.time_service import TimeService
 
 def test_is_iso_timestamp_newer_true():
@@ -34,3 +35,47 @@ def test_is_iso_timestamp_newer_with_timezone_difference():
     ts2 = '2022-01-01T13:00:00+01:00'
     assert TimeService.is_iso_timestamp_newer(ts1, ts2) is False
     assert TimeService.is_iso_timestamp_newer(ts2, ts1) is False
+
+def test_parse_iso_timestamp_is_cached():
+    """
+    Test that repeated timestamps are parsed once.
+    """
+    TimeService._parse_iso_timestamp.cache_clear()
+    ts1 = '2022-01-01T12:00:00.500+00:00'
+    ts2 = '2021-01-01T12:00:00.500+00:00'
+
+    assert TimeService.is_iso_timestamp_newer(ts1, ts2) is True
+    assert TimeService.is_iso_timestamp_newer(ts2, ts1) is False
+
+    cache_info = TimeService._parse_iso_timestamp.cache_info()
+    assert cache_info.misses == 2
+    assert cache_info.hits == 2
+
+def test_is_iso_timestamp_newer_utc():
+    """
+    Test that canonical UTC timestamps are compared chronologically.
+    """
+    assert TimeService.is_iso_timestamp_newer('2022-01-01T12:00:01+00:00', '2022-01-01T12:00:00+00:00') is True
+    assert TimeService.is_iso_timestamp_newer('2022-01-01T12:00:00+00:00', '2022-01-01T12:00:01+00:00') is False
+
+@pytest.mark.parametrize("invalid_timestamp", [
+    '2024-13-45T99:99:99+00:00',  # fields out of range
+    '2024-02-30T00:00:00+00:00',  # day out of range for the month
+    '2022-01-01T12:00:00+00:00\n',  # trailing newline
+    '\u0662022-01-01T12:00:00+00:00',  # non-ASCII digit
+])
+def test_is_iso_timestamp_newer_utc_invalid(invalid_timestamp):
+    """
+    Test that invalid timestamps in the canonical UTC form raise a ValueError.
+    """
+    with pytest.raises(ValueError):
+        TimeService.is_iso_timestamp_newer(invalid_timestamp, '2022-01-01T12:00:00+00:00')
+    with pytest.raises(ValueError):
+        TimeService.is_iso_timestamp_newer('2022-01-01T12:00:00+00:00', invalid_timestamp)
+
+def test_is_iso_timestamp_newer_fractional_seconds():
+    """
+    Test that timestamps with fractional seconds are compared chronologically.
+    """
+    assert TimeService.is_iso_timestamp_newer('2022-01-01T12:00:00.50+00:00', '2022-01-01T12:00:00.5+00:00') is False
+    assert TimeService.is_iso_timestamp_newer('2022-01-01T12:00:00.5+00:00', '2022-01-01T12:00:00+00:00') is True